@@ -0,0 +1,173 @@
+"""
+Static DOMs of the Stocktake screens, built with the ids, classes and structure the page objects rely on, with a
+configurable number of options, items and table rows. The screens only carry the little inline behaviour the
+benchmarked page-object methods need (showing the purchase submenu, adding an item, posting a create request).
+"""
+from html import escape
+
+BENCH_ORIGIN = "http://stocktake.bench"
+SIDEBAR_ENTRIES = ("Stocktake", "New Product", "Transfers", "Requests", "Stores", "Logout")
+
+
+def option_name(prefix: str, index: int) -> str:
+    return f"{prefix} {index}"
+
+
+def options_html(prefix: str, size: int, placeholder: str = "") -> str:
+    options = [f'<option value="">{escape(placeholder)}</option>']
+    options.extend(f'<option value="{index}">{escape(option_name(prefix, index))}</option>' for index in range(size))
+    return "".join(options)
+
+
+def added_item_html(name: str, unit: str, quantity: str, cost: str, total: str) -> str:
+    return (
+        '<div class="added-item">'
+        f'<div class="item-details"><strong class="product-name">{escape(name)}</strong>'
+        f'<span class="unit">{escape(unit)}</span><span class="quantity">{quantity}</span>'
+        f'<span class="cost">{cost}</span><span class="total">{total}</span></div>'
+        '<div class="item-actions"><button class="inline-button edit-btn">Edit</button>'
+        '<button class="inline-button delete-btn">Delete</button></div>'
+        '</div>'
+    )
+
+
+def login_screen(size: int) -> str:
+    filler = "".join(f"<p>Announcement {index}</p>" for index in range(size))
+    return f"""
+    <form onsubmit="event.preventDefault()">
+        <input id="email" type="email"><input id="password" type="password">
+        <button type="submit">Login</button>
+    </form>
+    <div id="error"></div>
+    <span id="userEmail"></span>
+    <section>{filler}</section>
+    """
+
+
+def dashboard_screen(size: int) -> str:
+    entries = [f"<span>{escape(name)}</span>" for name in SIDEBAR_ENTRIES]
+    entries.extend(f"<span>Menu entry {index}</span>" for index in range(size))
+    return f"""
+    <button class="sidebar-toggle">Menu</button>
+    <div class="sidebar-menu">
+        {"".join(entries)}
+        <button id="purchaseOrdersBtn"
+                onclick="document.getElementById('purchaseSubmenu').style.display = 'block'">Purchase Orders</button>
+        <span id="purchaseOrdersCaret"></span>
+        <div id="purchaseSubmenu" style="display: none">
+            <span onclick="document.getElementById('newPurchaseHeaderText').style.display = 'block'"
+                >New Purchase Order</span>
+            <span>Draft Purchase Orders</span>
+            <span>Purchase Orders History</span>
+        </div>
+    </div>
+    <div class="success-message"></div>
+    <h2 id="newPurchaseHeaderText" style="display: none">New Purchase Order</h2>
+    """
+
+
+def new_product_screen(size: int) -> str:
+    def sub_form(entity: str, endpoint: str, fields: list[str]) -> str:
+        inputs = "".join(f'<input id="{field}">' for field in fields)
+        return (f'<div>{inputs}<button id="create{entity}Btn" '
+                f'onclick="fetch(\'{endpoint}\', {{method: \'POST\'}})">Create {entity}</button></div>')
+
+    return f"""
+    {dashboard_screen(0)}
+    <input id="productName">
+    <div><select id="productType">{options_html("Type", size)}</select><button>+ New</button></div>
+    <div><select id="productUnit">{options_html("Unit", size)}</select><button>+ New</button></div>
+    <div><select id="productGroup">{options_html("Group", size)}</select><button>+ New</button></div>
+    <div><select id="productSupplier">{options_html("Supplier", size)}</select><button>+ New</button></div>
+    {sub_form("Type", "/items/product-types", ["newTypeName", "newTypeDescription"])}
+    {sub_form("Unit", "/items/product-units", ["newUnitName", "newUnitYield", "newUnitDescription"])}
+    {sub_form("Group", "/items/product-groups", ["newGroupName", "newGroupDescription"])}
+    {sub_form("Supplier", "/items/suppliers", ["newSupplierName", "newSupplierEmail"])}
+    <button id="createProductBtn" onclick="fetch('/items/products', {{method: 'POST'}})">Create Product</button>
+    """
+
+
+ADD_ITEM_SCRIPT = """
+<script>
+document.getElementById('addItemToListBtn').addEventListener('click', () => {
+    const byId = id => document.getElementById(id);
+    const product = byId('currentProduct'), unit = byId('currentUnit');
+    const quantity = byId('currentQuantity').value, cost = byId('currentCost').value;
+    const total = (Number(quantity) * Number(cost)).toFixed(2);
+
+    const item = document.createElement('div');
+    item.className = 'added-item';
+    item.innerHTML = '<div class="item-details"><strong class="product-name"></strong><span class="unit"></span>'
+        + '<span class="quantity"></span><span class="cost"></span><span class="total"></span></div>'
+        + '<div class="item-actions"><button class="inline-button edit-btn">Edit</button>'
+        + '<button class="inline-button delete-btn">Delete</button></div>';
+    item.querySelector('.product-name').textContent = product.selectedOptions[0].textContent;
+    item.querySelector('.unit').textContent = unit.selectedOptions[0].textContent;
+    item.querySelector('.quantity').textContent = quantity;
+    item.querySelector('.cost').textContent = cost;
+    item.querySelector('.total').textContent = total;
+    byId('purchaseItemsList').appendChild(item);
+
+    byId('purchaseTotal').textContent = (Number(byId('purchaseTotal').textContent) + Number(total)).toFixed(2);
+    byId('purchaseSupplier').disabled = true;
+    product.selectedIndex = 0;
+    unit.disabled = true;
+    for (const id of ['currentQuantity', 'currentCost', 'currentTotal']) byId(id).value = '';
+});
+document.getElementById('currentProduct').addEventListener('change', () => {
+    document.getElementById('currentUnit').disabled = false;
+    document.getElementById('currentTotal').value = '0.00';
+});
+document.getElementById('currentCost').addEventListener('input', () => {
+    const byId = id => document.getElementById(id);
+    byId('currentTotal').value = (Number(byId('currentQuantity').value) * Number(byId('currentCost').value)).toFixed(2);
+});
+</script>
+"""
+
+
+def new_purchase_screen(size: int, items: int = None) -> str:
+    """
+    :param size: number of suppliers, products and units to choose from.
+    :param items: number of items already in the Items List, 'size' when None.
+    """
+    items = size if items is None else items
+    added_items = "".join(added_item_html(option_name("Product", index), option_name("Unit", 0), "2", "3.5", "7.00")
+                          for index in range(items))
+    return f"""
+    <select id="purchaseSupplier">{options_html("Supplier", size, "Select supplier")}</select>
+    <input id="purchaseDate" type="date">
+    <select id="purchaseType"><option value="invoice">Invoice</option><option value="receipt">Receipt</option></select>
+    <input id="purchaseReference">
+    <select id="currentProduct">{options_html("Product", size, "Select product")}</select>
+    <select id="currentUnit" disabled>{options_html("Unit", size)}</select>
+    <input id="currentQuantity"><input id="currentCost"><input id="currentTotal">
+    <button id="addItemToListBtn">Add item</button>
+    <input id="unifyItemsCheckbox" type="checkbox">
+    <div id="purchaseItemsList">{added_items}</div>
+    <span id="purchaseTotal">{7 * items:.2f}</span>
+    <button id="createPurchaseBtn" onclick="fetch('/items/purchases', {{method: 'POST'}})">Create</button>
+    <button id="saveDraftBtn" onclick="fetch('/items/purchases', {{method: 'POST'}})">Save draft</button>
+    <button id="cancelPurchaseBtn">Cancel</button>
+    <div class="error-message">Reference is required</div>
+    {ADD_ITEM_SCRIPT}
+    """
+
+
+def purchase_reference(index: int) -> str:
+    return f"INV_{index:05d}"
+
+
+def table_screen(rows: list[list[str]]) -> str:
+    body = "".join("<tr>" + "".join(f"<td>{escape(cell)}</td>" for cell in row) + "</tr>" for row in rows)
+    return f"<table><thead><tr><th>Reference</th></tr></thead><tbody>{body}</tbody></table>"
+
+
+def purchase_history_screen(size: int) -> str:
+    return table_screen([[purchase_reference(index), "invoice", option_name("Supplier", index % 10),
+                          f"{index}.00", "01/01/2025", "02/01/2025"] for index in range(size)])
+
+
+def draft_purchases_screen(size: int) -> str:
+    return table_screen([[purchase_reference(index), option_name("Supplier", index % 10), "01/01/2025",
+                          f"{index}.00", "02/01/2025"] for index in range(size)])
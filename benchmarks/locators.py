@@ -0,0 +1,148 @@
+"""
+Selector audit: resolves every selector the page objects declare (see utils/locator_utils.Selector) against the
+static screens of benchmarks/dom_fixtures.py, and reports the selectors which are slow to resolve on large screens,
+ambiguous (a unique selector matching several elements), missing from their screen, declared twice, or XPath.
+Run with:
+
+    python -m benchmarks.locators --size 1000 --slow-ms 5
+
+The exit status is 1 when any selector is flagged.
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from playwright.sync_api import Page, sync_playwright
+
+from benchmarks import dom_fixtures
+from benchmarks.dom_fixtures import BENCH_ORIGIN
+from benchmarks.page_objects import RESULTS_DIR, fulfill_bench_request
+from pages.base_page import BasePage
+from pages.dashboard_page import DashboardPage
+from pages.draft_purchase_orders_page import DraftPurchaseOrdersPage
+from pages.login_page import LoginPage
+from pages.new_purchase_order_page import NewPurchaseOrderPage
+from pages.product_page import ProductPage
+from pages.purchase_order_history_page import PurchaseOrderHistoryPage
+from utils.locator_utils import Selector, get_locator_registry, get_page_selectors
+from utils.timing_utils import percentile
+
+# The screen each page object's own selectors are resolved on
+PAGE_SCREENS = {
+    BasePage: lambda size: dom_fixtures.new_purchase_screen(size) + dom_fixtures.purchase_history_screen(size),
+    LoginPage: dom_fixtures.login_screen,
+    DashboardPage: dom_fixtures.dashboard_screen,
+    ProductPage: dom_fixtures.new_product_screen,
+    NewPurchaseOrderPage: dom_fixtures.new_purchase_screen,
+    PurchaseOrderHistoryPage: dom_fixtures.purchase_history_screen,
+    DraftPurchaseOrdersPage: dom_fixtures.draft_purchases_screen,
+}
+
+
+def resolve_selector(page: Page, selector: Selector, repeat: int) -> dict:
+    """
+    Counts the elements a selector matches, the way a page-object locator resolves it. Row-relative selectors are
+    resolved within the middle row matched by the selector they are declared within.
+
+    :return: the number of matches and the median resolution time in milliseconds.
+    """
+    if selector.within is not None:
+        rows = page.locator(selector.within)
+        locator = rows.nth(rows.count() // 2).locator(selector)
+    else:
+        locator = page.locator(selector)
+
+    durations, count = [], 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = locator.count()
+        durations.append((time.perf_counter() - start) * 1000)
+
+    return {"count": count, "median_ms": round(percentile(durations, 50), 3)}
+
+
+def audit_selectors(size: int = 1000, repeat: int = 5, slow_ms: float = 5.0, headless: bool = True) -> dict:
+    """
+    Resolves the selectors of every page object on its screen, built with 'size' options, items and rows.
+
+    :param slow_ms: the median resolution time above which a selector is flagged as slow.
+    :return: one result per selector, with the list of issues found.
+    """
+    results = []
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=headless)
+        page = browser.new_page()
+        page.route(f"{BENCH_ORIGIN}/**", fulfill_bench_request)
+        page.goto(BENCH_ORIGIN)
+
+        for page_class, screen in PAGE_SCREENS.items():
+            page.set_content(screen(size))
+
+            for name, selector in get_page_selectors(page_class).items():
+                result = {"selector": name, "value": str(selector), **resolve_selector(page, selector, repeat)}
+
+                issues = []
+                if result["count"] == 0:
+                    issues.append("matches nothing")
+                elif selector.unique and result["count"] > 1:
+                    issues.append(f"ambiguous, matches {result['count']} elements")
+                if result["median_ms"] > slow_ms:
+                    issues.append(f"slow, {result['median_ms']:.2f} ms")
+                if selector.is_xpath:
+                    issues.append("XPath, prefer scoped CSS")
+
+                result["issues"] = issues
+                results.append(result)
+                print(f"{name:<60} {result['count']:>6} {result['median_ms']:>8.2f} ms {'; '.join(issues)}")
+
+        browser.close()
+
+    return {"size": size, "results": results, "duplicates": find_duplicate_selectors()}
+
+
+def find_duplicate_selectors() -> list[str]:
+    """
+    :return: a description of every selector value a page object declares more than once, instead of reusing the
+    declared Selector.
+    """
+    duplicates = []
+    for page_class in PAGE_SCREENS:
+        declared = {}
+        for name, selector in get_locator_registry([page_class]).items():
+            declared.setdefault((str(selector), selector.within), {}).setdefault(id(selector), name)
+
+        duplicates.extend(f"{page_class.__name__}: {value} is declared as {', '.join(names.values())}"
+                          for (value, _), names in declared.items() if len(names) > 1)
+
+    return sorted(set(duplicates))
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Page-object selector audit")
+    parser.add_argument("--size", type=int, default=1000, help="Number of options/items/rows of the screens")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed resolutions per selector")
+    parser.add_argument("--slow-ms", type=float, default=5.0,
+                        help="Median resolution time above which a selector is flagged as slow")
+    parser.add_argument("--output", type=Path, default=RESULTS_DIR / "locators.json")
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args(argv)
+
+    audit = audit_selectors(args.size, args.repeat, args.slow_ms, headless=not args.headed)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(audit, indent=2))
+    print(f"[LOCATORS] Audit saved to: {args.output}")
+
+    flagged = [f"{result['selector']} ({result['value']}): {'; '.join(result['issues'])}"
+               for result in audit["results"] if result["issues"]] + audit["duplicates"]
+    for finding in flagged:
+        print(f"[LOCATORS] {finding}")
+
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
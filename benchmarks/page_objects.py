@@ -0,0 +1,343 @@
+"""
+Offline microbenchmarks of the page objects, run against the static DOMs of benchmarks/dom_fixtures.py loaded with
+page.set_content, so that no backend is needed. Run with:
+
+    python -m benchmarks.page_objects --sizes 10,100,1000,10000 --baseline benchmarks/results/baseline.json
+
+The results are written to --output; with --baseline, every case slower than the baseline by more than the
+threshold and every case whose time grows faster than linearly with the DOM size is reported, and the exit status
+is 1. Save a new baseline with --save-baseline.
+"""
+import argparse
+import inspect
+import json
+import math
+import platform
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from playwright.sync_api import Page, Route, sync_playwright
+
+from benchmarks import dom_fixtures
+from benchmarks.dom_fixtures import BENCH_ORIGIN, option_name, purchase_reference
+from modules.product import Product
+from modules.product_group import ProductGroup
+from modules.product_supplier import ProductSupplier
+from modules.product_type import ProductType
+from modules.product_unit import ProductUnit
+from pages.base_page import BasePage
+from pages.dashboard_page import DashboardPage
+from pages.draft_purchase_orders_page import DraftPurchaseOrdersPage
+from pages.login_page import LoginPage
+from pages.new_purchase_order_page import NewPurchaseOrderPage
+from pages.product_page import ProductPage
+from pages.purchase_order_history_page import PurchaseOrderHistoryPage
+from utils.timing_utils import percentile
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+BENCHMARKED_CLASSES = (BasePage, LoginPage, DashboardPage, ProductPage, NewPurchaseOrderPage,
+                       PurchaseOrderHistoryPage, DraftPurchaseOrdersPage)
+# Time growing with DOM size by a higher power than this is reported as superlinear
+SCALING_EXPONENT_LIMIT = 1.5
+# Differences below this many milliseconds are noise, whatever their ratio
+MIN_REGRESSION_MS = 2.0
+
+
+@dataclass
+class BenchmarkCase:
+    """
+    A timed call of a page-object method against a screen of the given size. The setup, when any, runs untimed
+    before each call; cases with reload=True get a fresh screen before each call, because the call changes it.
+    """
+    name: str
+    screen: Callable[[int], str]
+    page_object: type
+    call: Callable[[object, int], object]
+    setup: Callable[[object, int], object] = None
+    reload: bool = False
+
+
+def purchase_product(index: int, size: int) -> Product:
+    return Product(name=option_name("Product", index % size), unit={"name": option_name("Unit", 0)},
+                   quantity=2, cost=3.5)
+
+
+def fill_new_item(purchase_page: NewPurchaseOrderPage, size: int):
+    purchase_page.fill_purchase_product_details(purchase_product(size - 1, size))
+
+
+BENCHMARK_CASES = [
+    BenchmarkCase("BasePage.get_select_options", dom_fixtures.new_purchase_screen, BasePage,
+                  lambda po, size: po.get_select_options(NewPurchaseOrderPage.PRODUCT_DROPDOWN)),
+    BenchmarkCase("BasePage.return_values_from_select", dom_fixtures.new_purchase_screen, BasePage,
+                  lambda po, size: po.return_values_from_select(NewPurchaseOrderPage.PRODUCT_DROPDOWN, "Product 1")),
+    BenchmarkCase("BasePage.get_table_rows", dom_fixtures.purchase_history_screen, BasePage,
+                  lambda po, size: po.get_table_rows()),
+    BenchmarkCase("BasePage.get_form_state", dom_fixtures.new_purchase_screen, BasePage,
+                  lambda po, size: po.get_form_state(NewPurchaseOrderPage.CLEARED_PRODUCT_INPUTS_STATE)),
+    BenchmarkCase("BasePage.verify_form_state", dom_fixtures.new_purchase_screen, BasePage,
+                  lambda po, size: po.verify_form_state(NewPurchaseOrderPage.CLEARED_PRODUCT_INPUTS_STATE)),
+    BenchmarkCase("BasePage.verify_error_message", dom_fixtures.new_purchase_screen, BasePage,
+                  lambda po, size: po.verify_error_message("Reference is required")),
+    BenchmarkCase("BasePage.click_and_wait_for_response", dom_fixtures.new_purchase_screen, BasePage,
+                  lambda po, size: po.click_and_wait_for_response(po.page.locator(NewPurchaseOrderPage.SUBMIT_BUTTON),
+                                                                  NewPurchaseOrderPage.CREATE_PURCHASE_ENDPOINT)),
+
+    BenchmarkCase("LoginPage.populate_email_field_with", dom_fixtures.login_screen, LoginPage,
+                  lambda po, size: po.populate_email_field_with("test_user@gmail.com")),
+    BenchmarkCase("LoginPage.populate_password_field_with", dom_fixtures.login_screen, LoginPage,
+                  lambda po, size: po.populate_password_field_with("password")),
+    BenchmarkCase("LoginPage.submit_login_credentials", dom_fixtures.login_screen, LoginPage,
+                  lambda po, size: po.submit_login_credentials()),
+
+    BenchmarkCase("DashboardPage.navigate_to_new_purchase_order_from_dashboard", dom_fixtures.dashboard_screen,
+                  DashboardPage, lambda po, size: po.navigate_to_new_purchase_order_from_dashboard(), reload=True),
+
+    BenchmarkCase("ProductPage.create_new_type", dom_fixtures.new_product_screen, ProductPage,
+                  lambda po, size: po.create_new_type(ProductType("Type", "Description"))),
+    BenchmarkCase("ProductPage.create_new_unit", dom_fixtures.new_product_screen, ProductPage,
+                  lambda po, size: po.create_new_unit(ProductUnit("Unit", 1.0, "Description"))),
+    BenchmarkCase("ProductPage.create_new_group", dom_fixtures.new_product_screen, ProductPage,
+                  lambda po, size: po.create_new_group(ProductGroup("Group", "Description"))),
+    BenchmarkCase("ProductPage.create_new_supplier", dom_fixtures.new_product_screen, ProductPage,
+                  lambda po, size: po.create_new_supplier(ProductSupplier("Supplier", "supplier@gmail.com"))),
+    BenchmarkCase("ProductPage.create_new_product", dom_fixtures.new_product_screen, ProductPage,
+                  lambda po, size: po.create_new_product(Product(
+                      name="Product", type=option_name("Type", size - 1), unit=option_name("Unit", size - 1),
+                      group=option_name("Group", size - 1), supplier=option_name("Supplier", size - 1)))),
+
+    BenchmarkCase("NewPurchaseOrderPage.select_supplier", dom_fixtures.new_purchase_screen, NewPurchaseOrderPage,
+                  lambda po, size: po.select_supplier(option_name("Supplier", size - 1))),
+    BenchmarkCase("NewPurchaseOrderPage.select_product", dom_fixtures.new_purchase_screen, NewPurchaseOrderPage,
+                  lambda po, size: po.select_product(option_name("Product", size - 1))),
+    BenchmarkCase("NewPurchaseOrderPage.type_purchase_date", dom_fixtures.new_purchase_screen, NewPurchaseOrderPage,
+                  lambda po, size: po.type_purchase_date("01012025"), reload=True),
+    BenchmarkCase("NewPurchaseOrderPage.select_purchase_type", dom_fixtures.new_purchase_screen, NewPurchaseOrderPage,
+                  lambda po, size: po.select_purchase_type("receipt")),
+    BenchmarkCase("NewPurchaseOrderPage.fill_purchase_reference", dom_fixtures.new_purchase_screen,
+                  NewPurchaseOrderPage, lambda po, size: po.fill_purchase_reference("INV_1")),
+    BenchmarkCase("NewPurchaseOrderPage.fill_quantity", dom_fixtures.new_purchase_screen, NewPurchaseOrderPage,
+                  lambda po, size: po.fill_quantity(2)),
+    BenchmarkCase("NewPurchaseOrderPage.fill_cost", dom_fixtures.new_purchase_screen, NewPurchaseOrderPage,
+                  lambda po, size: po.fill_cost(3.5)),
+    BenchmarkCase("NewPurchaseOrderPage.fill_purchase_product_details", dom_fixtures.new_purchase_screen,
+                  NewPurchaseOrderPage, fill_new_item, reload=True),
+    BenchmarkCase("NewPurchaseOrderPage.add_item", dom_fixtures.new_purchase_screen, NewPurchaseOrderPage,
+                  lambda po, size: po.add_item(purchase_product(size - 1, size), expected_items_count=size + 1),
+                  setup=fill_new_item, reload=True),
+    BenchmarkCase("NewPurchaseOrderPage.get_added_item_row", dom_fixtures.new_purchase_screen, NewPurchaseOrderPage,
+                  lambda po, size: po.get_added_item_row(option_name("Product", size - 1)).count()),
+    BenchmarkCase("NewPurchaseOrderPage.get_added_items", dom_fixtures.new_purchase_screen, NewPurchaseOrderPage,
+                  lambda po, size: po.get_added_items()),
+    BenchmarkCase("NewPurchaseOrderPage.verify_added_items", dom_fixtures.new_purchase_screen, NewPurchaseOrderPage,
+                  lambda po, size: po.verify_added_items([purchase_product(index, size) for index in range(size)])),
+    BenchmarkCase("NewPurchaseOrderPage.select_unify_same_items_checkbox", dom_fixtures.new_purchase_screen,
+                  NewPurchaseOrderPage, lambda po, size: po.select_unify_same_items_checkbox(True), reload=True),
+    BenchmarkCase("NewPurchaseOrderPage.submit_purchase", dom_fixtures.new_purchase_screen, NewPurchaseOrderPage,
+                  lambda po, size: po.submit_purchase("INV_1")),
+    BenchmarkCase("NewPurchaseOrderPage.save_purchase_as_draft", dom_fixtures.new_purchase_screen,
+                  NewPurchaseOrderPage, lambda po, size: po.save_purchase_as_draft("INV_1")),
+    BenchmarkCase("NewPurchaseOrderPage.cancel_purchase_create", dom_fixtures.new_purchase_screen,
+                  NewPurchaseOrderPage, lambda po, size: po.cancel_purchase_create("INV_1")),
+
+    BenchmarkCase("PurchaseOrderHistoryPage.get_purchase_rows", dom_fixtures.purchase_history_screen,
+                  PurchaseOrderHistoryPage, lambda po, size: po.get_purchase_rows()),
+    BenchmarkCase("PurchaseOrderHistoryPage.index_purchases_by_reference", dom_fixtures.purchase_history_screen,
+                  PurchaseOrderHistoryPage, lambda po, size: po.index_purchases_by_reference()),
+    BenchmarkCase("PurchaseOrderHistoryPage.get_purchase_by_reference", dom_fixtures.purchase_history_screen,
+                  PurchaseOrderHistoryPage, lambda po, size: po.get_purchase_by_reference(purchase_reference(size - 1))),
+
+    BenchmarkCase("DraftPurchaseOrdersPage.get_draft_purchase_rows", dom_fixtures.draft_purchases_screen,
+                  DraftPurchaseOrdersPage, lambda po, size: po.get_draft_purchase_rows()),
+    BenchmarkCase("DraftPurchaseOrdersPage.index_draft_purchases_by_reference", dom_fixtures.draft_purchases_screen,
+                  DraftPurchaseOrdersPage, lambda po, size: po.index_draft_purchases_by_reference()),
+    BenchmarkCase("DraftPurchaseOrdersPage.get_draft_purchase_by_reference", dom_fixtures.draft_purchases_screen,
+                  DraftPurchaseOrdersPage,
+                  lambda po, size: po.get_draft_purchase_by_reference(purchase_reference(size - 1))),
+]
+
+
+def get_public_methods(cls: type) -> list[str]:
+    """
+    :return: 'Class.method' for every public method defined by the class itself.
+    """
+    return [f"{cls.__name__}.{name}" for name, member in vars(cls).items()
+            if not name.startswith("_") and (inspect.isfunction(member) or isinstance(member, staticmethod))]
+
+
+def get_uncovered_methods(cases: list[BenchmarkCase] = None) -> list[str]:
+    """
+    :return: the public methods of the benchmarked page objects no case calls, e.g. because they need the real app.
+    """
+    covered = {case.name for case in (cases or BENCHMARK_CASES)}
+    return [method for cls in BENCHMARKED_CLASSES for method in get_public_methods(cls) if method not in covered]
+
+
+def fulfill_bench_request(route: Route):
+    if route.request.resource_type == "document":
+        route.fulfill(status=200, content_type="text/html", body="<html><body></body></html>")
+    else:
+        route.fulfill(status=201, content_type="application/json", body='{"new_id": 1}')
+
+
+def run_case(page: Page, case: BenchmarkCase, size: int, repeat: int, warmup: int) -> dict:
+    """
+    Times a case against a screen of the given size.
+
+    :return: the median, minimum and maximum duration in milliseconds, warm-up calls excluded.
+    """
+    screen = case.screen(size)
+    durations = []
+
+    for run in range(warmup + repeat):
+        if run == 0 or case.reload:
+            page.set_content(screen)
+
+        page_object = case.page_object(page)
+        if case.setup:
+            case.setup(page_object, size)
+
+        start = time.perf_counter()
+        case.call(page_object, size)
+        duration = (time.perf_counter() - start) * 1000
+
+        if run >= warmup:
+            durations.append(duration)
+
+    return {
+        "case": case.name,
+        "size": size,
+        "median_ms": round(percentile(durations, 50), 3),
+        "min_ms": round(min(durations), 3),
+        "max_ms": round(max(durations), 3),
+        "runs": repeat,
+    }
+
+
+def run_benchmarks(sizes: tuple = DEFAULT_SIZES, repeat: int = 5, warmup: int = 1, case_filter: str = None,
+                   headless: bool = True) -> dict:
+    """
+    Runs the benchmark cases whose name contains the filter for every size, in a single headless page.
+
+    :return: the run metadata and one result per case and size.
+    """
+    cases = [case for case in BENCHMARK_CASES if not case_filter or case_filter in case.name]
+    results = []
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=headless)
+        page = browser.new_page()
+        page.route(f"{BENCH_ORIGIN}/**", fulfill_bench_request)
+        # Screens are loaded into a page of the bench origin, so that relative fetches reach the route above
+        page.goto(BENCH_ORIGIN)
+
+        for case in cases:
+            for size in sizes:
+                result = run_case(page, case, size, repeat, warmup)
+                results.append(result)
+                print(f"{case.name:<70} {size:>6} {result['median_ms']:>10.2f} ms")
+
+        meta = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "browser": f"chromium {browser.version}",
+            "python": platform.python_version(),
+            "sizes": list(sizes),
+            "repeat": repeat,
+        }
+        browser.close()
+
+    return {"meta": meta, "results": results, "uncovered": get_uncovered_methods(cases)}
+
+
+def find_superlinear_cases(results: list[dict], limit: float = SCALING_EXPONENT_LIMIT) -> list[str]:
+    """
+    Estimates, per case, the power of the DOM size its time grows with, between the smallest and largest size.
+
+    :return: a description of every case growing faster than size ** limit.
+    """
+    by_case = {}
+    for result in results:
+        by_case.setdefault(result["case"], []).append(result)
+
+    findings = []
+    for name, case_results in sorted(by_case.items()):
+        smallest, largest = min(case_results, key=lambda r: r["size"]), max(case_results, key=lambda r: r["size"])
+        if largest["size"] <= smallest["size"] or smallest["median_ms"] <= 0:
+            continue
+
+        exponent = math.log(max(largest["median_ms"], 1e-6) / smallest["median_ms"]) / \
+            math.log(largest["size"] / smallest["size"])
+        if exponent > limit:
+            findings.append(f"{name}: time grows with size ** {exponent:.2f} "
+                            f"({smallest['median_ms']:.2f} ms at {smallest['size']}, "
+                            f"{largest['median_ms']:.2f} ms at {largest['size']})")
+
+    return findings
+
+
+def compare_to_baseline(results: list[dict], baseline: list[dict], threshold: float) -> list[str]:
+    """
+    :param threshold: the ratio to the baseline median above which a case counts as a regression.
+    :return: a description of every case and size slower than the baseline by more than the threshold.
+    """
+    baseline_medians = {(result["case"], result["size"]): result["median_ms"] for result in baseline}
+
+    regressions = []
+    for result in results:
+        base = baseline_medians.get((result["case"], result["size"]))
+        if base is None:
+            continue
+
+        if result["median_ms"] > base * threshold and result["median_ms"] - base > MIN_REGRESSION_MS:
+            regressions.append(f"{result['case']} at {result['size']}: {result['median_ms']:.2f} ms, "
+                               f"baseline {base:.2f} ms (x{result['median_ms'] / base:.2f})")
+
+    return regressions
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline page-object microbenchmarks")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Comma-separated numbers of rows/options/items of the screens")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed calls per case and size")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed calls per case and size")
+    parser.add_argument("-k", dest="case_filter", default=None, help="Only run the cases whose name contains this")
+    parser.add_argument("--output", type=Path, default=RESULTS_DIR / "latest.json")
+    parser.add_argument("--baseline", type=Path, default=None, help="Results file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="Ratio to the baseline median above which a case is a regression")
+    parser.add_argument("--save-baseline", action="store_true", help="Also save the results as the baseline")
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args(argv)
+
+    run = run_benchmarks(tuple(int(size) for size in args.sizes.split(",")), args.repeat, args.warmup,
+                         args.case_filter, headless=not args.headed)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(run, indent=2))
+    print(f"[BENCHMARK] Results saved to: {args.output}")
+
+    if args.save_baseline:
+        (RESULTS_DIR / "baseline.json").write_text(json.dumps(run, indent=2))
+        print(f"[BENCHMARK] Baseline saved to: {RESULTS_DIR / 'baseline.json'}")
+
+    if run["uncovered"]:
+        print("[BENCHMARK] Not benchmarked (need the real app): " + ", ".join(run["uncovered"]))
+
+    findings = find_superlinear_cases(run["results"])
+    if args.baseline:
+        findings += compare_to_baseline(run["results"], json.loads(args.baseline.read_text())["results"],
+                                        args.threshold)
+
+    for finding in findings:
+        print(f"[REGRESSION] {finding}")
+
+    return 1 if findings else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class AddedItem:
+    name: str = None
+    unit: str = None
+    quantity: str = None
+    cost: str = None
+    total: str = None
+    edit_visible: bool = None
+    edit_enabled: bool = None
+    delete_visible: bool = None
+    delete_enabled: bool = None
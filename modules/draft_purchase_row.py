@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class DraftPurchaseRow:
+    reference: str = None
+    supplier: str = None
+    created_date: str = None
+    total: str = None
+    date_saved: str = None
+
+    @staticmethod
+    def parse_cells_to_row(cells: list[str]):
+        return DraftPurchaseRow(*cells[:5])
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class PurchaseHistoryRow:
+    reference: str = None
+    type: str = None
+    supplier: str = None
+    total: str = None
+    purchase_date: str = None
+    created_date: str = None
+
+    @staticmethod
+    def parse_cells_to_row(cells: list[str]):
+        return PurchaseHistoryRow(*cells[:6])
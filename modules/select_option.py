@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class SelectOption:
+    label: str = None
+    value: str = None
+    selected: bool = None
@@ -0,0 +1,120 @@
+import time
+
+from playwright.async_api import Locator, Response, expect
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from modules.select_option import SelectOption
+from pages.base_page import BasePage
+
+
+class AsyncBasePage(BasePage):
+    """
+    Async counterpart of BasePage, for the pages of AsyncScenarioRunner scenarios. It reuses the selectors, scripts
+    and browser-free helpers of BasePage and redefines every method which talks to the browser as a coroutine, so
+    that no sync method is left to be called on an async page.
+    """
+
+    async def get_select_options(self, selector: str, contains: str = None) -> list[SelectOption]:
+        """
+        The method is used to retrieve all options of a select element in a single browser round trip.
+
+        :param selector: the select element
+        :param contains: optional substring the option labels are filtered by inside the browser
+        :return: list of the options with their labels, values and selected state
+        """
+        options = await self.page.locator(selector).evaluate(self.SELECT_OPTIONS_SCRIPT, contains)
+
+        return [SelectOption(**option) for option in options]
+
+    async def return_values_from_select(self, selector: str, contains: str = None):
+        """
+        The method is used to retrieve all values from select element.
+
+        :param selector: the select element
+        :param contains: optional substring the values are filtered by inside the browser
+        :return: list of all values from the select
+        """
+        return [option.label for option in await self.get_select_options(selector, contains) if option.label != ""]
+
+    async def get_table_rows(self, rows_selector: str = BasePage.TABLE_ROWS, start: int = 0, limit: int = None,
+                             wait: bool = True, timeout: float = 5000) -> list[list[str]]:
+        """
+        The method is used to read the text of all cells of a table (or of a window of its rows) in a single
+        browser round trip.
+
+        :param rows_selector: the selector matching the table rows
+        :param start: index of the first row to read
+        :param limit: maximum number of rows to read, all remaining rows when None
+        :param wait: whether to wait for the first row to be attached before reading
+        :param timeout: maximum time to wait for the first row, in milliseconds; the table is empty once it expires
+        :return: list of rows, each a list of cell texts
+        """
+        rows = self.page.locator(rows_selector)
+
+        if wait:
+            try:
+                await rows.first.wait_for(state="attached", timeout=timeout)
+            except PlaywrightTimeoutError:
+                return []
+
+        return await rows.evaluate_all(self.TABLE_ROWS_SCRIPT, [start, limit])
+
+    async def get_form_state(self, selectors) -> dict[str, dict]:
+        """
+        The method is used to capture the state of several form elements in a single browser round trip.
+
+        :param selectors: CSS selectors of the form elements
+        :return: dictionary of selector to the element state (see BasePage.get_form_state)
+        """
+        return await self.page.evaluate(self.FORM_STATE_SCRIPT, list(selectors))
+
+    async def verify_form_state(self, expected_state: dict[str, dict], timeout: float = 5000):
+        """
+        The method is used to assert the state of several form elements at once. The whole state is captured again
+        until it matches the expectation or the timeout expires, and all mismatches are reported together.
+
+        :param expected_state: dictionary of CSS selector to the expected properties
+        :param timeout: maximum time to wait for the state to match, in milliseconds
+        """
+        deadline = time.monotonic() + timeout / 1000
+
+        while True:
+            mismatches = self.get_form_state_mismatches(expected_state,
+                                                        await self.get_form_state(expected_state.keys()))
+
+            if not mismatches:
+                return self
+
+            if time.monotonic() >= deadline:
+                raise AssertionError("Form state does not match the expected state:\n" + "\n".join(mismatches))
+
+            await self.page.wait_for_timeout(100)
+
+    async def click_and_wait_for_response(self, locator: Locator, endpoint, method: str = "POST",
+                                          timeout: float = 10000) -> Response:
+        """
+        The method is used to click an element and wait for the backend response the click triggers,
+        failing fast when the backend does not respond with a 2xx status.
+
+        :param locator: the element to click
+        :param endpoint: the API endpoint path or pattern the response is expected from (see BasePage)
+        :param method: the HTTP method of the expected request
+        :param timeout: maximum time to wait for the response, in milliseconds
+        :return: the backend response
+        """
+        async with self.page.expect_response(self.response_predicate(endpoint, method),
+                                             timeout=timeout) as response_info:
+            await locator.click()
+
+        response = await response_info.value
+
+        assert response.ok, \
+            f"Expected {method} {response.url} to succeed, but got {response.status}: {await response.text()}"
+
+        return response
+
+    async def verify_error_message(self, expected_message):
+        (await expect(self.error_message,
+                      f"Expect error message '{expected_message}' to equal Actual "
+                      f"{await self.error_message.inner_text()}")
+         .to_contain_text(expected_message))
@@ -0,0 +1,26 @@
+import logging
+
+from playwright.async_api import expect
+
+from pages.aio.base_page import AsyncBasePage
+from pages.dashboard_page import DashboardPage
+
+
+class AsyncDashboardPage(AsyncBasePage, DashboardPage):
+
+    async def verify_side_menu_sections(self) -> int:
+        logging.info("Verify the side menu sections of the Dashboard.")
+
+        await self.purchase_orders_side_menu_button.click()
+        for section in self.side_menu_sections:
+            await expect(section).to_be_visible()
+            await expect(section).to_be_enabled()
+
+        return len(self.side_menu_sections)
+
+    async def navigate_to_new_purchase_order_from_dashboard(self):
+        logging.info("Navigate to New Purchase Order from Dashboard.")
+
+        await self.purchase_orders_side_menu_button.click()
+        await self.new_purchase_order_side_menu_button.click()
+        await expect(self.new_purchase_order_module_header_text).to_be_visible(timeout=10000)
@@ -1,27 +1,194 @@
-from playwright.sync_api import Page, expect
+import re
+import time
+from typing import Union
+from urllib.parse import urlparse
+
+from playwright.sync_api import Locator, Page, Response, expect
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from modules.select_option import SelectOption
+from utils.locator_utils import Selector
 
 
 class BasePage:
+    TABLE_ROWS = Selector("tbody > tr", unique=False)
+    ERROR_MESSAGE = Selector("div.error-message")
+    SELECT_OPTIONS_SCRIPT = """
+    (select, contains) => Array.from(select.options)
+        .filter(option => !contains || option.textContent.includes(contains))
+        .map(option => ({label: option.textContent.trim(), value: option.value, selected: option.selected}))
+    """
+    TABLE_ROWS_SCRIPT = """
+    (rows, [start, limit]) => rows
+        .slice(start, limit === null ? undefined : start + limit)
+        .map(row => Array.from(row.cells, cell => cell.innerText))
+    """
+    FORM_STATE_SCRIPT = """
+    selectors => Object.fromEntries(selectors.map(selector => {
+        const element = document.querySelector(selector);
+        if (!element) return [selector, {exists: false}];
+
+        const isEditable = element.matches('input, textarea, select');
+        const isSelect = element.tagName === 'SELECT';
+        const selectedOption = isSelect ? element.options[element.selectedIndex] : null;
+
+        return [selector, {
+            exists: true,
+            value: isEditable ? element.value : null,
+            text: element.innerText.trim(),
+            enabled: !element.matches(':disabled'),
+            checked: element.checked === true,
+            empty: isEditable ? element.value === '' : element.textContent.trim() === '',
+            selected_text: selectedOption ? selectedOption.textContent.trim() : null,
+            options_count: isSelect
+                ? Array.from(element.options).filter(option => option.textContent !== '').length
+                : null,
+        }];
+    }))
+    """
 
     def __init__(self, page: Page):
         self.page = page
-        self.error_message = page.locator("//div[@class='error-message']")
+        self.error_message = page.locator(self.ERROR_MESSAGE)
 
-    def return_values_from_select(self, selector: str):
+    def get_select_options(self, selector: str, contains: str = None) -> list[SelectOption]:
+        """
+        The method is used to retrieve all options of a select element in a single browser round trip.
+
+        :param selector: the select element
+        :param contains: optional substring the option labels are filtered by inside the browser
+        :return: list of the options with their labels, values and selected state
+        """
+        options = self.page.locator(selector).evaluate(self.SELECT_OPTIONS_SCRIPT, contains)
+
+        return [SelectOption(**option) for option in options]
+
+    def return_values_from_select(self, selector: str, contains: str = None):
         """
         The method is used to retrieve all values from select element.
 
         :param selector: the select element
+        :param contains: optional substring the values are filtered by inside the browser
         :return: list of all values from the select
         """
-        values = self.page.query_selector(selector).query_selector_all("option")
+        return [option.label for option in self.get_select_options(selector, contains) if option.label != ""]
+
+    @staticmethod
+    def exact_text_pattern(text: str) -> re.Pattern:
+        """
+        :param text: the expected text of an element
+        :return: a pattern matching the whole text of the element only, surrounding whitespace aside
+        """
+        return re.compile(rf"^\s*{re.escape(text.strip())}\s*$")
+
+    def get_table_rows(self, rows_selector: str = TABLE_ROWS, start: int = 0, limit: int = None,
+                       wait: bool = True, timeout: float = 5000) -> list[list[str]]:
+        """
+        The method is used to read the text of all cells of a table (or of a window of its rows) in a single
+        browser round trip.
+
+        :param rows_selector: the selector matching the table rows
+        :param start: index of the first row to read
+        :param limit: maximum number of rows to read, all remaining rows when None
+        :param wait: whether to wait for the first row to be attached before reading
+        :param timeout: maximum time to wait for the first row, in milliseconds; the table is empty once it expires
+        :return: list of rows, each a list of cell texts
+        """
+        rows = self.page.locator(rows_selector)
+
+        if wait:
+            try:
+                rows.first.wait_for(state="attached", timeout=timeout)
+            except PlaywrightTimeoutError:
+                return []
+
+        return rows.evaluate_all(self.TABLE_ROWS_SCRIPT, [start, limit])
+
+    def get_form_state(self, selectors) -> dict[str, dict]:
+        """
+        The method is used to capture the state of several form elements in a single browser round trip.
+
+        :param selectors: CSS selectors of the form elements
+        :return: dictionary of selector to the element state - exists, value, text, enabled, checked, empty,
+        selected_text (of a select) and options_count (non-empty options of a select)
+        """
+        return self.page.evaluate(self.FORM_STATE_SCRIPT, list(selectors))
+
+    @staticmethod
+    def get_form_state_mismatches(expected_state: dict[str, dict], actual_state: dict[str, dict]) -> list[str]:
+        """
+        :param expected_state: dictionary of CSS selector to the expected properties
+        :param actual_state: the captured state (see get_form_state)
+        :return: a description of every property which does not have its expected value
+        """
+        return [
+            f"{selector} {prop}: expected {expected!r}, actual {actual_state[selector].get(prop)!r}"
+            for selector, expected_props in expected_state.items()
+            for prop, expected in expected_props.items()
+            if actual_state[selector].get(prop) != expected
+        ]
+
+    def verify_form_state(self, expected_state: dict[str, dict], timeout: float = 5000):
+        """
+        The method is used to assert the state of several form elements at once. The whole state is captured again
+        until it matches the expectation or the timeout expires, and all mismatches are reported together.
+
+        :param expected_state: dictionary of CSS selector to the expected properties, e.g.
+        {"#purchaseReference": {"enabled": True, "empty": True}}
+        :param timeout: maximum time to wait for the state to match, in milliseconds
+        """
+        deadline = time.monotonic() + timeout / 1000
+
+        while True:
+            mismatches = self.get_form_state_mismatches(expected_state, self.get_form_state(expected_state.keys()))
+
+            if not mismatches:
+                return self
+
+            if time.monotonic() >= deadline:
+                raise AssertionError("Form state does not match the expected state:\n" + "\n".join(mismatches))
+
+            self.page.wait_for_timeout(100)
+
+    @staticmethod
+    def response_predicate(endpoint: Union[str, re.Pattern], method: str):
+        """
+        :param endpoint: the API endpoint path (see click_and_wait_for_response)
+        :param method: the HTTP method of the expected request
+        :return: a predicate telling whether a response answers a request of the method to the endpoint
+        """
+        if isinstance(endpoint, re.Pattern):
+            matches_endpoint = endpoint.fullmatch
+        else:
+            endpoint = endpoint.rstrip("/")
+            matches_endpoint = endpoint.__eq__
+
+        return lambda response: (matches_endpoint(urlparse(response.url).path.rstrip("/"))
+                                 and response.request.method == method)
+
+    def click_and_wait_for_response(self, locator: Locator, endpoint: Union[str, re.Pattern], method: str = "POST",
+                                    timeout: float = 10000) -> Response:
+        """
+        The method is used to click an element and wait for the backend response the click triggers,
+        failing fast when the backend does not respond with a 2xx status.
+
+        :param locator: the element to click
+        :param endpoint: the API endpoint path the response is expected from, e.g. '/items/purchases'; the URL path
+        has to equal it, so that e.g. '/items/purchases/123' is not taken for it. A compiled pattern has to match
+        the whole URL path instead, for endpoints whose path varies
+        :param method: the HTTP method of the expected request
+        :param timeout: maximum time to wait for the response, in milliseconds
+        :return: the backend response
+        """
+        with self.page.expect_response(self.response_predicate(endpoint, method), timeout=timeout) as response_info:
+            locator.click()
+
+        response = response_info.value
 
-        values_text = []
+        assert response.ok, \
+            f"Expected {method} {response.url} to succeed, but got {response.status}: {response.text()}"
 
-        for value in values:
-            if value.text_content() != "":
-                values_text.append(value.text_content().strip())
-        return values_text
+        return response
 
     def verify_error_message(self, expected_message):
         (expect(self.error_message,
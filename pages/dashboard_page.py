@@ -1,31 +1,78 @@
 import logging
 
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Locator, Page, expect
 
 from pages.base_page import BasePage
+from utils.locator_utils import Selector
 
 
 class DashboardPage(BasePage):
+    SIDE_MENU_TOGGLE = Selector(".sidebar-toggle")
+    STOCKTAKE_SIDE_MENU_ENTRY = Selector(".sidebar-menu span:text-is('Stocktake')")
+    NEW_PRODUCT_SIDE_MENU_ENTRY = Selector(".sidebar-menu span:text-is('New Product')")
+    TRANSFERS_SIDE_MENU_ENTRY = Selector(".sidebar-menu span:text-is('Transfers')")
+    REQUESTS_SIDE_MENU_ENTRY = Selector(".sidebar-menu span:text-is('Requests')")
+    PURCHASE_ORDERS_SIDE_MENU_BUTTON = Selector("#purchaseOrdersBtn")
+    PURCHASE_ORDERS_SIDE_MENU_CARET = Selector("#purchaseOrdersCaret")
+    NEW_PURCHASE_ORDER_SIDE_MENU_ENTRY = Selector("#purchaseSubmenu span:text-is('New Purchase Order')")
+    DRAFT_PURCHASE_ORDERS_SIDE_MENU_ENTRY = Selector("#purchaseSubmenu span:text-is('Draft Purchase Orders')")
+    PURCHASE_ORDERS_HISTORY_SIDE_MENU_ENTRY = Selector("#purchaseSubmenu span:text-is('Purchase Orders History')")
+    STORES_SIDE_MENU_ENTRY = Selector(".sidebar-menu span:text-is('Stores')")
+    LOGOUT_SIDE_MENU_ENTRY = Selector(".sidebar-menu span:text-is('Logout')")
+    SUCCESS_MESSAGE = Selector(".success-message")
+    NEW_PURCHASE_ORDER_HEADER = Selector("#newPurchaseHeaderText")
 
     def __init__(self, page: Page):
         super().__init__(page)
-        self.toggle_side_menu_button = page.locator(".sidebar-toggle")
-        self.stocktake_side_menu_button = page.locator("//div[@class='sidebar-menu']//span[text()='Stocktake']")
-        self.new_product_side_menu_button = page.locator("//div[@class='sidebar-menu']//span[text()='New Product']")
-        self.transfers_side_menu_button = page.locator("//div[@class='sidebar-menu']//span[text()='Transfers']")
-        self.requests_side_menu_button = page.locator("//div[@class='sidebar-menu']//span[text()='Requests']")
-        self.purchase_orders_side_menu_button = page.locator("#purchaseOrdersBtn")
-        self.purchase_orders_side_menu_caret = page.locator("#purchaseOrdersCaret")
-        self.new_purchase_order_side_menu_button = page.locator(
-            "//div[@id='purchaseSubmenu']//span[text()='New Purchase Order']")
-        self.draft_purchase_orders_side_menu_button = page.locator(
-            "//div[@id='purchaseSubmenu']//span[text()='Draft Purchase Orders']")
-        self.purchase_orders_history_side_menu_button = page.locator(
-            "//div[@id='purchaseSubmenu']//span[text()='Purchase Orders History']")
-        self.stores_side_menu_button = page.locator("//div[@class='sidebar-menu']//span[text()='Stores']")
-        self.logout_side_menu_button = page.locator("//div[@class='sidebar-menu']//span[text()='Logout']")
-        self.success_message = page.locator(".success-message")
-        self.new_purchase_order_module_header_text = page.locator("#newPurchaseHeaderText")
+        self.toggle_side_menu_button = page.locator(self.SIDE_MENU_TOGGLE)
+        self.stocktake_side_menu_button = page.locator(self.STOCKTAKE_SIDE_MENU_ENTRY)
+        self.new_product_side_menu_button = page.locator(self.NEW_PRODUCT_SIDE_MENU_ENTRY)
+        self.transfers_side_menu_button = page.locator(self.TRANSFERS_SIDE_MENU_ENTRY)
+        self.requests_side_menu_button = page.locator(self.REQUESTS_SIDE_MENU_ENTRY)
+        self.purchase_orders_side_menu_button = page.locator(self.PURCHASE_ORDERS_SIDE_MENU_BUTTON)
+        self.purchase_orders_side_menu_caret = page.locator(self.PURCHASE_ORDERS_SIDE_MENU_CARET)
+        self.new_purchase_order_side_menu_button = page.locator(self.NEW_PURCHASE_ORDER_SIDE_MENU_ENTRY)
+        self.draft_purchase_orders_side_menu_button = page.locator(self.DRAFT_PURCHASE_ORDERS_SIDE_MENU_ENTRY)
+        self.purchase_orders_history_side_menu_button = page.locator(self.PURCHASE_ORDERS_HISTORY_SIDE_MENU_ENTRY)
+        self.stores_side_menu_button = page.locator(self.STORES_SIDE_MENU_ENTRY)
+        self.logout_side_menu_button = page.locator(self.LOGOUT_SIDE_MENU_ENTRY)
+        self.success_message = page.locator(self.SUCCESS_MESSAGE)
+        self.new_purchase_order_module_header_text = page.locator(self.NEW_PURCHASE_ORDER_HEADER)
+
+    @property
+    def side_menu_sections(self) -> list[Locator]:
+        """
+        :return: the entries of the side menu, those of the Purchase Orders submenu included
+        """
+        return [
+            self.toggle_side_menu_button,
+            self.stocktake_side_menu_button,
+            self.new_product_side_menu_button,
+            self.transfers_side_menu_button,
+            self.requests_side_menu_button,
+            self.purchase_orders_side_menu_button,
+            self.new_purchase_order_side_menu_button,
+            self.draft_purchase_orders_side_menu_button,
+            self.purchase_orders_history_side_menu_button,
+            self.stores_side_menu_button,
+            self.logout_side_menu_button,
+        ]
+
+    def verify_side_menu_sections(self) -> int:
+        """
+        The method is used to open the Purchase Orders submenu and assert that every side menu entry is visible and
+        enabled.
+
+        :return: the number of verified entries
+        """
+        logging.info("Verify the side menu sections of the Dashboard.")
+
+        self.purchase_orders_side_menu_button.click()
+        for section in self.side_menu_sections:
+            expect(section).to_be_visible()
+            expect(section).to_be_enabled()
+
+        return len(self.side_menu_sections)
 
     def navigate_to_new_purchase_order_from_dashboard(self):
         logging.info("Navigate to New Purchase Order from Dashboard.")
@@ -1,15 +1,57 @@
-from playwright.sync_api import Page
+from playwright.sync_api import Page, expect
 
+from modules.draft_purchase_row import DraftPurchaseRow
 from pages.base_page import BasePage
+from utils.locator_utils import Selector
 
 
 class DraftPurchaseOrdersPage(BasePage):
+    DRAFT_PURCHASE_ROWS = BasePage.TABLE_ROWS
+    REFERENCE_CELL = Selector("td:nth-child(1)", within=DRAFT_PURCHASE_ROWS)
+    SUPPLIER_CELL = Selector("td:nth-child(2)", within=DRAFT_PURCHASE_ROWS)
+    CREATED_DATE_CELL = Selector("td:nth-child(3)", within=DRAFT_PURCHASE_ROWS)
+    TOTAL_CELL = Selector("td:nth-child(4)", within=DRAFT_PURCHASE_ROWS)
+    DATE_SAVED_CELL = Selector("td:nth-child(5)", within=DRAFT_PURCHASE_ROWS)
 
     def __init__(self, page: Page):
         super().__init__(page)
-        self.last_saved_draft_purchase_order_row = page.locator("//tbody/tr").last
-        self.last_saved_draft_purchase_reference = self.last_saved_draft_purchase_order_row.locator("xpath=./td[1]")
-        self.last_saved_draft_purchase_supplier = self.last_saved_draft_purchase_order_row.locator("xpath=./td[2]")
-        self.last_saved_draft_purchase_created_date = self.last_saved_draft_purchase_order_row.locator("xpath=./td[3]")
-        self.last_saved_draft_purchase_total = self.last_saved_draft_purchase_order_row.locator("xpath=./td[4]")
-        self.last_saved_draft_purchase_date_saved = self.last_saved_draft_purchase_order_row.locator("xpath=./td[5]")
+        self.draft_purchase_order_rows = page.locator(self.DRAFT_PURCHASE_ROWS)
+        self.all_draft_purchase_references = self.draft_purchase_order_rows.locator(self.REFERENCE_CELL)
+
+    def get_draft_purchase_rows(self, start: int = 0, limit: int = None) -> list[DraftPurchaseRow]:
+        """
+        The method is used to read the Draft Purchase Orders table (or a window of its rows) in a single call.
+
+        :param start: index of the first row to read.
+        :param limit: maximum number of rows to read, all remaining rows when None.
+        :return: list of DraftPurchaseRow records in the order they are displayed.
+        """
+        return [DraftPurchaseRow.parse_cells_to_row(cells)
+                for cells in self.get_table_rows(self.DRAFT_PURCHASE_ROWS, start, limit)]
+
+    def index_draft_purchases_by_reference(self, rows: list[DraftPurchaseRow] = None) -> dict[str, DraftPurchaseRow]:
+        """
+        The method is used to index the Draft Purchase Orders rows by purchase reference.
+
+        :param rows: already read rows, the whole table is read when None.
+        :return: dictionary of purchase reference to DraftPurchaseRow.
+        """
+        return {row.reference.strip(): row for row in (rows if rows is not None else self.get_draft_purchase_rows())}
+
+    def get_draft_purchase_by_reference(self, reference: str) -> DraftPurchaseRow:
+        """
+        The method is used to find the Draft Purchase Orders row of a purchase, waiting for it to be displayed.
+
+        :param reference: the purchase reference.
+        :return: the DraftPurchaseRow of the purchase.
+        """
+        reference_cell = self.all_draft_purchase_references.filter(has_text=self.exact_text_pattern(reference)).first
+        expect(reference_cell, f"Expected draft purchase {reference} to be listed on Draft Purchase Orders page.") \
+            .to_be_attached()
+
+        draft_purchases = self.index_draft_purchases_by_reference()
+        assert reference.strip() in draft_purchases, \
+            (f"Expected draft purchase {reference} among the {len(draft_purchases)} rows read from "
+             f"Draft Purchase Orders page.")
+
+        return draft_purchases[reference.strip()]
@@ -2,16 +2,23 @@ import logging
 
 from playwright.sync_api import Page
 
+from utils.locator_utils import Selector
+
 
 class LoginPage:
+    EMAIL_FIELD = Selector("#email")
+    PASSWORD_FIELD = Selector("#password")
+    SUBMIT_BUTTON = Selector("button[type='submit']:text-is('Login')")
+    USER_EMAIL = Selector("#userEmail")
+    LOGIN_ERROR_MESSAGE = Selector("#error")
 
     def __init__(self, page: Page):
         self.page = page
-        self.email_field = page.locator("#email")
-        self.password_field = page.locator("#password")
-        self.submit_button = page.locator("//button[@type='submit' and text()='Login']")
-        self.content_user_email = page.locator("#userEmail")
-        self.login_error_message = page.locator("#error")
+        self.email_field = page.locator(self.EMAIL_FIELD)
+        self.password_field = page.locator(self.PASSWORD_FIELD)
+        self.submit_button = page.locator(self.SUBMIT_BUTTON)
+        self.content_user_email = page.locator(self.USER_EMAIL)
+        self.login_error_message = page.locator(self.LOGIN_ERROR_MESSAGE)
 
     def populate_email_field_with(self, email: str):
         logging.info(f"Fill login email field with {email}")
@@ -1,42 +1,102 @@
 import logging
 import random
+import re
 from datetime import datetime
 
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Locator, Page, Response, expect
 
+from modules.added_item import AddedItem
 from modules.product import Product
 from modules.purchase import Purchase
 from pages.base_page import BasePage
 from utils.helpers import format_to_two_decimal_string
+from utils.locator_utils import Selector
 
 
 class NewPurchaseOrderPage(BasePage):
-    PRODUCT_DROPDOWN = "#currentProduct"
-    UNIT_DROPDOWN = "#currentUnit"
-    ADDED_PRODUCT_BY_TITLE = "//strong[@class='product-name' and text()='{}']/following-sibling::*[@class='{}']"
-    ADDED_PRODUCT_ACTIONS_BY_TITLE = "//strong[@class='product-name' and text()='{}']/../following-sibling::div[@class='item-actions']//button[@class='inline-button edit-btn']"
-    ADDED_PRODUCT_EDIT_ACTION_BY_TITLE = "//strong[@class='product-name' and text()='{}']/../following-sibling::div[@class='item-actions']//button[@class='inline-button edit-btn']"
-    ADDED_PRODUCT_DELETE_ACTION_BY_TITLE = "//strong[@class='product-name' and text()='{}']/../following-sibling::div[@class='item-actions']//button[@class='inline-button delete-btn']"
+    CREATE_PURCHASE_ENDPOINT = "/items/purchases"
+    # Drafts are posted to the purchases resource, possibly under a draft sub-path (e.g. '/items/purchases/draft')
+    SAVE_DRAFT_ENDPOINT = re.compile(r"/items/purchases(?:/[\w-]*drafts?[\w-]*)?")
+    SUPPLIER_DROPDOWN = Selector("#purchaseSupplier")
+    PURCHASE_DATE_FIELD = Selector("#purchaseDate")
+    PURCHASE_TYPE_DROPDOWN = Selector("#purchaseType")
+    PURCHASE_REFERENCE_INPUT = Selector("#purchaseReference")
+    PRODUCT_DROPDOWN = Selector("#currentProduct")
+    UNIT_DROPDOWN = Selector("#currentUnit")
+    QUANTITY_INPUT = Selector("#currentQuantity")
+    COST_INPUT = Selector("#currentCost")
+    TOTAL_FIELD = Selector("#currentTotal")
+    ADD_ITEM_BUTTON = Selector("#addItemToListBtn")
+    SUBMIT_BUTTON = Selector("#createPurchaseBtn")
+    SAVE_AS_DRAFT_BUTTON = Selector("#saveDraftBtn")
+    CANCEL_BUTTON = Selector("#cancelPurchaseBtn")
+    UNIFY_ITEMS_CHECKBOX = Selector("#unifyItemsCheckbox")
+    ITEMS_LIST_CONTAINER = Selector("#purchaseItemsList")
+    PURCHASE_TOTAL = Selector("#purchaseTotal")
+    CLEARED_PRODUCT_INPUTS_STATE = {
+        PRODUCT_DROPDOWN: {"selected_text": "Select product"},
+        UNIT_DROPDOWN: {"enabled": False},
+        QUANTITY_INPUT: {"enabled": True, "empty": True},
+        COST_INPUT: {"enabled": True, "empty": True},
+        TOTAL_FIELD: {"enabled": True, "empty": True},
+    }
+    ADDED_ITEM = Selector(".added-item", unique=False)
+    ADDED_ITEM_NAME = Selector(".product-name", within=ADDED_ITEM)
+    ADDED_ITEM_EDIT_BUTTON = Selector(".item-actions button.edit-btn", within=ADDED_ITEM)
+    ADDED_ITEM_DELETE_BUTTON = Selector(".item-actions button.delete-btn", within=ADDED_ITEM)
+    ADDED_ITEM_SNAPSHOT_FUNCTION = """
+    item => {
+        const text = selector => {
+            const element = item.querySelector(selector);
+            return element ? element.innerText : null;
+        };
+        const isVisible = element => {
+            if (!element) return false;
+            const rect = element.getBoundingClientRect();
+            return rect.width > 0 && rect.height > 0 && window.getComputedStyle(element).visibility !== 'hidden';
+        };
+        const isEnabled = element => element !== null && !element.matches(':disabled');
+        const editButton = item.querySelector('.item-actions button.edit-btn');
+        const deleteButton = item.querySelector('.item-actions button.delete-btn');
+
+        return {
+            name: text('.product-name'),
+            unit: text('.product-name ~ .unit'),
+            quantity: text('.product-name ~ .quantity'),
+            cost: text('.product-name ~ .cost'),
+            total: text('.product-name ~ .total'),
+            edit_visible: isVisible(editButton),
+            edit_enabled: isEnabled(editButton),
+            delete_visible: isVisible(deleteButton),
+            delete_enabled: isEnabled(deleteButton),
+        };
+    }
+    """
+    ADDED_ITEMS_SNAPSHOT_SCRIPT = f"items => items.map({ADDED_ITEM_SNAPSHOT_FUNCTION})"
+    LAST_ADDED_ITEM_SNAPSHOT_SCRIPT = (
+        f"items => ({{count: items.length, "
+        f"last: items.length ? ({ADDED_ITEM_SNAPSHOT_FUNCTION})(items[items.length - 1]) : null}})"
+    )
 
     def __init__(self, page: Page):
         super().__init__(page)
-        self.supplier_dropdown = page.locator("#purchaseSupplier")
-        self.purchase_date_field = page.locator("#purchaseDate")
-        self.purchase_type_dropdown = page.locator("#purchaseType")
-        self.purchase_reference_input = page.locator("#purchaseReference")
+        self.supplier_dropdown = page.locator(self.SUPPLIER_DROPDOWN)
+        self.purchase_date_field = page.locator(self.PURCHASE_DATE_FIELD)
+        self.purchase_type_dropdown = page.locator(self.PURCHASE_TYPE_DROPDOWN)
+        self.purchase_reference_input = page.locator(self.PURCHASE_REFERENCE_INPUT)
         self.product_dropdown = page.locator(self.PRODUCT_DROPDOWN)
         self.product_unit_dropdown = page.locator(self.UNIT_DROPDOWN)
-        self.product_quantity_input = page.locator("#currentQuantity")
-        self.product_cost_input = page.locator("#currentCost")
-        self.product_total_field = page.locator("#currentTotal")
-        self.purchase_add_item_button = page.locator("#addItemToListBtn")
-        self.purchase_submit_button = page.locator("#createPurchaseBtn")
-        self.purchase_save_as_draft_button = page.locator("#saveDraftBtn")
-        self.purchase_cancel_button = page.locator("#cancelPurchaseBtn")
-        self.unify_items_checkbox = page.locator("#unifyItemsCheckbox")
-        self.items_list_container = page.locator("#purchaseItemsList")
-        self.purchase_total_value = page.locator("#purchaseTotal")
-        self.added_item_container = page.locator(".added-item")
+        self.product_quantity_input = page.locator(self.QUANTITY_INPUT)
+        self.product_cost_input = page.locator(self.COST_INPUT)
+        self.product_total_field = page.locator(self.TOTAL_FIELD)
+        self.purchase_add_item_button = page.locator(self.ADD_ITEM_BUTTON)
+        self.purchase_submit_button = page.locator(self.SUBMIT_BUTTON)
+        self.purchase_save_as_draft_button = page.locator(self.SAVE_AS_DRAFT_BUTTON)
+        self.purchase_cancel_button = page.locator(self.CANCEL_BUTTON)
+        self.unify_items_checkbox = page.locator(self.UNIFY_ITEMS_CHECKBOX)
+        self.items_list_container = page.locator(self.ITEMS_LIST_CONTAINER)
+        self.purchase_total_value = page.locator(self.PURCHASE_TOTAL)
+        self.added_item_container = page.locator(self.ADDED_ITEM)
 
     def select_supplier(self, supplier_name: str):
         self.supplier_dropdown.select_option(supplier_name)
@@ -70,55 +130,123 @@ class NewPurchaseOrderPage(BasePage):
         self.product_cost_input.fill(str(cost))
         return self
 
-    def add_item(self, product: Product):
-        logging.info(f"Add item {product.name} to purchase.")
+    def get_added_items(self, product_name: str = None, expected_count: int = None) -> list[AddedItem]:
+        """
+        The method is used to read the whole Items List in a single browser round trip. The list is re-rendered
+        after every change, so the snapshot is only taken once it shows the expected number of rows or, without an
+        expected count, a row of the product.
 
-        self.purchase_add_item_button.click()
+        :param product_name: optional product name the returned items are filtered by.
+        :param expected_count: optional number of rows the Items List is expected to show.
+        :return: list of AddedItem rows in the order they are displayed.
+        """
+        if expected_count is not None:
+            expect(self.added_item_container).to_have_count(expected_count)
+        elif product_name is not None:
+            expect(self.get_added_item_row(product_name)).to_be_attached()
 
-        # Assert item is added to Items List
-        added_products_names = \
-            [product.locator(".product-name").inner_text() for product in self.added_item_container.all()]
+        added_items = [AddedItem(**item) for item in
+                       self.added_item_container.evaluate_all(self.ADDED_ITEMS_SNAPSHOT_SCRIPT)]
+
+        if product_name is not None:
+            added_items = [added_item for added_item in added_items if added_item.name == product_name]
+
+        return added_items
+
+    def get_added_item_row(self, product_name: str) -> Locator:
+        """
+        The method is used to locate the first Items List row of a product. The name is only matched within the
+        rows' name elements, instead of scanning the text of the whole document.
+
+        :param product_name: the name of the added product.
+        :return: the locator of the row.
+        """
+        return self.added_item_container.filter(
+            has=self.page.locator(self.ADDED_ITEM_NAME, has_text=self.exact_text_pattern(product_name))).first
+
+    @staticmethod
+    def verify_added_item_actions_available(added_item: AddedItem):
+        assert added_item.edit_visible and added_item.edit_enabled, \
+            f"Expected Edit button of added item {added_item.name} to be visible and enabled."
+        assert added_item.delete_visible and added_item.delete_enabled, \
+            f"Expected Delete button of added item {added_item.name} to be visible and enabled."
+
+    def verify_added_item(self, added_item: AddedItem, product: Product):
+        """
+        The method is used to verify that a row from the Items List shows the data of the provided product.
+
+        :param added_item: the row read from the Items List.
+        :param product: the product the row is expected to show.
+        """
+        assert added_item.name == product.name, \
+            f"Expected added item {product.name} to equal Actual {added_item.name}."
+
+        assert added_item.unit == product.unit['name'], \
+            f"Expected unit {product.unit['name']} of added item {product.name} to equal Actual {added_item.unit}."
+
+        assert added_item.quantity == str(product.quantity), \
+            f"Expected quantity {product.quantity} of added item {product.name} to equal Actual {added_item.quantity}."
+
+        assert float(added_item.cost) == float(product.cost), \
+            f"The expected cost for the added item {float(product.cost)} should equal the Actual {added_item.cost}."
+
+        assert format_to_two_decimal_string(added_item.total) == format_to_two_decimal_string(
+            product.quantity * float(product.cost)), \
+            (f"Expected added item total {(product.quantity * float(product.cost))} to equal "
+             f"Actual {float(added_item.total)}")
+
+        self.verify_added_item_actions_available(added_item)
+
+    def verify_added_items(self, products: list[Product]):
+        """
+        The method is used to reconcile the whole Items List against the provided products, row by row.
 
-        assert product.name in added_products_names, (
-            f"Expected product {product.name} to be added to items list, but it was not found!")
+        :param products: the products in the order they were added.
+        """
+        added_items = self.get_added_items(expected_count=len(products))
+
+        assert len(added_items) == len(products), \
+            f"Expected {len(products)} items in the Items List, but got {len(added_items)}."
+
+        for added_item, product in zip(added_items, products):
+            self.verify_added_item(added_item, product)
 
-        for unit in self.page.locator(self.ADDED_PRODUCT_BY_TITLE.format(product.name, 'unit')).all():
-            assert unit.inner_text() == product.unit['name']
+    def add_item(self, product: Product, expected_items_count: int = None):
+        """
+        The method is used to add the currently filled product to the Items List and verify it has been added.
+
+        :param product: the product object providing the expected data.
+        :param expected_items_count: when provided, only the newly appended row and the number of rows are verified,
+        which keeps adding N items linear; otherwise every row of the product is verified.
+        """
+        logging.info(f"Add item {product.name} to purchase.")
 
-        for quantity in self.page.locator(self.ADDED_PRODUCT_BY_TITLE.format(product.name, 'quantity')).all():
-            assert quantity.inner_text() == str(product.quantity)
+        self.purchase_add_item_button.click()
 
-        actual_cost = (float(set([cost.inner_text() for cost in
-                                  self.page.locator(
-                                      self.ADDED_PRODUCT_BY_TITLE.format(product.name, 'cost')).all()]).pop()))
+        # Assert item is added to Items List
+        if expected_items_count is None:
+            added_items = self.get_added_items(product.name)
 
-        assert actual_cost == float(product.cost), \
-            f"The expected cost for the added item {float(product.cost)} should equal the Actual {actual_cost}."
+            assert added_items, (
+                f"Expected product {product.name} to be added to items list, but it was not found!")
 
-        for total in self.page.locator(self.ADDED_PRODUCT_BY_TITLE.format(product.name, 'total')).all():
-            assert format_to_two_decimal_string(total.inner_text()) == format_to_two_decimal_string(
-                product.quantity * float(product.cost)), \
-                (f"Expected added item total {(product.quantity * float(product.cost))} to equal "
-                 f"Actual {float(total.inner_text())}")
+            for added_item in added_items:
+                self.verify_added_item(added_item, product)
+        else:
+            expect(self.added_item_container).to_have_count(expected_items_count)
+            snapshot = self.added_item_container.evaluate_all(self.LAST_ADDED_ITEM_SNAPSHOT_SCRIPT)
 
-        for edit_btn in self.page.locator(self.ADDED_PRODUCT_EDIT_ACTION_BY_TITLE.format(product.name)).all():
-            expect(edit_btn).to_be_visible()
-            expect(edit_btn).to_be_enabled()
+            assert snapshot["count"] == expected_items_count, \
+                (f"Expected {expected_items_count} items in the Items List after adding {product.name}, "
+                 f"but got {snapshot['count']}.")
 
-        for delete_btn in self.page.locator(self.ADDED_PRODUCT_DELETE_ACTION_BY_TITLE.format(product.name)).all():
-            expect(delete_btn).to_be_visible()
-            expect(delete_btn).to_be_enabled()
+            self.verify_added_item(AddedItem(**snapshot["last"]), product)
 
         # Assert item details are cleared from Product inputs:
-        expect(self.supplier_dropdown).not_to_be_enabled()
-        expect(self.product_dropdown.locator("option:checked")).to_have_text("Select product")
-        expect(self.product_unit_dropdown).not_to_be_enabled()
-        expect(self.product_quantity_input).to_be_enabled()
-        expect(self.product_quantity_input).to_be_empty()
-        expect(self.product_cost_input).to_be_enabled()
-        expect(self.product_cost_input).to_be_empty()
-        expect(self.product_total_field).to_be_enabled()
-        expect(self.product_total_field).to_be_empty()
+        self.verify_form_state({
+            self.SUPPLIER_DROPDOWN: {"enabled": False},
+            **self.CLEARED_PRODUCT_INPUTS_STATE
+        })
 
         return self
 
@@ -128,29 +256,40 @@ class NewPurchaseOrderPage(BasePage):
         self.purchase_add_item_button.click()
 
         # Assert item details are cleared from Product inputs:
-        expect(self.supplier_dropdown).not_to_be_enabled()
-        expect(self.product_dropdown.locator("option:checked")).to_have_text("Select product")
-        expect(self.product_unit_dropdown).not_to_be_enabled()
-        expect(self.product_quantity_input).to_be_enabled()
-        expect(self.product_quantity_input).to_be_empty()
-        expect(self.product_cost_input).to_be_enabled()
-        expect(self.product_cost_input).to_be_empty()
-        expect(self.product_total_field).to_be_enabled()
-        expect(self.product_total_field).to_be_empty()
+        self.verify_form_state({
+            self.SUPPLIER_DROPDOWN: {"enabled": False},
+            **self.CLEARED_PRODUCT_INPUTS_STATE
+        })
 
         return self
 
-    def submit_purchase(self, reference: str):
+    def submit_purchase(self, reference: str, wait_for_response: bool = True) -> Response:
+        """
+        The method is used to submit the purchase and wait for the backend to create it.
+
+        :param reference: the purchase reference.
+        :param wait_for_response: whether to wait for a successful backend response, disable it for purchases
+        which are expected to be rejected.
+        :return: the backend response, or None when not waiting for it.
+        """
         logging.info(f"Submit purchase with reference '{reference}' as New Purchase Order.")
 
-        self.purchase_submit_button.click()
-        return self
+        if not wait_for_response:
+            self.purchase_submit_button.click()
+            return None
+
+        return self.click_and_wait_for_response(self.purchase_submit_button, self.CREATE_PURCHASE_ENDPOINT)
+
+    def save_purchase_as_draft(self, reference: str) -> Response:
+        """
+        The method is used to save the purchase as draft and wait for the backend to store it.
 
-    def save_purchase_as_draft(self, reference: str):
+        :param reference: the purchase reference.
+        :return: the backend response.
+        """
         logging.info(f"Save purchase with reference '{reference}' as Draft Purchase Order.")
 
-        self.purchase_save_as_draft_button.click()
-        return self
+        return self.click_and_wait_for_response(self.purchase_save_as_draft_button, self.SAVE_DRAFT_ENDPOINT)
 
     def cancel_purchase_create(self, reference: str):
         logging.info(f"Cancel create of purchase with reference '{reference}'.")
@@ -170,7 +309,7 @@ class NewPurchaseOrderPage(BasePage):
         preliminary_added_items_count: int = self.added_item_container.count()
 
         # Click on Edit Button for the first item in the list of added items
-        self.page.locator(self.ADDED_PRODUCT_EDIT_ACTION_BY_TITLE.format(item_to_edit.name)).click()
+        self.get_added_item_row(item_to_edit.name).locator(self.ADDED_ITEM_EDIT_BUTTON).click()
 
         # Get the total purchase when an added item has been moved to edit (Added Items list is with one item less)
         purchase_total_after_item_moved_to_edit: float = float(self.purchase_total_value.inner_text())
@@ -185,11 +324,11 @@ class NewPurchaseOrderPage(BasePage):
             (f"Expected the number of added items to have decreased to {preliminary_added_items_count - 1} "
              f"after clicking Edit Item, but got {self.added_item_container.count()}.")
 
-        expect(self.supplier_dropdown).to_be_enabled() \
-            if self.added_item_container.count() == 0 \
-            else expect(self.supplier_dropdown).not_to_be_enabled()
-        expect(self.product_dropdown.locator("option:checked")).to_have_text(item_to_edit.name)
-        expect(self.product_unit_dropdown.locator("option:checked")).to_have_text(item_to_edit.unit['name'])
+        self.verify_form_state({
+            self.SUPPLIER_DROPDOWN: {"enabled": self.added_item_container.count() == 0},
+            self.PRODUCT_DROPDOWN: {"selected_text": item_to_edit.name},
+            self.UNIT_DROPDOWN: {"selected_text": item_to_edit.unit['name']},
+        })
         assert int(self.product_quantity_input.input_value()) == item_to_edit.quantity
         assert float(self.product_cost_input.input_value()) == float(item_to_edit.cost)
         assert (float(self.product_total_field.input_value()) ==
@@ -228,19 +367,15 @@ class NewPurchaseOrderPage(BasePage):
         test_context.preliminary_added_items_count = self.added_item_container.count()
 
         # Click on Delete Button for the first item in the list of added items
-        self.page.locator(self.ADDED_PRODUCT_DELETE_ACTION_BY_TITLE.format(item_to_delete.name)).click()
-
-        expect(self.supplier_dropdown).to_be_enabled() \
-            if self.added_item_container.count() == 0 \
-            else expect(self.supplier_dropdown).not_to_be_enabled()
-        expect(self.product_dropdown.locator("option:checked")).to_have_text("Select product")
-        expect(self.product_dropdown).to_be_enabled()
-        expect(self.product_unit_dropdown).not_to_be_enabled()
-        expect(self.product_quantity_input).to_be_enabled()
-        expect(self.product_quantity_input).to_have_value("")
-        expect(self.product_cost_input).to_be_enabled()
-        expect(self.product_cost_input).to_have_value("")
-        expect(self.product_cost_input).to_have_value("")
+        self.get_added_item_row(item_to_delete.name).locator(self.ADDED_ITEM_DELETE_BUTTON).click()
+
+        self.verify_form_state({
+            self.SUPPLIER_DROPDOWN: {"enabled": self.added_item_container.count() == 0},
+            self.PRODUCT_DROPDOWN: {"selected_text": "Select product", "enabled": True},
+            self.UNIT_DROPDOWN: {"enabled": False},
+            self.QUANTITY_INPUT: {"enabled": True, "value": ""},
+            self.COST_INPUT: {"enabled": True, "value": ""},
+        })
 
     def populate_new_purchase_order(self, purchase: Purchase):
         """
@@ -250,37 +385,32 @@ class NewPurchaseOrderPage(BasePage):
         :param purchase: the Purchase object providing the data that will be populated.
         """
 
-        expect(self.purchase_date_field).to_be_enabled()
-        expect(self.purchase_date_field).to_have_value(datetime.now().strftime("%Y-%m-%d"))
-        expect(self.purchase_type_dropdown).to_be_enabled()
-        expect(self.purchase_type_dropdown).to_have_value("invoice")
-        expect(self.purchase_reference_input).to_be_enabled()
-        expect(self.purchase_reference_input).to_be_empty()
-        expect(self.product_dropdown).not_to_be_enabled()
-        expect(self.product_unit_dropdown).to_be_enabled()
-        assert len(self.return_values_from_select(self.UNIT_DROPDOWN)) == 1
-        expect(self.product_quantity_input).to_be_enabled()
-        expect(self.product_quantity_input).to_be_empty()
-        expect(self.product_quantity_input).to_be_enabled()
-        expect(self.product_cost_input).to_be_empty()
-        expect(self.product_cost_input).to_be_enabled()
-        expect(self.product_total_field).to_be_empty()
-        expect(self.product_total_field).to_be_enabled()
-        expect(self.purchase_add_item_button).to_be_enabled()
-        expect(self.purchase_submit_button).to_be_enabled()
-        expect(self.purchase_save_as_draft_button).to_be_enabled()
-        expect(self.purchase_cancel_button).to_be_enabled()
-        expect(self.unify_items_checkbox).to_be_enabled()
-        expect(self.unify_items_checkbox).not_to_be_checked()
-        expect(self.items_list_container).to_be_empty()
-        expect(self.purchase_total_value).to_have_text("0.00")
+        self.verify_form_state({
+            self.PURCHASE_DATE_FIELD: {"enabled": True, "value": datetime.now().strftime("%Y-%m-%d")},
+            self.PURCHASE_TYPE_DROPDOWN: {"enabled": True, "value": "invoice"},
+            self.PURCHASE_REFERENCE_INPUT: {"enabled": True, "empty": True},
+            self.PRODUCT_DROPDOWN: {"enabled": False},
+            self.UNIT_DROPDOWN: {"enabled": True, "options_count": 1},
+            self.QUANTITY_INPUT: {"enabled": True, "empty": True},
+            self.COST_INPUT: {"enabled": True, "empty": True},
+            self.TOTAL_FIELD: {"enabled": True, "empty": True},
+            self.ADD_ITEM_BUTTON: {"enabled": True},
+            self.SUBMIT_BUTTON: {"enabled": True},
+            self.SAVE_AS_DRAFT_BUTTON: {"enabled": True},
+            self.CANCEL_BUTTON: {"enabled": True},
+            self.UNIFY_ITEMS_CHECKBOX: {"enabled": True, "checked": False},
+            self.ITEMS_LIST_CONTAINER: {"empty": True},
+            self.PURCHASE_TOTAL: {"text": "0.00"},
+        })
 
         # Start populating new Purchase Order fields
         if purchase.supplier['name'] is not None:
             self.select_supplier(purchase.supplier['name'])
-            expect(self.supplier_dropdown).to_be_enabled()
-            expect(self.product_dropdown).to_be_enabled()
-            expect(self.product_unit_dropdown).not_to_be_enabled()
+            self.verify_form_state({
+                self.SUPPLIER_DROPDOWN: {"enabled": True},
+                self.PRODUCT_DROPDOWN: {"enabled": True},
+                self.UNIT_DROPDOWN: {"enabled": False},
+            })
 
         if purchase.purchase_date is not None:
             self.type_purchase_date(purchase.purchase_date.strftime("%d%m%Y"))
@@ -293,11 +423,13 @@ class NewPurchaseOrderPage(BasePage):
 
         total_purchase_order_amount = 0
 
-        for product in purchase.products:
+        for index, product in enumerate(purchase.products, start=1):
             self.fill_purchase_product_details(product)
-            self.add_item(product)
+            self.add_item(product, expected_items_count=index)
             total_purchase_order_amount = total_purchase_order_amount + (float(product.quantity) * float(product.cost))
 
+        self.verify_added_items(purchase.products)
+
         assert self.purchase_total_value.inner_text() == "{:.2f}".format(total_purchase_order_amount), \
             f"Expected total Purchase Amount {":.2f".format(total_purchase_order_amount)} to equal Actual: {self.purchase_total_value.inner_text()}."
 
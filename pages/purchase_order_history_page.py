@@ -1,17 +1,57 @@
-from playwright.sync_api import Page
+from playwright.sync_api import Page, expect
 
+from modules.purchase_history_row import PurchaseHistoryRow
 from pages.base_page import BasePage
+from utils.locator_utils import Selector
 
 
 class PurchaseOrderHistoryPage(BasePage):
+    PURCHASE_ROWS = BasePage.TABLE_ROWS
+    REFERENCE_CELL = Selector("td:nth-child(1)", within=PURCHASE_ROWS)
+    TYPE_CELL = Selector("td:nth-child(2)", within=PURCHASE_ROWS)
+    SUPPLIER_CELL = Selector("td:nth-child(3)", within=PURCHASE_ROWS)
+    TOTAL_CELL = Selector("td:nth-child(4)", within=PURCHASE_ROWS)
+    PURCHASE_DATE_CELL = Selector("td:nth-child(5)", within=PURCHASE_ROWS)
+    CREATED_DATE_CELL = Selector("td:nth-child(6)", within=PURCHASE_ROWS)
 
     def __init__(self, page: Page):
         super().__init__(page)
-        self.last_created_purchase_order_row = page.locator("//tbody/tr[1]")
-        self.all_purchase_references = page.locator("//tbody/tr/td[1]")
-        self.last_created_purchase_reference = self.last_created_purchase_order_row.locator("xpath=./td[1]")
-        self.last_created_purchase_type = self.last_created_purchase_order_row.locator("xpath=./td[2]")
-        self.last_created_purchase_supplier = self.last_created_purchase_order_row.locator("xpath=./td[3]")
-        self.last_created_purchase_total = self.last_created_purchase_order_row.locator("xpath=./td[4]")
-        self.last_created_purchase_purchase_date = self.last_created_purchase_order_row.locator("xpath=./td[5]")
-        self.last_created_purchase_created_date = self.last_created_purchase_order_row.locator("xpath=./td[6]")
+        self.purchase_order_rows = page.locator(self.PURCHASE_ROWS)
+        self.all_purchase_references = self.purchase_order_rows.locator(self.REFERENCE_CELL)
+
+    def get_purchase_rows(self, start: int = 0, limit: int = None) -> list[PurchaseHistoryRow]:
+        """
+        The method is used to read the Purchase Order History table (or a window of its rows) in a single call.
+
+        :param start: index of the first row to read.
+        :param limit: maximum number of rows to read, all remaining rows when None.
+        :return: list of PurchaseHistoryRow records in the order they are displayed.
+        """
+        return [PurchaseHistoryRow.parse_cells_to_row(cells)
+                for cells in self.get_table_rows(self.PURCHASE_ROWS, start, limit)]
+
+    def index_purchases_by_reference(self, rows: list[PurchaseHistoryRow] = None) -> dict[str, PurchaseHistoryRow]:
+        """
+        The method is used to index the Purchase Order History rows by purchase reference.
+
+        :param rows: already read rows, the whole table is read when None.
+        :return: dictionary of purchase reference to PurchaseHistoryRow.
+        """
+        return {row.reference.strip(): row for row in (rows if rows is not None else self.get_purchase_rows())}
+
+    def get_purchase_by_reference(self, reference: str) -> PurchaseHistoryRow:
+        """
+        The method is used to find the Purchase Order History row of a purchase, waiting for it to be displayed.
+
+        :param reference: the purchase reference.
+        :return: the PurchaseHistoryRow of the purchase.
+        """
+        reference_cell = self.all_purchase_references.filter(has_text=self.exact_text_pattern(reference)).first
+        expect(reference_cell, f"Expected purchase {reference} to be listed on Purchase Order History page.") \
+            .to_be_attached()
+
+        purchases = self.index_purchases_by_reference()
+        assert reference.strip() in purchases, \
+            f"Expected purchase {reference} among the {len(purchases)} rows read from Purchase Order History page."
+
+        return purchases[reference.strip()]
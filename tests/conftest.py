@@ -1,9 +1,11 @@
+import json
 import logging
 import os
+import random
+import shutil
 from pathlib import Path
 
 import pytest
-import requests
 from dotenv import load_dotenv
 from playwright.sync_api import Error as PlaywrightError
 from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
@@ -14,10 +16,25 @@ from pages.login_page import LoginPage
 from pages.new_purchase_order_page import NewPurchaseOrderPage
 from pages.product_page import ProductPage
 from pages.purchase_order_history_page import PurchaseOrderHistoryPage
+from utils.artifact_utils import (ARTIFACT_RETENTION_MODES, DEFAULT_ARTIFACT_BUDGET_MB, DEFAULT_TRACE_BUFFER_MB,
+                                  SCREENSHOT_QUALITY, ArtifactWriter, ScenarioTracer)
+from utils.async_utils import AsyncScenarioRunner
+from utils.auth_utils import login_via_api, build_login_storage_state, AuthTokenCache
+from utils.browser_utils import BrowserContextPool, enable_fast_ui, get_launch_options, parse_browser_names
+from utils.har_utils import HAR_MODES, HarBackend
+from utils.network_utils import NetworkObserver
+from utils.route_utils import ResourceBlocker
+from utils.stub_server import StocktakeStubServer
+from utils.timing_utils import TimingPlugin
+from utils.trace_utils import TracePlugin
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 BASE_URL = "http://127.0.0.1:8000"
 LOGIN_STATE_FILE = ROOT_DIR / "login_state.json"
+TEST_USER_EMAIL = "test_user@gmail.com"
+TEST_USER_PASSWORD = "Test600!"
+ARTIFACTS_DIR = Path("test_artifacts")
+HAR_DIR = ARTIFACTS_DIR / "hars"
 
 logging.basicConfig(
     level=logging.DEBUG,
@@ -29,6 +46,141 @@ def pytest_addoption(parser):
     parser.addoption(
         "--headless", action="store_true", default=False, help="Run browser in headless mode"
     )
+    parser.addoption(
+        "--context-pool-size", action="store", type=int, default=1,
+        help="Number of browser contexts pre-warmed and kept per xdist worker; more than 1 only helps scenarios "
+             "which use several contexts at once"
+    )
+    parser.addoption(
+        "--login-mode", action="store", choices=["api", "ui"], default="api",
+        help="How @use_store_state scenarios are logged in: 'api' injects an API token into the storage state, "
+             "'ui' submits the login form"
+    )
+    parser.addoption(
+        "--fresh-reference-data", action="store_true", default=False,
+        help="Create a new product type, unit, group and supplier for every scenario instead of sharing them"
+    )
+    parser.addoption(
+        "--timing-report", action="store", default=None, metavar="DIR",
+        help="Record step, fixture and scenario timings and write the merged JSON/CSV report to DIR"
+    )
+    parser.addoption(
+        "--trace-timeline", action="store", default=None, metavar="PATH",
+        help="Record a Chrome trace-event timeline of the session, one track per xdist worker, to PATH"
+    )
+    parser.addoption(
+        "--latency-report", action="store", default=None, metavar="DIR",
+        help="Record the timing of every browser request to the app and write a per-endpoint latency report to DIR"
+    )
+    parser.addoption(
+        "--artifact-retention", action="store", choices=ARTIFACT_RETENTION_MODES, default="on-failure",
+        help="Which scenarios keep a Playwright trace: 'off' records none, 'on-failure' keeps failed scenarios only, "
+             "'always' keeps every scenario and records video as well"
+    )
+    parser.addoption(
+        "--trace-buffer-mb", action="store", type=float, default=DEFAULT_TRACE_BUFFER_MB,
+        help="Size in MB the temporary traces directory of a worker may grow to before it is emptied"
+    )
+    parser.addoption(
+        "--artifact-budget-mb", action="store", type=float, default=DEFAULT_ARTIFACT_BUDGET_MB,
+        help="Total size in MB the saved artifacts of all runs may take; the least recently used ones are evicted"
+    )
+    parser.addoption(
+        "--resource-profile", action="store", choices=["full", "lean", "strict"], default="full",
+        help="Which resources the browser skips: 'full' loads everything, 'lean' stubs images and drops fonts and "
+             "media, 'strict' also blocks third-party requests. Overridden by '@resources_<profile>' tags"
+    )
+    parser.addoption(
+        "--fast-ui", action="store_true", default=False,
+        help="Disable CSS transitions and animations in every scenario not tagged '@no_fast_ui'; "
+             "scenarios tagged '@fast_ui' get it without the option"
+    )
+    parser.addoption(
+        "--har-mode", action="store", choices=HAR_MODES, default="off",
+        help="'record' captures the app traffic of every feature to a HAR, 'replay' serves it from the HARs "
+             "instead of the backend. Only the browser traffic is recorded, so 'replay' seeds the test data through "
+             "the stub API (see --stub-api)"
+    )
+    parser.addoption(
+        "--stub-api", action="store_true", default=False,
+        help="Seed the test data through an in-memory stand-in of the Stocktake API instead of the real backend"
+    )
+    parser.addoption(
+        "--stub-api-latency", action="store", type=float, default=0.0, metavar="SECONDS",
+        help="Delay added to every response of the stub API"
+    )
+    parser.addoption(
+        "--stub-api-error-rate", action="store", type=float, default=0.0,
+        help="Probability, between 0 and 1, that a stub API request fails with 503"
+    )
+    parser.addoption(
+        "--browsers", action="store", type=parse_browser_names, default="chromium", metavar="NAMES",
+        help="Comma-separated browser engines (chromium, firefox, webkit) every UI scenario runs on. A worker runs "
+             "the sync scenarios on one engine after the other, use pytest-xdist to run them in parallel; only the "
+             "scenarios tagged '@all_browsers' run the engines concurrently, through the async runner. The engines "
+             "share the login state, auth token and seeded data of the session"
+    )
+    parser.addoption(
+        "--async-concurrency", action="store", type=int, default=4,
+        help="Number of scenarios the async runner drives at the same time, each in its own browser context"
+    )
+    parser.addoption(
+        "--har-dir", action="store", default=str(HAR_DIR), metavar="DIR",
+        help="Directory holding the feature HARs and the recorded login state, which holds a live session; keep it "
+             "out of version control"
+    )
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(
+        ArtifactWriter(ARTIFACTS_DIR / "runs", config.getoption("--artifact-budget-mb")), "artifact_writer")
+
+    timing_report_dir = config.getoption("--timing-report")
+    if timing_report_dir:
+        config.pluginmanager.register(TimingPlugin(Path(timing_report_dir)), "timing_plugin")
+
+    config.pluginmanager.register(
+        ResourceBlocker(BASE_URL, config.getoption("--resource-profile"), ARTIFACTS_DIR), "resource_blocker")
+
+    har_mode = config.getoption("--har-mode")
+    if har_mode != "off":
+        config.pluginmanager.register(HarBackend(har_mode, Path(config.getoption("--har-dir")), BASE_URL), "har_backend")
+
+    trace_timeline_path = config.getoption("--trace-timeline")
+    if trace_timeline_path:
+        config.pluginmanager.register(TracePlugin(Path(trace_timeline_path)), "trace_plugin")
+
+    latency_report_dir = config.getoption("--latency-report")
+    if latency_report_dir:
+        config.pluginmanager.register(NetworkObserver(BASE_URL, Path(latency_report_dir)), "network_observer")
+
+
+def pytest_generate_tests(metafunc):
+    browser_names = metafunc.config.getoption("--browsers")
+
+    # Only the UI scenarios use the engine (see tests/steps/conftest.py). The scenarios tagged @all_browsers drive
+    # every engine at once through the async runner, so they run a single time
+    is_matrix = metafunc.definition.get_closest_marker("all_browsers") is not None
+
+    if len(browser_names) > 1 and not is_matrix and "engine" in metafunc.fixturenames:
+        metafunc.parametrize("engine", browser_names, scope="session")
+
+
+def get_item_engine(config, item) -> str:
+    callspec = getattr(item, "callspec", None)
+    return (callspec.params.get("engine") if callspec else None) or config.getoption("--browsers")[0]
+
+
+def pytest_collection_modifyitems(config, items):
+    for item in items:
+        engine = get_item_engine(config, item)
+        if item.get_closest_marker(f"skip_{engine}"):
+            item.add_marker(pytest.mark.skip(reason=f"Tagged @skip_{engine}"))
+
+    # Run the scenarios one engine after the other, so that each engine's session-scoped browser is launched once;
+    # pytest's own grouping of the engine param is undone by the other params of a scenario, e.g. its examples
+    browser_names = config.getoption("--browsers")
+    items.sort(key=lambda item: browser_names.index(get_item_engine(config, item)))
 
 
 @pytest.fixture(scope="session")
@@ -54,44 +206,138 @@ def playwright_instance():
 
 
 @pytest.fixture(scope="session")
-def browser(playwright_instance, request) -> Browser:
+def traces_dir(tmp_path_factory) -> Path:
+    return tmp_path_factory.mktemp("traces")
+
+
+@pytest.fixture(scope="session")
+def engine(request) -> str:
+    # The browser engine of the scenario, parametrized by pytest_generate_tests when several --browsers are given.
+    # Not named browser_name, which is pytest-playwright's fixture and param
+    return request.config.getoption("--browsers")[0]
+
+
+@pytest.fixture(scope="session")
+def browser(playwright_instance, engine, traces_dir, request) -> Browser:
     headless = request.config.getoption("--headless")
-    browser = playwright_instance.chromium.launch(
-        headless=headless,
-        args=["--start-maximized"]
-    )
+    browser = getattr(playwright_instance, engine).launch(**get_launch_options(engine, headless, traces_dir=traces_dir))
     yield browser
     browser.close()
 
 
-@pytest.fixture
-def context(browser, request) -> BrowserContext:
-    video_dir = Path("test_artifacts/videos")
-    video_dir.mkdir(parents=True, exist_ok=True)
+@pytest.fixture(scope="session")
+def scenario_tracer(traces_dir, request) -> ScenarioTracer:
+    return ScenarioTracer(
+        request.config.getoption("--artifact-retention"),
+        traces_dir,
+        ARTIFACTS_DIR / "traces",
+        buffer_mb=request.config.getoption("--trace-buffer-mb")
+    )
+
+
+@pytest.fixture(scope="session")
+def context_pool(browser, request) -> BrowserContextPool:
+    context_options = {"no_viewport": True}
+
+    # Video cannot be switched on for a context once it exists, so it is only recorded when every scenario is
+    # retained; failed scenarios are covered by the screencast of their trace otherwise
+    if request.config.getoption("--artifact-retention") == "always":
+        video_dir = ARTIFACTS_DIR / "videos"
+        video_dir.mkdir(parents=True, exist_ok=True)
+        context_options["record_video_dir"] = str(video_dir)
+
+    pool = BrowserContextPool(
+        browser,
+        size=request.config.getoption("--context-pool-size"),
+        origins=[BASE_URL],
+        **context_options
+    )
+
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def async_runner(request) -> AsyncScenarioRunner:
+    # The engines are launched by the scenarios which use them, e.g. only firefox for a firefox-parametrized one
+    browser_names = request.config.getoption("--browsers")
+    headless = request.config.getoption("--headless")
+    runner = AsyncScenarioRunner(
+        browser_names,
+        concurrency=request.config.getoption("--async-concurrency"),
+        launch_options={browser_name: get_launch_options(browser_name, headless) for browser_name in browser_names},
+        context_options={"no_viewport": True}
+    ).start()
+    yield runner
+    runner.stop()
+
+
+@pytest.fixture(scope="session")
+def artifact_writer(request) -> ArtifactWriter:
+    return request.config.pluginmanager.get_plugin("artifact_writer")
 
+
+@pytest.fixture
+def context(context_pool, scenario_tracer, artifact_writer, request) -> BrowserContext:
     scenario_tags = request.node.get_closest_marker("use_store_state")
 
     request.node.use_state = scenario_tags is not None and LOGIN_STATE_FILE.exists()
 
-    context = browser.new_context(
-        record_video_dir=str(video_dir),
-        no_viewport=True,
-        storage_state=str(LOGIN_STATE_FILE) if request.node.use_state else None
-    )
+    storage_state = LOGIN_STATE_FILE if request.node.use_state else None
+
+    har_backend = request.config.pluginmanager.get_plugin("har_backend")
+    if har_backend and har_backend.mode == "record":
+        context = har_backend.new_recording_context(context_pool, request.node, storage_state)
+    else:
+        context = context_pool.acquire(storage_state=storage_state)
+        if har_backend:
+            har_backend.replay(context, request.node)
+
+    network_observer = request.config.pluginmanager.get_plugin("network_observer")
+    if network_observer:
+        network_observer.attach(context)
+
+    resource_blocker = request.config.pluginmanager.get_plugin("resource_blocker")
+    resource_blocker.attach(context, resource_blocker.get_profile(request.node))
+
+    scenario_tracer.start(context, title=request.node.nodeid)
 
     yield context
-    context.close()
+
+    reports = (getattr(request.node, f"rep_{when}", None) for when in ("setup", "call"))
+    failed = any(report is not None and report.failed for report in reports)
+    trace_path = scenario_tracer.stop(context, request.node.name, failed)
+    if trace_path:
+        artifact_writer.save_file("traces", request.node.name, trace_path)
+        print(f"[TRACE] Queued for: {artifact_writer.run_dir}")
+
+    resource_blocker.detach(context)
+    if network_observer:
+        network_observer.detach(context)
+
+    if har_backend and har_backend.mode == "record":
+        # Closing the context writes the scenario's HAR
+        context.close()
+    else:
+        context_pool.release(context)
 
 
 @pytest.fixture
-def page(context, request) -> Page:
+def page(context, artifact_writer, request) -> Page:
     page = context.new_page()
 
-    if request.node.use_state:
+    request.node.fast_ui = request.node.get_closest_marker("fast_ui") is not None or (
+        request.config.getoption("--fast-ui") and request.node.get_closest_marker("no_fast_ui") is None)
+    if request.node.fast_ui:
+        enable_fast_ui(page)
+
+    if request.node.use_state and request.config.getoption("--login-mode") == "api":
+        page.goto(BASE_URL)
+    elif request.node.use_state:
         page.goto(BASE_URL + "/login")
-        page.fill("#email", "test_user@gmail.com")
-        page.fill("#password", "Test600!")
-        page.click("//button[@type='submit' and text()='Login']")
+        page.fill(LoginPage.EMAIL_FIELD, TEST_USER_EMAIL)
+        page.fill(LoginPage.PASSWORD_FIELD, TEST_USER_PASSWORD)
+        page.click(LoginPage.SUBMIT_BUTTON)
     else:
         page.goto(BASE_URL + "/login")
 
@@ -101,6 +347,11 @@ def page(context, request) -> Page:
     yield page
     page.close()
 
+    # Video is only recorded when every scenario is retained and is complete once its page is closed
+    if page.video:
+        artifact_writer.save_file("videos", request.node.name, Path(page.video.path()))
+        print(f"[VIDEO] Queued for: {artifact_writer.run_dir}")
+
 
 # def pytest_bdd_before_scenario(request, scenario):
 #     if "use_"
@@ -111,17 +362,29 @@ def generate_login_state(playwright_instance, request):
     if LOGIN_STATE_FILE.exists():
         return
 
+    har_backend = request.config.pluginmanager.get_plugin("har_backend")
+    if har_backend and har_backend.mode == "replay":
+        shutil.copyfile(har_backend.login_state_file, LOGIN_STATE_FILE)
+        print(f"[STATE CREATED] Recorded login state copied to: {LOGIN_STATE_FILE}")
+        return
+
+    if request.config.getoption("--login-mode") == "api":
+        response = login_via_api(BASE_URL, TEST_USER_EMAIL, TEST_USER_PASSWORD)
+        LOGIN_STATE_FILE.write_text(json.dumps(build_login_storage_state(BASE_URL, response)))
+        print(f"[STATE CREATED] API login state saved to: {LOGIN_STATE_FILE}")
+        return
+
     headless = request.config.getoption("--headless")
 
-    browser = playwright_instance.chromium.launch(headless=headless)
+    browser = getattr(playwright_instance, request.config.getoption("--browsers")[0]).launch(headless=headless)
     context = browser.new_context()
     page = context.new_page()
 
     # Perform login manually
     page.goto(BASE_URL + "/login")
-    page.fill("#email", "test_user@gmail.com")
-    page.fill("#password", "Test600!")
-    page.click("//button[@type='submit' and text()='Login']")
+    page.fill(LoginPage.EMAIL_FIELD, TEST_USER_EMAIL)
+    page.fill(LoginPage.PASSWORD_FIELD, TEST_USER_PASSWORD)
+    page.click(LoginPage.SUBMIT_BUTTON)
 
     # Save login state
     context.storage_state(path=LOGIN_STATE_FILE)
@@ -131,6 +394,14 @@ def generate_login_state(playwright_instance, request):
     browser.close()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def keep_login_state_with_har(generate_login_state, request):
+    har_backend = request.config.pluginmanager.get_plugin("har_backend")
+    if har_backend and har_backend.mode == "record" and LOGIN_STATE_FILE.exists():
+        har_backend.har_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(LOGIN_STATE_FILE, har_backend.login_state_file)
+
+
 def save_login_state(page: Page):
     page.context.storage_state(path=LOGIN_STATE_FILE)
     print(f"[STATE SAVED] Login state saved to {LOGIN_STATE_FILE}")
@@ -142,7 +413,13 @@ def pytest_sessionfinish(session, exitstatus):
         print(f"[CLEANUP] Deleted login state file: {LOGIN_STATE_FILE}")
 
 
+@pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
+    hook_outcome = yield
+    report = hook_outcome.get_result()
+    # Kept on the item, so that fixtures can tell at teardown whether the scenario failed
+    setattr(item, f"rep_{report.when}", report)
+
     if call.when == "call":
         outcome = call.excinfo
         test_name = item.name
@@ -150,31 +427,25 @@ def pytest_runtest_makereport(item, call):
         page = item.funcargs.get("page")
 
         if outcome is not None:
-            # Test failed
+            # Test failed, capture the screenshot and leave compressing and writing it to the artifact writer
             if context and page:
-                screenshot_dir = Path("test_artifacts/screenshots")
-                screenshot_dir.mkdir(parents=True, exist_ok=True)
-
-                screenshot_path = screenshot_dir / f"{test_name}.png"
+                artifact_writer = item.config.pluginmanager.get_plugin("artifact_writer")
                 try:
-                    page.screenshot(path=str(screenshot_path))
-                    print(f"[SCREENSHOT] Saved to: {screenshot_path}")
+                    screenshot = page.screenshot(type="jpeg", quality=SCREENSHOT_QUALITY)
+                    artifact_writer.save_screenshot(test_name, screenshot)
+                    print(f"[SCREENSHOT] Queued for: {artifact_writer.run_dir}")
                 except PlaywrightError as e:
                     print(f"[ERROR] Failed to take screenshot: {e}")
 
-                try:
-                    video_path = page.video.path()
-                    print(f"[VIDEO] Saved to: {video_path}")
-                except (AttributeError, PlaywrightError) as e:
-                    print(f"[ERROR] Could not retrieve video path: {e}")
-        else:
-            # Test passed, clean up video if it exists
-            try:
-                video_path = page.video.path()
-                if video_path and os.path.exists(video_path):
-                    os.remove(video_path)
-            except (AttributeError, PlaywrightError, FileNotFoundError) as e:
-                print(f"[INFO] Skipping video cleanup: {e}")
+
+@pytest.fixture
+def scenario_random(request) -> random.Random:
+    """
+    The random generator of the scenario's generated names and values. It is only seeded when recording or replaying
+    HARs, where the names have to match the ones in the recording.
+    """
+    har_backend = request.config.pluginmanager.get_plugin("har_backend")
+    return random.Random(har_backend.scenario_seed(request.node) if har_backend else None)
 
 
 @pytest.fixture
@@ -189,23 +460,50 @@ def test_context():
     return Ctx()
 
 
-@pytest.fixture
-def auth_headers():
-    login_url = f"{BASE_URL}/auth/login"
-    credentials = {
-        "email": "test_user@gmail.com",
-        "password": "Test600!"
-    }
+@pytest.fixture(scope="session")
+def stub_api(request):
+    # A replay has no backend to seed the test data through
+    if not request.config.getoption("--stub-api") and request.config.getoption("--har-mode") != "replay":
+        yield None
+        return
 
-    response = requests.post(login_url, json=credentials)
-    assert response.status_code == 200, f"Login failed: {response.text}"
+    server = StocktakeStubServer(
+        users={TEST_USER_EMAIL: TEST_USER_PASSWORD},
+        latency=request.config.getoption("--stub-api-latency"),
+        error_rate=request.config.getoption("--stub-api-error-rate"),
+        seed=0
+    ).start()
+    # Picked up by get_api_client(), which cannot be imported here without a circular import
+    os.environ["STOCKTAKE_API_BASE_URL"] = server.base_url
 
-    token = response.json().get("access_token")
-    assert token, "No access token returned"
+    yield server
 
-    return {
-        "Authorization": f"Bearer {token}"
-    }
+    os.environ.pop("STOCKTAKE_API_BASE_URL", None)
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def api_base_url(stub_api) -> str:
+    return stub_api.base_url if stub_api else BASE_URL
+
+
+@pytest.fixture(scope="session")
+def auth_token_cache(api_base_url, tmp_path_factory, request) -> AuthTokenCache:
+    workerinput = getattr(request.config, "workerinput", None)
+    if workerinput:
+        # The parent of a worker's base temp directory is shared by all xdist workers of the run
+        cache_file = tmp_path_factory.getbasetemp().parent / f"auth_token_cache-{workerinput['testrunuid']}.json"
+    else:
+        # The parent is shared by every run of the user otherwise, so the token stays with the run
+        cache_file = tmp_path_factory.getbasetemp() / "auth_token_cache.json"
+
+    return AuthTokenCache(api_base_url, TEST_USER_EMAIL, TEST_USER_PASSWORD, cache_file)
+
+
+@pytest.fixture
+def auth_headers(auth_token_cache) -> AuthTokenCache:
+    # Passed to the API helpers as is, so that a rejected token is renewed and the request retried
+    return auth_token_cache
 
 
 @pytest.fixture(scope="function")
@@ -4,4 +4,9 @@ Feature: Main dashboard functionalities
   Scenario: All dashboard sections enabled
     Given user is on dashboard page
     When the user inspects the following sections
-    Then they are all visible and enabled
\ No newline at end of file
+    Then they are all visible and enabled
+
+  @all_browsers
+  Scenario: All dashboard sections enabled in concurrent sessions
+    When 4 sessions inspect the dashboard sections concurrently
+    Then they are all visible and enabled in every session
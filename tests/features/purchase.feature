@@ -1,4 +1,5 @@
-@use_store_state
+# Fast UI is the default of the feature: every scenario opens the side-menu submenu, which is clicked without force
+@use_store_state @fast_ui
 Feature: Purchase functionalities
   As a stocktake user
   I want to be able to get, create, edit, delete purchases
@@ -22,6 +23,14 @@ Feature: Purchase functionalities
     And the user saves the Purchase Order as Draft
     Then the new Purchase Order is successfully saved as Draft
 
+  @large_purchase
+  Scenario: Create new purchase order with many items
+    Given 200 products are created
+    And the user opens the new purchase order modal
+    When the user populates all Purchase Order fields
+    And the user submits the Purchase Order
+    Then the new Purchase Order is created successfully
+
   Scenario: Unify same items on new purchase order
     Given 2 identical products are created
     And 1 another product is created
@@ -0,0 +1,8 @@
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def scenario_engine(engine) -> str:
+    # The steps request the browser lazily, so the engine is only part of the fixture closure the --browsers
+    # parametrization is based on when every scenario uses it
+    return engine
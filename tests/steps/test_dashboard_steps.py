@@ -1,9 +1,9 @@
 import logging
 
-from playwright.sync_api import expect
-from pytest_bdd import given, scenarios, when, then
+from pytest_bdd import given, parsers, scenarios, when, then
 
-from tests.conftest import ROOT_DIR
+from pages.aio.dashboard_page import AsyncDashboardPage
+from tests.conftest import BASE_URL, LOGIN_STATE_FILE, ROOT_DIR
 
 scenarios(ROOT_DIR / "tests" / "features" / "dashboard.feature")
 
@@ -16,26 +16,28 @@ def dummy_test_step():
 
 @then("they are all visible and enabled")
 def verify_dashboard_buttons_visible_enabled(dashboard_page):
-    expect(dashboard_page.toggle_side_menu_button).to_be_visible()
-    expect(dashboard_page.toggle_side_menu_button).to_be_enabled()
-    expect(dashboard_page.stocktake_side_menu_button).to_be_visible()
-    expect(dashboard_page.stocktake_side_menu_button).to_be_enabled()
-    expect(dashboard_page.new_product_side_menu_button).to_be_visible()
-    expect(dashboard_page.new_product_side_menu_button).to_be_enabled()
-    expect(dashboard_page.transfers_side_menu_button).to_be_visible()
-    expect(dashboard_page.transfers_side_menu_button).to_be_enabled()
-    expect(dashboard_page.requests_side_menu_button).to_be_visible()
-    expect(dashboard_page.requests_side_menu_button).to_be_enabled()
-    expect(dashboard_page.purchase_orders_side_menu_button).to_be_visible()
-    expect(dashboard_page.purchase_orders_side_menu_button).to_be_enabled()
-    dashboard_page.purchase_orders_side_menu_button.click()
-    expect(dashboard_page.new_purchase_order_side_menu_button).to_be_visible()
-    expect(dashboard_page.new_purchase_order_side_menu_button).to_be_enabled()
-    expect(dashboard_page.draft_purchase_orders_side_menu_button).to_be_visible()
-    expect(dashboard_page.draft_purchase_orders_side_menu_button).to_be_enabled()
-    expect(dashboard_page.purchase_orders_history_side_menu_button).to_be_visible()
-    expect(dashboard_page.purchase_orders_history_side_menu_button).to_be_enabled()
-    expect(dashboard_page.stores_side_menu_button).to_be_visible()
-    expect(dashboard_page.stores_side_menu_button).to_be_enabled()
-    expect(dashboard_page.logout_side_menu_button).to_be_visible()
-    expect(dashboard_page.logout_side_menu_button).to_be_enabled()
+    dashboard_page.verify_side_menu_sections()
+
+
+@when(parsers.parse("{sessions:d} sessions inspect the dashboard sections concurrently"),
+      target_fixture="concurrent_dashboard_sections")
+def inspect_dashboard_sections_concurrently(async_runner, engine, request, sessions: int):
+    async def inspect_dashboard_sections(page):
+        await page.goto(BASE_URL)
+        dashboard_page = AsyncDashboardPage(page)
+
+        return await dashboard_page.verify_side_menu_sections()
+
+    if request.node.get_closest_marker("all_browsers"):
+        results = async_runner.run_matrix(inspect_dashboard_sections, storage_state=LOGIN_STATE_FILE,
+                                          sessions=sessions)
+        return [result for engine_results in results.values() for result in engine_results]
+
+    return async_runner.run_scenarios([inspect_dashboard_sections] * sessions, storage_state=LOGIN_STATE_FILE,
+                                      browser_name=engine)
+
+
+@then("they are all visible and enabled in every session")
+def verify_dashboard_sections_in_every_session(concurrent_dashboard_sections):
+    assert concurrent_dashboard_sections and all(concurrent_dashboard_sections), \
+        f"Expected every session to inspect the dashboard sections, but got {concurrent_dashboard_sections}."
@@ -1,6 +1,6 @@
 import logging
-import random
 
+from playwright.sync_api import expect
 from pytest_bdd import given, scenarios, when, then, parsers
 
 from modules.product import Product
@@ -21,15 +21,15 @@ def dummy_test_step_no_params():
 
 @given("there is an existing product type")
 @when("the user submits the type form after filling correctly all required fields")
-def submit_after_filling_the_new_product_type_form(test_context, product_page):
+def submit_after_filling_the_new_product_type_form(test_context, product_page, scenario_random):
     logging.info("Navigate to submodule from the Product Module from the Dashboard.")
     product_page.new_product_side_menu_button.click()
 
     logging.info("Populate the New Type fields and Submit the Create Product Type form.")
 
     product_type = ProductType(
-        name=f"Test Type ({random.randint(10000, 99999)})",
-        description=f"Test Type Description ({random.randint(10000, 99999)})"
+        name=f"Test Type ({scenario_random.randint(10000, 99999)})",
+        description=f"Test Type Description ({scenario_random.randint(10000, 99999)})"
     )
 
     product_page.create_new_type(product_type)
@@ -39,16 +39,16 @@ def submit_after_filling_the_new_product_type_form(test_context, product_page):
 
 @given("there is an existing product unit")
 @when("the user submits the unit form after filling correctly all required fields")
-def submit_after_filling_the_new_product_unit_form(test_context, product_page):
+def submit_after_filling_the_new_product_unit_form(test_context, product_page, scenario_random):
     logging.info("Navigate to submodule from the Product Module from the Dashboard.")
     product_page.new_product_side_menu_button.click()
 
     logging.info("Populate the New Unit fields and Submit the Create Product Unit form.")
 
     product_unit = ProductUnit(
-        name=f"Test Unit ({random.randint(10000, 99999)})",
-        unit_yield=float(random.randint(1, 100)),
-        description=f"Test Unit Description ({random.randint(10000, 99999)})"
+        name=f"Test Unit ({scenario_random.randint(10000, 99999)})",
+        unit_yield=float(scenario_random.randint(1, 100)),
+        description=f"Test Unit Description ({scenario_random.randint(10000, 99999)})"
     )
 
     product_page.create_new_unit(product_unit)
@@ -58,15 +58,15 @@ def submit_after_filling_the_new_product_unit_form(test_context, product_page):
 
 @given("there is an existing product group")
 @when("the user submits the group form after filling correctly all required fields")
-def submit_after_filling_the_new_product_group_form(test_context, product_page):
+def submit_after_filling_the_new_product_group_form(test_context, product_page, scenario_random):
     logging.info("Navigate to submodule from the Product Module from the Dashboard.")
     product_page.new_product_side_menu_button.click()
 
     logging.info("Populate the New Group fields and Submit the Create Product Group form.")
 
     product_group = ProductGroup(
-        name=f"Test Group ({random.randint(10000, 99999)})",
-        description=f"Test Group Description ({random.randint(10000, 99999)})"
+        name=f"Test Group ({scenario_random.randint(10000, 99999)})",
+        description=f"Test Group Description ({scenario_random.randint(10000, 99999)})"
     )
 
     product_page.create_new_group(product_group)
@@ -76,15 +76,15 @@ def submit_after_filling_the_new_product_group_form(test_context, product_page):
 
 @given("there is an existing product supplier")
 @when("the user submits the supplier form after filling correctly all required fields")
-def submit_after_filling_the_new_product_supplier_form(test_context, product_page):
+def submit_after_filling_the_new_product_supplier_form(test_context, product_page, scenario_random):
     logging.info("Navigate to submodule from the Product Module from the Dashboard.")
     product_page.new_product_side_menu_button.click()
 
     logging.info("Populate the New Supplier fields and Submit the Create Product Supplier form.")
 
     product_supplier = ProductSupplier(
-        name=f"Test Supplier ({random.randint(10000, 99999)})",
-        email=f"test_supplier_{random.randint(10000, 99999)}@gmail.com"
+        name=f"Test Supplier ({scenario_random.randint(10000, 99999)})",
+        email=f"test_supplier_{scenario_random.randint(10000, 99999)}@gmail.com"
     )
 
     product_page.create_new_supplier(product_supplier)
@@ -93,14 +93,14 @@ def submit_after_filling_the_new_product_supplier_form(test_context, product_pag
 
 
 @when("the user submits the product form after filling correctly all required fields")
-def submit_after_filling_the_new_product_supplier_form(test_context, product_page):
+def submit_after_filling_the_new_product_supplier_form(test_context, product_page, scenario_random):
     logging.info("Navigate to submodule from the Product Module from the Dashboard.")
     product_page.new_product_side_menu_button.click()
 
     logging.info("Populate the New Product fields and Submit the Create Product form.")
 
     product = Product(
-        name=f"Test Product ({random.randint(10000, 99999)})",
+        name=f"Test Product ({scenario_random.randint(10000, 99999)})",
         type=test_context.product_type.name,
         unit=test_context.product_unit.name,
         group=test_context.product_group.name,
@@ -125,7 +125,8 @@ def validate_new_product_type_exists_in_the_new_product_module(test_context, pro
 
     product_page.new_product_side_menu_button.click()
 
-    existing_product_types = product_page.return_values_from_select(product_page.PRODUCT_TYPE_DROPDOWN_SELECTOR)
+    existing_product_types = product_page.return_values_from_select(product_page.PRODUCT_TYPE_DROPDOWN_SELECTOR,
+                                                                    contains=product_type.name)
 
     assert product_type.name in existing_product_types, (
         f"Expected product type '{product_type.name}' to be in the list of existing product types:\n {existing_product_types}.")
@@ -144,7 +145,8 @@ def validate_new_product_unit_exists_in_the_new_product_module(test_context, pro
 
     product_page.new_product_side_menu_button.click()
 
-    existing_product_units = product_page.return_values_from_select(product_page.PRODUCT_UNIT_DROPDOWN_SELECTOR)
+    existing_product_units = product_page.return_values_from_select(product_page.PRODUCT_UNIT_DROPDOWN_SELECTOR,
+                                                                    contains=product_unit.name)
 
     assert product_unit.name in existing_product_units, (
         f"Expected product unit '{product_unit.name}' to be in the list of existing product units:\n {existing_product_units}.")
@@ -163,7 +165,8 @@ def validate_new_product_group_exists_in_the_new_product_module(test_context, pr
 
     product_page.new_product_side_menu_button.click()
 
-    existing_product_groups = product_page.return_values_from_select(product_page.PRODUCT_GROUP_DROPDOWN_SELECTOR)
+    existing_product_groups = product_page.return_values_from_select(product_page.PRODUCT_GROUP_DROPDOWN_SELECTOR,
+                                                                     contains=product_group.name)
 
     assert product_group.name in existing_product_groups, (
         f"Expected product group '{product_group.name}' to be in the list of existing product groups:\n {existing_product_groups}.")
@@ -183,7 +186,8 @@ def validate_new_product_supplier_exists_in_the_new_product_module(test_context,
 
     product_page.new_product_side_menu_button.click()
 
-    existing_product_suppliers = product_page.return_values_from_select(product_page.PRODUCT_SUPPLIER_DROPDOWN_SELECTOR)
+    existing_product_suppliers = product_page.return_values_from_select(product_page.PRODUCT_SUPPLIER_DROPDOWN_SELECTOR,
+                                                                        contains=product_supplier.name)
 
     assert product_supplier.name in existing_product_suppliers, (
         f"Expected product supplier '{product_supplier.name}' to be in the list of existing product supplier:\n {existing_product_suppliers}.")
@@ -196,16 +200,16 @@ def validate_new_product_is_created_successfully(test_context, product_page, das
         f"Validate the New Product {product.name} created successfully.")
 
     expected_success_message = "Product created successfully!"
-    product_page.page.wait_for_timeout(500)
-    actual_success_message = product_page.success_message.inner_text()
 
-    assert actual_success_message == expected_success_message, (
-        f"Expected {expected_success_message} message to be displayed, but got {actual_success_message}.")
+    # The message of the previously created supplier is replaced once the product response is handled
+    expect(product_page.success_message,
+           f"Expected {expected_success_message} message to be displayed").to_have_text(expected_success_message)
 
     # Navigate to Create New Purchase module, in order to verify New Product exists.
     dashboard_page.navigate_to_new_purchase_order_from_dashboard()
     new_purchase_order_page.supplier_dropdown.select_option(product.supplier)
-    existing_products = new_purchase_order_page.return_values_from_select(new_purchase_order_page.PRODUCT_DROPDOWN)
+    existing_products = new_purchase_order_page.return_values_from_select(new_purchase_order_page.PRODUCT_DROPDOWN,
+                                                                          contains=product.name)
 
     assert product.name in existing_products, (
         f"Expected product '{product.name}' to be in the list of existing products:\n {existing_products}.")
@@ -1,85 +1,76 @@
 import logging
-import random
 from datetime import datetime
 
+import pytest
 from playwright.sync_api import expect
 from pytest_bdd import given, then, parsers, when, scenarios
 
 from modules.product import Product
 from modules.purchase import Purchase
 from tests.conftest import ROOT_DIR
-from utils.api_utils import create_new_type_via_api_call, create_new_unit_via_api_call, create_new_group_via_api_call, \
-    create_new_supplier_via_api_call, create_new_product_via_api_call
+from utils.api_utils import create_products_via_api_calls, create_reference_data_via_api_calls
 from utils.helpers import format_to_two_decimal_string
 
 scenarios(ROOT_DIR / "tests" / "features" / "purchase.feature")
 
 
+@pytest.fixture(scope="session")
+def shared_reference_data(auth_token_cache) -> dict:
+    logging.info("Create shared product type, unit, group and supplier for the worker session")
+    return create_reference_data_via_api_calls(auth_token_cache)
+
+
+@pytest.fixture
+def reference_data(request, auth_headers, scenario_random) -> dict:
+    """
+    The ids of the product type, unit, group and supplier the scenario products are attached to.
+    They are created once per worker session, or per scenario when running with --fresh-reference-data or with HARs,
+    whose recorded names must not depend on which scenario of the worker ran first.
+    """
+    fresh = request.config.getoption("--fresh-reference-data") or request.config.getoption("--har-mode") != "off"
+    if fresh:
+        return create_reference_data_via_api_calls(auth_headers, scenario_random)
+
+    return request.getfixturevalue("shared_reference_data")
+
+
 @given("user is on dashboard page")
 def dummy_test_step_no_params():
     logging.info("Executing dummy test step no params.")
 
 
 @given(parsers.re("(?P<products>\d+) product(?:s)? (?:is|are) created"))
-def create_number_of_products(auth_headers, test_context, products):
+def create_number_of_products(auth_headers, reference_data, test_context, scenario_random, products):
     logging.info(f"Create preliminary product data - {products} products")
 
-    type_id = create_new_type_via_api_call(auth_headers).json()["new_id"]
-    unit_id = create_new_unit_via_api_call(auth_headers).json()["new_id"]
-    group_id = create_new_group_via_api_call(auth_headers).json()["new_id"]
-    supplier_id = create_new_supplier_via_api_call(auth_headers).json()["new_id"]
-
-    products_list = []
-
-    for _ in range(int(products)):
-        payload = {
-            "name": f"Test_product_{random.randint(100000, 999999)}",
-            "type_id": type_id,
-            "unit_id": unit_id,
-            "group_id": group_id,
-            "supplier_id": supplier_id
-        }
-
-        response = create_new_product_via_api_call(auth_headers, payload)
-
-        products_list.append(Product.parse_response_to_product(response))
+    numbers = scenario_random.sample(range(100000, 1000000), int(products))
+    product_names = [f"Test_product_{number}" for number in numbers]
 
-    test_context.products_list = products_list
+    test_context.products_list = create_products_via_api_calls(auth_headers, product_names, reference_data)
 
 
 @given(parsers.parse("{products: d} identical products are created"))
 @given(parsers.parse("{products: d} another product is created"))
-def create_number_of_identical_products(auth_headers, test_context, products):
+def create_number_of_identical_products(auth_headers, reference_data, test_context, scenario_random, products):
     logging.info(f"Create preliminary product data - {products} products")
 
     if getattr(test_context, "products_list", None) is None:
         test_context.products_list = []
 
-    type_id = create_new_type_via_api_call(auth_headers).json()["new_id"] if test_context.products_list == [] else \
-        test_context.products_list[0].type['id']
-    unit_id = create_new_unit_via_api_call(auth_headers).json()["new_id"] if test_context.products_list == [] else \
-        test_context.products_list[0].unit['id']
-    group_id = create_new_group_via_api_call(auth_headers).json()["new_id"] if test_context.products_list == [] else \
-        test_context.products_list[0].group['id']
-    supplier_id = create_new_supplier_via_api_call(auth_headers).json()[
-        "new_id"] if test_context.products_list == [] else test_context.products_list[0].supplier['id']
-
-    random_number = random.randint(100000, 999999)
-    random_quantity = random.randint(1, 10)
-    random_cost = "{:.2f}".format(random.randint(1, 10))
-
-    for _ in range(products):
-        payload = {
-            "name": f"Test_product_{random_number}",
-            "type_id": type_id,
-            "unit_id": unit_id,
-            "group_id": group_id,
-            "supplier_id": supplier_id
-        }
-
-        response = create_new_product_via_api_call(auth_headers, payload)
-
-        intermid_product = Product.parse_response_to_product(response)
+    reference_ids = reference_data if test_context.products_list == [] else {
+        "type_id": test_context.products_list[0].type['id'],
+        "unit_id": test_context.products_list[0].unit['id'],
+        "group_id": test_context.products_list[0].group['id'],
+        "supplier_id": test_context.products_list[0].supplier['id'],
+    }
+
+    random_number = scenario_random.randint(100000, 999999)
+    random_quantity = scenario_random.randint(1, 10)
+    random_cost = "{:.2f}".format(scenario_random.randint(1, 10))
+
+    product_names = [f"Test_product_{random_number}"] * products
+
+    for intermid_product in create_products_via_api_calls(auth_headers, product_names, reference_ids):
         intermid_product.cost = random_cost
         intermid_product.quantity = random_quantity
 
@@ -87,30 +78,33 @@ def create_number_of_identical_products(auth_headers, test_context, products):
 
 
 @given("the user opens the new purchase order modal")
-def open_new_purchase_modal(dashboard_page):
+def open_new_purchase_modal(dashboard_page, request):
     logging.info("Open new purchase order modal")
+    # The submenu is only stable without its animation, otherwise the clicks skip the actionability checks
+    force = not request.node.fast_ui
+
     expect(dashboard_page.purchase_orders_side_menu_button).to_be_visible(timeout=5000)
     expect(dashboard_page.purchase_orders_side_menu_button).to_be_enabled(timeout=5000)
     dashboard_page.purchase_orders_side_menu_button.hover()
-    dashboard_page.purchase_orders_side_menu_button.click(force=True)
-    dashboard_page.new_purchase_order_side_menu_button.click(force=True)
+    dashboard_page.purchase_orders_side_menu_button.click(force=force)
+    dashboard_page.new_purchase_order_side_menu_button.click(force=force)
 
 
 @given("the user populates all Purchase Order fields")
 @when("the user populates all Purchase Order fields")
-def populate_new_po_fields(new_purchase_order_page, test_context):
+def populate_new_po_fields(new_purchase_order_page, test_context, scenario_random):
     logging.info("Populate new Purchase Order fields")
 
     # Set the quantity and cost for each product in the product list
     for product in test_context.products_list:
-        product.quantity = random.randint(1, 20) if product.quantity is None else product.quantity
-        product.cost = float(random.randint(1, 10000) / 100) if product.cost is None else product.cost
+        product.quantity = scenario_random.randint(1, 20) if product.quantity is None else product.quantity
+        product.cost = float(scenario_random.randint(1, 10000) / 100) if product.cost is None else product.cost
 
     purchase = Purchase(
         supplier=test_context.products_list[0].supplier,
         purchase_date=datetime.now(),
         purchase_type="Invoice",
-        reference=f"INV_{random.randint(10000, 99999)}_{datetime.now()}",
+        reference=f"INV_{scenario_random.randint(10000, 99999)}_{datetime.now()}",
         products=test_context.products_list,
         unify_same_items=True
     )
@@ -122,19 +116,20 @@ def populate_new_po_fields(new_purchase_order_page, test_context):
 
 @given(parsers.parse("the user populates all Purchase Order fields without {empty_field}"))
 @when(parsers.parse("the user populates all Purchase Order fields without {empty_field}"))
-def populate_new_po_fields_without_one(new_purchase_order_page, test_context, empty_field: str):
+def populate_new_po_fields_without_one(new_purchase_order_page, test_context, scenario_random, empty_field: str):
     logging.info(f"Populate new Purchase Order fields without {empty_field}")
 
     # Set the quantity and cost for each product in the product list
     for product in test_context.products_list:
-        product.quantity = random.randint(1, 20) if product.quantity is None else product.quantity
-        product.cost = float(random.randint(1, 10000) / 100) if product.cost is None else product.cost
+        product.quantity = scenario_random.randint(1, 20) if product.quantity is None else product.quantity
+        product.cost = float(scenario_random.randint(1, 10000) / 100) if product.cost is None else product.cost
 
     purchase = Purchase(
         supplier=test_context.products_list[0].supplier if empty_field != "supplier" else None,
         purchase_date=datetime.now() if empty_field != "purchase date" else None,
         purchase_type="Invoice" if empty_field != "purchase type" else None,
-        reference=f"INV_{random.randint(10000, 99999)}_{datetime.now()}" if empty_field != "reference" else None,
+        reference=(f"INV_{scenario_random.randint(10000, 99999)}_{datetime.now()}"
+                   if empty_field != "reference" else None),
         products=test_context.products_list,
         unify_same_items=True
     )
@@ -156,7 +151,9 @@ def delete_added_item_from_current_purchase(test_context, new_purchase_order_pag
 
 @when("the user submits the Purchase Order")
 def submit_purchase_order(test_context, new_purchase_order_page):
-    new_purchase_order_page.submit_purchase(test_context.new_purchase.reference)
+    # A purchase without reference is rejected, so there is no successful response to wait for
+    new_purchase_order_page.submit_purchase(test_context.new_purchase.reference,
+                                            wait_for_response=test_context.new_purchase.reference is not None)
 
 
 @when("the user saves the Purchase Order as Draft")
@@ -195,15 +192,17 @@ def select_unify_same_items_checkbox(test_context, new_purchase_order_page):
 def validate_new_purchase_order_created(dashboard_page, purchase_order_history_page, test_context):
     dashboard_page.purchase_orders_history_side_menu_button.click()
 
-    actual_reference = purchase_order_history_page.last_created_purchase_reference.inner_text()
-    actual_type = purchase_order_history_page.last_created_purchase_type.inner_text()
-    actual_supplier = purchase_order_history_page.last_created_purchase_supplier.inner_text()
+    purchase_row = purchase_order_history_page.get_purchase_by_reference(test_context.new_purchase.reference)
+
+    actual_reference = purchase_row.reference
+    actual_type = purchase_row.type
+    actual_supplier = purchase_row.supplier
     expected_total = "{:.2f}".format(
         sum(product.cost * product.quantity for product in test_context.new_purchase.products))
 
-    actual_total = purchase_order_history_page.last_created_purchase_total.inner_text()[1:]
-    actual_purchase_date = purchase_order_history_page.last_created_purchase_purchase_date.inner_text()
-    actual_created_date = purchase_order_history_page.last_created_purchase_created_date.inner_text()[:10]
+    actual_total = purchase_row.total[1:]
+    actual_purchase_date = purchase_row.purchase_date
+    actual_created_date = purchase_row.created_date[:10]
 
     assert actual_reference == test_context.new_purchase.reference, \
         (f"Expected purchase reference {test_context.new_purchase.reference} to equal Actual: {actual_reference} on "
@@ -239,11 +238,14 @@ def validate_new_purchase_order_created(dashboard_page, purchase_order_history_p
 def validate_new_purchase_order_saved_as_draft(dashboard_page, draft_purchase_orders_page, test_context):
     dashboard_page.draft_purchase_orders_side_menu_button.click()
 
-    actual_reference = draft_purchase_orders_page.last_saved_draft_purchase_reference.inner_text()
-    actual_supplier = draft_purchase_orders_page.last_saved_draft_purchase_supplier.inner_text()
-    actual_total = draft_purchase_orders_page.last_saved_draft_purchase_total.inner_text()[1:]
-    actual_created_date = draft_purchase_orders_page.last_saved_draft_purchase_created_date.inner_text()
-    actual_saved_date = draft_purchase_orders_page.last_saved_draft_purchase_date_saved.inner_text()[:10]
+    draft_purchase_row = draft_purchase_orders_page.get_draft_purchase_by_reference(
+        test_context.new_purchase.reference)
+
+    actual_reference = draft_purchase_row.reference
+    actual_supplier = draft_purchase_row.supplier
+    actual_total = draft_purchase_row.total[1:]
+    actual_created_date = draft_purchase_row.created_date
+    actual_saved_date = draft_purchase_row.date_saved[:10]
 
     assert actual_reference == test_context.new_purchase.reference, \
         (f"Expected draft purchase reference {test_context.new_purchase.reference} to equal "
@@ -273,77 +275,51 @@ def validate_new_purchase_order_saved_as_draft(dashboard_page, draft_purchase_or
 
 @then("the same items are merged into one")
 def verify_same_items_unified(test_context, new_purchase_order_page):
+    added_items = new_purchase_order_page.get_added_items(expected_count=len(test_context.aggregated_result))
+
     for product in test_context.aggregated_result:
-        actual_quantity = new_purchase_order_page.page.locator(
-            new_purchase_order_page.ADDED_PRODUCT_BY_TITLE.format(product.name, 'quantity')).inner_text()
-        assert actual_quantity == str(product.quantity)
+        matching_items = [added_item for added_item in added_items if added_item.name == product.name]
+        assert len(matching_items) == 1, \
+            f"Expected product {product.name} to be merged into one added item, but found {len(matching_items)}."
 
-        actual_cost = new_purchase_order_page.page.locator(
-            new_purchase_order_page.ADDED_PRODUCT_BY_TITLE.format(product.name, 'cost')).inner_text()
-        assert actual_cost == str(
-            product.cost), f"The expected cost for the added item {str(product.cost)} should equal the Actual {actual_cost}."
+        added_item = matching_items[0]
 
-        actual_total = new_purchase_order_page.page.locator(
-            new_purchase_order_page.ADDED_PRODUCT_BY_TITLE.format(product.name, 'total')).inner_text()
-        assert actual_total == "{:.2f}".format(float(product.quantity) * float(product.cost))
+        assert added_item.quantity == str(product.quantity)
 
-        edit_btn = new_purchase_order_page.page.locator(
-            new_purchase_order_page.ADDED_PRODUCT_EDIT_ACTION_BY_TITLE.format(product.name))
-        expect(edit_btn).to_be_visible()
-        expect(edit_btn).to_be_enabled()
+        assert added_item.cost == str(
+            product.cost), f"The expected cost for the added item {str(product.cost)} should equal the Actual {added_item.cost}."
 
-        delete_btn = new_purchase_order_page.page.locator(
-            new_purchase_order_page.ADDED_PRODUCT_DELETE_ACTION_BY_TITLE.format(product.name))
-        expect(delete_btn).to_be_visible()
-        expect(delete_btn).to_be_enabled()
+        assert added_item.total == "{:.2f}".format(float(product.quantity) * float(product.cost))
+
+        new_purchase_order_page.verify_added_item_actions_available(added_item)
 
 
 @then("the item values have been edited successfully")
 def verify_edited_item_values(test_context, new_purchase_order_page):
     product = test_context.products_list[len(test_context.products_list) - 1]
 
-    added_products_names = \
-        [product.locator(".product-name").inner_text() for product in
-         new_purchase_order_page.added_item_container.all()]
+    matching_items = new_purchase_order_page.get_added_items(product.name)
 
-    assert product.name in added_products_names, (
+    assert matching_items, (
         f"Expected product {product.name} to be added to items list, but it was not found!")
 
-    added_item_element = new_purchase_order_page.ADDED_PRODUCT_BY_TITLE.format(product.name, '{}')
+    added_item = matching_items[-1]
 
-    assert (new_purchase_order_page.page.locator(added_item_element.format('unit'))
-            .last
-            .inner_text()
-            == product.unit['name'])
+    assert added_item.unit == product.unit['name']
 
-    assert (new_purchase_order_page.page.locator(added_item_element.format('quantity'))
-            .last
-            .inner_text()
-            == str(product.quantity))
+    assert added_item.quantity == str(product.quantity)
 
-    actual_cost = float((new_purchase_order_page.page.locator(added_item_element.format('cost'))
-                         .last
-                         .inner_text()))
+    actual_cost = float(added_item.cost)
 
-    assert (actual_cost == float(product.cost),
-            f"The expected cost for the added item {float(product.cost)} should equal the Actual {actual_cost}.")
+    assert actual_cost == float(product.cost), \
+        f"The expected cost for the added item {float(product.cost)} should equal the Actual {actual_cost}."
 
-    total = format_to_two_decimal_string(
-        float((new_purchase_order_page.page.locator(added_item_element.format('total'))
-               .last
-               .inner_text())))
+    total = format_to_two_decimal_string(float(added_item.total))
     expected_total = format_to_two_decimal_string(product.quantity * float(product.cost))
     assert total == expected_total, f"Expected added item total {expected_total} to equal Actual {total}"
 
-    for edit_btn in new_purchase_order_page.page.locator(
-            new_purchase_order_page.ADDED_PRODUCT_EDIT_ACTION_BY_TITLE.format(product.name)).all():
-        expect(edit_btn).to_be_visible()
-        expect(edit_btn).to_be_enabled()
-
-    for delete_btn in new_purchase_order_page.page.locator(
-            new_purchase_order_page.ADDED_PRODUCT_DELETE_ACTION_BY_TITLE.format(product.name)).all():
-        expect(delete_btn).to_be_visible()
-        expect(delete_btn).to_be_enabled()
+    for matching_item in matching_items:
+        new_purchase_order_page.verify_added_item_actions_available(matching_item)
 
 
 @then("the item has been deleted successfully")
@@ -375,5 +351,5 @@ def verify_purchase_order_not_created_with_error_message(new_purchase_order_page
 def verify_no_purchase_order_without_reference_on_history_page(purchase_order_history_page, dashboard_page):
     dashboard_page.purchase_orders_history_side_menu_button.click()
 
-    for reference in purchase_order_history_page.all_purchase_references.all():
-        expect(reference, "Expected all references in Purchase History not to be empty.").not_to_be_empty()
+    for purchase_row in purchase_order_history_page.get_purchase_rows():
+        assert purchase_row.reference.strip() != "", "Expected all references in Purchase History not to be empty."
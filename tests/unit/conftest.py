@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def generate_login_state():
+    # The unit tests need neither the app nor a browser to log in to
+    yield
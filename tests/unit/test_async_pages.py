@@ -0,0 +1,24 @@
+import inspect
+
+import pytest
+
+from pages.aio.base_page import AsyncBasePage
+from pages.aio.dashboard_page import AsyncDashboardPage
+from pages.base_page import BasePage
+from pages.dashboard_page import DashboardPage
+
+
+def get_browser_methods(page_class: type) -> list[str]:
+    """
+    :return: the public methods of the page class which take the page object, i.e. those talking to the browser.
+    """
+    return [name for name, member in inspect.getmembers(page_class, inspect.isfunction)
+            if not name.startswith("_") and not isinstance(inspect.getattr_static(page_class, name), staticmethod)]
+
+
+@pytest.mark.parametrize("sync_class, async_class", [(BasePage, AsyncBasePage), (DashboardPage, AsyncDashboardPage)])
+def test_every_browser_method_has_an_async_counterpart(sync_class, async_class):
+    sync_methods = get_browser_methods(sync_class)
+
+    assert sync_methods
+    assert [name for name in sync_methods if not inspect.iscoroutinefunction(getattr(async_class, name))] == []
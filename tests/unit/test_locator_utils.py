@@ -0,0 +1,40 @@
+from benchmarks import locators
+from benchmarks.locators import find_duplicate_selectors
+from utils.locator_utils import Selector, get_locator_registry
+
+
+class BasePageStub:
+    HEADER = Selector("#header")
+
+
+class PageStub(BasePageStub):
+    ROWS = Selector("#table tbody tr", unique=False)
+    CELL = Selector("td:nth-child(1)", within=ROWS)
+    SAVE_BUTTON = Selector("//button[text()='Save']")
+    NOT_A_SELECTOR = "#plain-string"
+
+
+class DuplicatingPageStub(BasePageStub):
+    TITLE = Selector("#header")
+
+
+def test_registry_includes_the_base_class_selectors():
+    registry = get_locator_registry([PageStub])
+
+    assert set(registry) == {"BasePageStub.HEADER", "PageStub.ROWS", "PageStub.CELL", "PageStub.SAVE_BUTTON"}
+    assert registry["PageStub.CELL"].within == PageStub.ROWS
+    assert not registry["PageStub.ROWS"].unique
+    assert registry["PageStub.SAVE_BUTTON"].is_xpath
+    assert not registry["BasePageStub.HEADER"].is_xpath
+
+
+def test_page_objects_declare_no_duplicate_selectors():
+    assert find_duplicate_selectors() == []
+
+
+def test_duplicate_selectors_are_reported(monkeypatch):
+    monkeypatch.setattr(locators, "PAGE_SCREENS", {PageStub: None, DuplicatingPageStub: None})
+
+    assert find_duplicate_selectors() == [
+        "DuplicatingPageStub: #header is declared as DuplicatingPageStub.TITLE, BasePageStub.HEADER"
+    ]
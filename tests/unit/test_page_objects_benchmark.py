@@ -0,0 +1,26 @@
+from benchmarks.page_objects import find_superlinear_cases
+
+
+def case_results(name: str, medians: dict) -> list[dict]:
+    return [{"case": name, "size": size, "median_ms": median_ms} for size, median_ms in medians.items()]
+
+
+def test_linear_and_constant_cases_are_not_reported():
+    results = case_results("linear", {10: 1.0, 100: 10.0, 1000: 100.0})
+    results += case_results("constant", {10: 1.0, 1000: 1.0})
+
+    assert find_superlinear_cases(results) == []
+
+
+def test_quadratic_case_is_reported():
+    results = case_results("quadratic", {10: 1.0, 1000: 10000.0})
+
+    assert find_superlinear_cases(results) == [
+        "quadratic: time grows with size ** 2.00 (1.00 ms at 10, 10000.00 ms at 1000)"
+    ]
+
+
+def test_cases_with_a_single_size_or_no_time_are_skipped():
+    results = case_results("single", {10: 1.0}) + case_results("instant", {10: 0.0, 1000: 5.0})
+
+    assert find_superlinear_cases(results) == []
@@ -0,0 +1,50 @@
+import pytest
+import requests
+
+from tests.conftest import TEST_USER_EMAIL, TEST_USER_PASSWORD
+from utils.api_utils import create_products_via_api_calls
+from utils.auth_utils import AuthTokenCache
+from utils.stub_server import StocktakeStubServer
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    with StocktakeStubServer(users={TEST_USER_EMAIL: TEST_USER_PASSWORD}) as server:
+        monkeypatch.setenv("STOCKTAKE_API_BASE_URL", server.base_url)
+        yield server
+
+
+def test_seeded_products_reference_nested_records(stub_server, tmp_path):
+    auth_token_cache = AuthTokenCache(stub_server.base_url, TEST_USER_EMAIL, TEST_USER_PASSWORD,
+                                      tmp_path / "auth_token_cache.json")
+
+    products = create_products_via_api_calls(auth_token_cache, ["Test_product_1", "Test_product_2"])
+
+    assert [product.name for product in products] == ["Test_product_1", "Test_product_2"]
+    for product in products:
+        assert product.type["id"] == product.type_id
+        assert product.unit["name"].startswith("Test_unit_")
+        assert product.group["name"].startswith("Test_group_")
+        assert product.supplier["name"].startswith("Test_supplier_")
+
+
+def test_stub_servers_keep_their_own_token_in_a_shared_cache_file(tmp_path):
+    cache_file = tmp_path / "auth_token_cache.json"
+
+    with StocktakeStubServer() as first, StocktakeStubServer() as second:
+        first_cache = AuthTokenCache(first.base_url, TEST_USER_EMAIL, TEST_USER_PASSWORD, cache_file)
+        second_cache = AuthTokenCache(second.base_url, TEST_USER_EMAIL, TEST_USER_PASSWORD, cache_file)
+        first_token, second_token = first_cache.get_token(), second_cache.get_token()
+
+        # A new cache of the same backend reads the token instead of logging in again
+        first_cache_again = AuthTokenCache(first.base_url, TEST_USER_EMAIL, TEST_USER_PASSWORD, cache_file)
+        assert first_cache_again.get_token() == first_token
+        assert list(first.tokens) == [first_token]
+        assert list(second.tokens) == [second_token]
+
+
+@pytest.mark.parametrize("body", [[{"name": "Test_type_1"}], "Test_type_1", 1])
+def test_non_object_json_body_is_rejected(stub_server, body):
+    response = requests.post(f"{stub_server.base_url}/items/product-types", json=body)
+
+    assert response.status_code == 400, response.text
@@ -0,0 +1,14 @@
+from utils.timing_utils import percentile
+
+
+def test_percentile_of_no_values_is_zero():
+    assert percentile([], 95) == 0.0
+
+
+def test_percentile_uses_the_nearest_rank():
+    values = [5.0, 1.0, 4.0, 2.0, 3.0]
+
+    assert percentile(values, 0) == 1.0
+    assert percentile(values, 50) == 3.0
+    assert percentile(values, 90) == 5.0
+    assert percentile(values, 100) == 5.0
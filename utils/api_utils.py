@@ -1,11 +1,22 @@
 import logging
+import os
 import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date
 
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from modules.product import Product
 from tests.conftest import BASE_URL
+from utils.auth_utils import AuthTokenCache
+from utils.trace_utils import trace_span
 
 CREATE_SUPPLIER_ENDPOINT = "/items/suppliers"
 CREATE_TYPE_ENDPOINT = "/items/product-types"
@@ -14,43 +25,161 @@ CREATE_GROUP_ENDPOINT = "/items/product-groups"
 CREATE_PRODUCT_ENDPOINT = "/items/products"
 CREATE_PURCHASE_ENDPOINT = "/items/purchases"
 
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+CALL_TIMINGS_LIMIT = 1000
+SEED_MAX_WORKERS = int(os.getenv("STOCKTAKE_SEED_WORKERS", 8))
 
-def create_new_supplier_via_api_call(auth_headers, payload: dict = None) -> Response:
+
+@dataclass
+class ApiCallTiming:
+    method: str = None
+    endpoint: str = None
+    status_code: int = None
+    duration: float = None
+
+
+class ApiClient:
+    """
+    HTTP client for the Stocktake API holding a persistent keep-alive session with a sized connection pool,
+    retries with exponential backoff, and per-call timing of the latest calls.
+
+    Every request is retried when the connection cannot be established, since nothing reached the API yet. Read
+    errors and 5xx responses are only retried for idempotent methods: the API may already have committed a POST
+    it failed to answer, and sending it again would create duplicate products, suppliers or purchases.
+    """
+
+    def __init__(self, base_url: str = BASE_URL, pool_size: int = 10, retries: int = 3,
+                 backoff_factor: float = 0.3, timeout: float = 30.0):
+        """
+        :param base_url: the base URL every endpoint is appended to.
+        :param pool_size: maximum number of kept-alive connections to the API.
+        :param retries: number of retries on connection errors, and on read errors and 5xx responses of idempotent
+        requests.
+        :param backoff_factor: backoff factor between retries (0.3 sleeps 0.3s, 0.6s, 1.2s, ...).
+        :param timeout: seconds to wait for the API to respond.
+        """
+        self.base_url = base_url
+        self.timeout = timeout
+        self.call_timings: deque[ApiCallTiming] = deque(maxlen=CALL_TIMINGS_LIMIT)
+
+        # The default allowed methods leave out POST, which is then only retried on connection errors
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def request(self, method: str, endpoint: str, **kwargs) -> Response:
+        """
+        Sends a request to the API endpoint and records how long it took, retries included. Only the timings of the
+        latest CALL_TIMINGS_LIMIT calls are kept.
+
+        :param method: the HTTP method.
+        :param endpoint: the endpoint path, appended to the base URL.
+        :param kwargs: keyword arguments passed to requests.Session.request().
+        :return: the response.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+
+        start = time.perf_counter()
+        with trace_span(f"{method} {endpoint}", "api"):
+            response = self.session.request(method, f"{self.base_url}{endpoint}", **kwargs)
+        duration = time.perf_counter() - start
+
+        self.call_timings.append(ApiCallTiming(method, endpoint, response.status_code, duration))
+        logging.debug(f"{method} {endpoint} -> {response.status_code} in {duration * 1000:.1f} ms")
+
+        return response
+
+    def post(self, endpoint: str, **kwargs) -> Response:
+        return self.request("POST", endpoint, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+_api_client: ApiClient = None
+_api_client_lock = threading.Lock()
+
+
+def get_api_client() -> ApiClient:
+    """
+    Returns the API client of the current process, i.e. of the current pytest-xdist worker, creating it on first use.
+    The client can be tuned with the STOCKTAKE_API_POOL_SIZE, STOCKTAKE_API_RETRIES, STOCKTAKE_API_BACKOFF and
+    STOCKTAKE_API_TIMEOUT environment variables, and pointed at another backend (e.g. the stub API) with
+    STOCKTAKE_API_BASE_URL, in which case the client is replaced.
+    """
+    global _api_client
+
+    base_url = os.getenv("STOCKTAKE_API_BASE_URL", BASE_URL)
+
+    # The seeding helpers call it from their thread pools
+    with _api_client_lock:
+        if _api_client is None or _api_client.base_url != base_url:
+            if _api_client is not None:
+                _api_client.close()
+
+            _api_client = ApiClient(
+                base_url=base_url,
+                pool_size=int(os.getenv("STOCKTAKE_API_POOL_SIZE", 10)),
+                retries=int(os.getenv("STOCKTAKE_API_RETRIES", 3)),
+                backoff_factor=float(os.getenv("STOCKTAKE_API_BACKOFF", 0.3)),
+                timeout=float(os.getenv("STOCKTAKE_API_TIMEOUT", 30))
+            )
+
+        return _api_client
+
+
+def create_new_supplier_via_api_call(auth_headers, payload: dict = None, rng: random.Random = None) -> Response:
     if payload is None:
+        rng = rng or random
         payload = {
-            "name": f"Test_supplier_{random.randint(100000, 999999)}",
-            "email": f"supplier_email_{random.randint(100000, 999999)}@gmail.com"
+            "name": f"Test_supplier_{rng.randint(100000, 999999)}",
+            "email": f"supplier_email_{rng.randint(100000, 999999)}@gmail.com"
         }
 
     return send_post_request(auth_headers, payload, CREATE_SUPPLIER_ENDPOINT)
 
 
-def create_new_type_via_api_call(auth_headers, payload: dict = None) -> Response:
+def create_new_type_via_api_call(auth_headers, payload: dict = None, rng: random.Random = None) -> Response:
     if payload is None:
+        rng = rng or random
         payload = {
-            "name": f"Test_type_{random.randint(100000, 999999)}",
-            "description": f"Description for type {random.randint(100000, 999999)}"
+            "name": f"Test_type_{rng.randint(100000, 999999)}",
+            "description": f"Description for type {rng.randint(100000, 999999)}"
         }
 
     return send_post_request(auth_headers, payload, CREATE_TYPE_ENDPOINT)
 
 
-def create_new_unit_via_api_call(auth_headers, payload: dict = None) -> Response:
+def create_new_unit_via_api_call(auth_headers, payload: dict = None, rng: random.Random = None) -> Response:
     if payload is None:
+        rng = rng or random
         payload = {
-            "name": f"Test_unit_{random.randint(100000, 999999)}",
-            "yield_amount": float(random.randint(1, 10)),
-            "description": f"Description for unit {random.randint(100000, 999999)}"
+            "name": f"Test_unit_{rng.randint(100000, 999999)}",
+            "yield_amount": float(rng.randint(1, 10)),
+            "description": f"Description for unit {rng.randint(100000, 999999)}"
         }
 
     return send_post_request(auth_headers, payload, CREATE_UNIT_ENDPOINT)
 
 
-def create_new_group_via_api_call(auth_headers, payload: dict = None) -> Response:
+def create_new_group_via_api_call(auth_headers, payload: dict = None, rng: random.Random = None) -> Response:
     if payload is None:
+        rng = rng or random
         payload = {
-            "name": f"Test_group_{random.randint(100000, 999999)}",
-            "description": f"Description for group {random.randint(100000, 999999)}"
+            "name": f"Test_group_{rng.randint(100000, 999999)}",
+            "description": f"Description for group {rng.randint(100000, 999999)}"
         }
 
     return send_post_request(auth_headers, payload, CREATE_GROUP_ENDPOINT)
@@ -60,12 +189,75 @@ def create_new_product_via_api_call(auth_headers, payload: dict) -> Response:
     return send_post_request(auth_headers, payload, CREATE_PRODUCT_ENDPOINT)
 
 
+def create_reference_data_via_api_calls(auth_headers, rng: random.Random = None) -> dict:
+    """
+    Creates a new product type, unit, group and supplier concurrently.
+
+    :param auth_headers: Dictionary containing authentication headers.
+    :param rng: optional seeded generator of the names; each entity gets its own generator derived from it, so that
+    the names do not depend on the order the threads run in.
+    :return: Dictionary with the 'type_id', 'unit_id', 'group_id' and 'supplier_id' of the created entities.
+    """
+    factories = {
+        "type_id": create_new_type_via_api_call,
+        "unit_id": create_new_unit_via_api_call,
+        "group_id": create_new_group_via_api_call,
+        "supplier_id": create_new_supplier_via_api_call,
+    }
+
+    rngs = {key: random.Random(rng.random()) if rng else None for key in factories}
+
+    with ThreadPoolExecutor(max_workers=len(factories)) as executor:
+        futures = {key: executor.submit(factory, auth_headers, None, rngs[key]) for key, factory in factories.items()}
+        return {key: get_new_id(future.result()) for key, future in futures.items()}
+
+
+def create_products_via_api_calls(auth_headers, product_names: list[str], reference_ids: dict = None,
+                                  max_workers: int = SEED_MAX_WORKERS, rng: random.Random = None) -> list[Product]:
+    """
+    Creates a product for each of the provided names, fanning the requests out over a thread pool.
+    The reference data (type, unit, group and supplier) is created first when it is not provided.
+
+    :param auth_headers: Dictionary containing authentication headers.
+    :param product_names: The names of the products to create. Repeated names create identical products.
+    :param reference_ids: Dictionary with the 'type_id', 'unit_id', 'group_id' and 'supplier_id' to attach.
+    :param max_workers: Maximum number of concurrent requests.
+    :param rng: optional seeded generator of the reference data names.
+    :return: The created products, in the order of the provided names.
+    """
+    if reference_ids is None:
+        reference_ids = create_reference_data_via_api_calls(auth_headers, rng)
+
+    payloads = [{"name": name, **reference_ids} for name in product_names]
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(payloads)))) as executor:
+        responses = list(executor.map(lambda payload: create_new_product_via_api_call(auth_headers, payload),
+                                      payloads))
+
+    for response in responses:
+        assert response.ok, f"Product creation failed: {response.text}"
+
+    return [Product.parse_response_to_product(response) for response in responses]
+
+
+def get_new_id(response: Response):
+    """
+    Returns the id of the entity created by a POST request.
+
+    :param response: The response of the create request.
+    :return: The 'new_id' returned by the API.
+    """
+    assert response.ok, f"Create request failed: {response.text}"
+    return response.json()["new_id"]
+
+
 def send_post_request(auth_headers, payload, endpoint: str, path_params: dict = None):
     """
     Send a POST request to the specified API endpoint using data from the context.
     Optionally include dynamic path parameters.
 
-    :param auth_headers: Dictionary containing authentication headers.
+    :param auth_headers: Dictionary containing authentication headers, or the AuthTokenCache providing them, which
+    logs in again and resends the request once when the API rejects its token.
     :param payload: The request payload and where the response will be stored.
     :param endpoint: API endpoint key used to look up the base endpoint path in self.ENDPOINTS.
     :param path_params: Dictionary of optional path parameters to inject into the endpoint URL.
@@ -79,14 +271,16 @@ def send_post_request(auth_headers, payload, endpoint: str, path_params: dict =
             raise ValueError(f"Missing path parameter: {e}")
 
     logging.info(f"Sending POST request to create {base_path}.")
-    url = f"{BASE_URL}{base_path}"
 
     if payload is not None:
         for key, value in payload.items():
             if isinstance(value, date):
                 payload[key] = value.strftime("%Y-%m-%d")
 
-    response = requests.post(url, headers=auth_headers, json=payload)
+    if isinstance(auth_headers, AuthTokenCache):
+        response = get_api_client().post(base_path, auth=auth_headers, json=payload)
+    else:
+        response = get_api_client().post(base_path, headers=auth_headers, json=payload)
 
     logging.debug(
         f"""
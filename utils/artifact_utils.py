@@ -0,0 +1,322 @@
+import hashlib
+import json
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import BrowserContext
+from playwright.sync_api import Error as PlaywrightError
+
+from utils.browser_utils import get_worker_id
+
+ARTIFACT_RETENTION_MODES = ("off", "on-failure", "always")
+DEFAULT_TRACE_BUFFER_MB = 512
+DEFAULT_ARTIFACT_BUDGET_MB = 2048
+ARTIFACT_RUN_ENV_VAR = "STOCKTAKE_ARTIFACT_RUN"
+SCREENSHOT_QUALITY = 80
+
+
+def get_directory_size(directory: Path) -> int:
+    """
+    :param directory: the directory to measure.
+    :return: the total size in bytes of the files below the directory.
+    """
+    return sum(path.stat().st_size for path in Path(directory).rglob("*") if path.is_file())
+
+
+def get_artifact_run_id() -> str:
+    """
+    Returns the id of the current test run, shared by the controller and all xdist workers. The controller sets it
+    in the environment before the workers are started, so they inherit it.
+    """
+    if ARTIFACT_RUN_ENV_VAR not in os.environ:
+        os.environ[ARTIFACT_RUN_ENV_VAR] = time.strftime("%Y%m%d-%H%M%S")
+
+    return os.environ[ARTIFACT_RUN_ENV_VAR]
+
+
+def enforce_disk_budget(root_dir: Path, budget_bytes: float, protected: tuple = ()) -> list[Path]:
+    """
+    Deletes the least recently used files below the root directory until their total size fits in the budget.
+
+    :param root_dir: the directory the budget applies to.
+    :param budget_bytes: the maximum total size in bytes.
+    :param protected: files which are never deleted.
+    :return: the deleted files.
+    """
+    root_dir = Path(root_dir)
+    if not root_dir.exists():
+        return []
+
+    files = [path for path in root_dir.rglob("*") if path.is_file() and path not in protected]
+    stats = {path: path.stat() for path in files}
+    total = sum(stat.st_size for stat in stats.values())
+
+    evicted = []
+    for path in sorted(files, key=lambda file: max(stats[file].st_atime, stats[file].st_mtime)):
+        if total <= budget_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= stats[path].st_size
+        evicted.append(path)
+
+    for directory in sorted((path for path in root_dir.rglob("*") if path.is_dir()), reverse=True):
+        if not any(directory.iterdir()):
+            directory.rmdir()
+
+    return evicted
+
+
+class ArtifactWriter:
+    """
+    Pytest plugin writing the artifacts of failed (or retained) scenarios on a background thread, so that the
+    reporting hooks and fixture teardowns only enqueue work and never delay the next scenario.
+
+    Artifacts of a run go to a per-run directory shared by all xdist workers. Screenshots are de-duplicated by
+    content hash, videos and traces are moved in from where Playwright wrote them, and every worker lists its
+    artifacts in a manifest. At session end the controller merges the manifests and evicts the least recently used
+    artifacts of all runs until they fit in the disk budget.
+    """
+
+    def __init__(self, root_dir: Path, budget_mb: float = DEFAULT_ARTIFACT_BUDGET_MB):
+        """
+        :param root_dir: directory holding one sub-directory per run.
+        :param budget_mb: the total size in MB the artifacts of all runs may take.
+        """
+        self.root_dir = Path(root_dir)
+        self.run_dir = self.root_dir / get_artifact_run_id()
+        self.budget_bytes = budget_mb * 1024 * 1024
+        self.worker_id = get_worker_id()
+        self.entries: list[dict] = []
+
+        self._paths_by_hash = {}
+        self._queue = queue.Queue()
+        self._thread = None
+
+    def save_screenshot(self, scenario: str, data: bytes, extension: str = "jpeg"):
+        """
+        Queues a screenshot to be written to the run directory.
+
+        :param scenario: the name of the scenario the screenshot belongs to.
+        :param data: the encoded image, as returned by page.screenshot().
+        :param extension: the file extension matching the image type.
+        """
+        self._queue.put((self._write_screenshot, (scenario, data, extension)))
+
+    def save_file(self, kind: str, scenario: str, source: Path):
+        """
+        Queues a file written by Playwright, e.g. a video or a trace archive, to be moved to the run directory.
+        Files are renamed within the same file system, so a video still being finalized keeps being written to.
+
+        :param kind: the artifact kind, which is also the sub-directory it is moved to.
+        :param scenario: the name of the scenario the file belongs to.
+        :param source: the current path of the file.
+        """
+        self._queue.put((self._move_file, (kind, scenario, Path(source))))
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                func, args = job
+                func(*args)
+            except Exception as e:
+                logging.warning(f"[ARTIFACTS] Failed to write artifact: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write_screenshot(self, scenario: str, data: bytes, extension: str):
+        digest = hashlib.sha256(data).hexdigest()
+        duplicate_of = self._paths_by_hash.get(digest)
+
+        if duplicate_of is None:
+            path = self.run_dir / "screenshots" / f"{scenario}.{extension}"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+            self._paths_by_hash[digest] = path
+        else:
+            path = duplicate_of
+
+        self._add_entry("screenshots", scenario, path, len(data), digest, duplicate=duplicate_of is not None)
+
+    def _move_file(self, kind: str, scenario: str, source: Path):
+        path = self.run_dir / kind / f"{scenario}{source.suffix}"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(source, path)
+
+        self._add_entry(kind, scenario, path, path.stat().st_size)
+
+    def _add_entry(self, kind: str, scenario: str, path: Path, size: int, digest: str = None, duplicate=False):
+        self.entries.append({
+            "kind": kind,
+            "scenario": scenario,
+            "worker": self.worker_id,
+            "path": str(path.relative_to(self.run_dir)),
+            "size": size,
+            "sha256": digest,
+            "duplicate": duplicate,
+        })
+
+    def close(self):
+        """
+        Waits for the queued artifacts to be written and stops the background thread.
+        """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    @staticmethod
+    def _is_worker(config) -> bool:
+        return hasattr(config, "workerinput")
+
+    def pytest_sessionstart(self, session):
+        self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+        self._thread.start()
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session, exitstatus):
+        self.close()
+
+        if self.entries:
+            self.run_dir.mkdir(parents=True, exist_ok=True)
+            (self.run_dir / f"manifest-{self.worker_id}.json").write_text(json.dumps(self.entries))
+
+        if not self._is_worker(session.config):
+            self.write_manifest()
+
+    def write_manifest(self):
+        """
+        Merges the manifests of all workers into the run manifest and applies the disk budget to all runs.
+        """
+        entries = []
+        for worker_manifest in sorted(self.run_dir.glob("manifest-*.json")):
+            entries.extend(json.loads(worker_manifest.read_text()))
+            worker_manifest.unlink()
+
+        manifest_path = self.run_dir / "manifest.json"
+        evicted = enforce_disk_budget(self.root_dir, self.budget_bytes, protected=(manifest_path,))
+
+        if evicted:
+            logging.info(f"[ARTIFACTS] Evicted {len(evicted)} artifact(s) to fit in the disk budget.")
+
+        if not entries:
+            return
+
+        evicted_paths = {str(path.relative_to(self.run_dir)) for path in evicted if self.run_dir in path.parents}
+        for entry in entries:
+            entry["evicted"] = entry["path"] in evicted_paths
+
+        manifest_path.write_text(json.dumps({"run": self.run_dir.name, "artifacts": entries}, indent=2))
+        logging.info(f"[ARTIFACTS] Manifest with {len(entries)} artifact(s) saved to: {manifest_path}")
+
+
+class ScenarioTracer:
+    """
+    Records a Playwright trace chunk (screencast, DOM snapshots and network) for every scenario and exports it only
+    when the scenario has to be retained, i.e. on failure in 'on-failure' mode and always in 'always' mode.
+
+    Tracing is started once per pooled context and every scenario gets its own chunk, so a released context keeps
+    tracing for its next lease; a closed one (discarded by the pool, or recording a HAR) is forgotten. Chunks which
+    are not exported are dropped, but the snapshot resources they referenced stay in the browser's traces directory,
+    so once the directory grows over the buffer size, tracing is restarted on every context and the directory is
+    emptied.
+    """
+
+    def __init__(self, mode: str, traces_dir: Path, output_dir: Path, buffer_mb: float = DEFAULT_TRACE_BUFFER_MB):
+        """
+        :param mode: the retention mode, one of ARTIFACT_RETENTION_MODES.
+        :param traces_dir: the traces directory the browser was launched with.
+        :param output_dir: directory the exported trace archives are saved to.
+        :param buffer_mb: size in MB the traces directory may grow to before it is emptied.
+        """
+        assert mode in ARTIFACT_RETENTION_MODES, f"Unknown artifact retention mode: {mode}"
+
+        self.mode = mode
+        self.traces_dir = Path(traces_dir)
+        self.output_dir = Path(output_dir)
+        self.buffer_bytes = buffer_mb * 1024 * 1024
+        self._tracing_contexts: list[BrowserContext] = []
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def start(self, context: BrowserContext, title: str):
+        """
+        Starts the trace chunk of a scenario, starting tracing on the context first if needed.
+
+        :param context: the browser context leased for the scenario.
+        :param title: the trace title, shown in the trace viewer.
+        """
+        if not self.enabled:
+            return
+
+        if context not in self._tracing_contexts:
+            context.tracing.start(screenshots=True, snapshots=True, sources=False)
+            self._tracing_contexts.append(context)
+            context.once("close", self._forget)
+
+        context.tracing.start_chunk(title=title)
+
+    def _forget(self, context: BrowserContext):
+        if context in self._tracing_contexts:
+            self._tracing_contexts.remove(context)
+
+    def stop(self, context: BrowserContext, name: str, failed: bool) -> Path:
+        """
+        Stops the trace chunk of a scenario, exporting it when the scenario is retained.
+
+        :param context: the browser context leased for the scenario.
+        :param name: the file name of the trace archive, without extension.
+        :param failed: whether the scenario failed.
+        :return: the path of the exported trace archive, or None when the chunk was dropped.
+        """
+        if context not in self._tracing_contexts:
+            return None
+
+        trace_path = None
+        if self.mode == "always" or failed:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            trace_path = self.output_dir / f"{name}.zip"
+
+        try:
+            context.tracing.stop_chunk(path=trace_path)
+        except PlaywrightError as e:
+            logging.warning(f"Failed to stop the trace chunk of {name}: {e}")
+            self._forget(context)
+            return None
+
+        if self.traces_dir.exists() and get_directory_size(self.traces_dir) > self.buffer_bytes:
+            self._flush_traces_dir()
+
+        return trace_path
+
+    def _flush_traces_dir(self):
+        """
+        Stops tracing on every context, so that no chunk references the buffered resources, and empties the traces
+        directory. Tracing is started again when the contexts are leased next.
+        """
+        for context in self._tracing_contexts:
+            context.remove_listener("close", self._forget)
+            try:
+                context.tracing.stop()
+            except PlaywrightError as e:
+                logging.debug(f"Tracing already stopped: {e}")
+
+        self._tracing_contexts.clear()
+
+        for path in self.traces_dir.iterdir():
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink(missing_ok=True)
+
+        logging.info(f"Trace buffer exceeded {self.buffer_bytes // (1024 * 1024)} MB, emptied: {self.traces_dir}")
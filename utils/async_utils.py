@@ -0,0 +1,182 @@
+import asyncio
+import logging
+import threading
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Awaitable, Callable, Union
+
+from playwright.async_api import Browser, Page, Playwright, async_playwright
+
+from utils.browser_utils import load_storage_state
+
+AsyncScenario = Callable[[Page], Awaitable]
+
+
+class AsyncScenarioRunner:
+    """
+    Drives several independent scenarios concurrently from a single worker, each in its own browser context of one
+    async Playwright browser per engine, so that scenario throughput grows with contexts rather than with processes
+    and browsers. run_matrix() runs a scenario on every engine at the same time. An engine is only launched when a
+    scenario first runs on it.
+
+    The sync API already owns the worker's main thread, so the async browser runs on an event loop of its own
+    thread; run() and run_scenarios() block the calling thread until the submitted coroutines are done.
+
+    A browser of the sync API cannot be driven from the async one, so the runner launches its own browser process
+    next to the worker's sync browser: one more engine process per worker and engine used (some 100-200 MB of memory
+    for Chromium), and its launch time, paid by the first scenario running on the engine.
+    """
+
+    def __init__(self, browser_names: tuple = ("chromium",), concurrency: int = 4, launch_options: dict = None,
+                 context_options: dict = None):
+        """
+        :param browser_names: the Playwright browser types to launch; the first one is the default engine.
+        :param concurrency: maximum number of scenarios (and contexts) running at the same time, all engines included.
+        :param launch_options: browser name to the keyword arguments of its launch.
+        :param context_options: keyword arguments of every scenario's new_context().
+        """
+        assert concurrency > 0, "The concurrency must be positive"
+        assert browser_names, "At least one browser is required"
+
+        self.browser_names = list(browser_names)
+        self.concurrency = concurrency
+        self.launch_options = launch_options or {}
+        self.context_options = context_options or {}
+
+        self.playwright: Playwright = None
+        self._launches: dict[str, asyncio.Task] = {}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="async-scenarios", daemon=True)
+        self._semaphore: asyncio.Semaphore = None
+
+    def start(self) -> "AsyncScenarioRunner":
+        self._thread.start()
+        self.run(self._start_playwright())
+        logging.info(f"Async Playwright started for up to {self.concurrency} concurrent scenario(s) on "
+                     f"{', '.join(self.browser_names)}")
+        return self
+
+    def stop(self):
+        if self._thread.is_alive():
+            try:
+                self.run(self._close())
+            finally:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join()
+        self._loop.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    async def _start_playwright(self):
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self.playwright = await async_playwright().start()
+
+    async def get_browser(self, browser_name: str = None) -> Browser:
+        """
+        :param browser_name: the engine, the default one when None.
+        :return: the browser of the engine, launched on first use. Concurrent first uses share a single launch, and
+        the engines of run_matrix() start up concurrently.
+        """
+        browser_name = browser_name or self.browser_names[0]
+        assert browser_name in self.browser_names, f"Browser {browser_name} is not one of {self.browser_names}"
+
+        if browser_name not in self._launches:
+            logging.info(f"Launch async {browser_name}")
+            self._launches[browser_name] = asyncio.ensure_future(
+                getattr(self.playwright, browser_name).launch(**self.launch_options.get(browser_name, {})))
+
+        return await self._launches[browser_name]
+
+    async def _close(self):
+        for launch in self._launches.values():
+            if not launch.done():
+                launch.cancel()
+            elif not launch.cancelled() and launch.exception() is None:
+                await launch.result().close()
+        if self.playwright is not None:
+            await self.playwright.stop()
+
+    def run(self, coroutine: Awaitable, timeout: float = None):
+        """
+        Runs a coroutine on the runner's event loop and waits for its result.
+
+        :param coroutine: the coroutine, e.g. one using the browser of the runner.
+        :param timeout: maximum time to wait, in seconds; no limit when None.
+        :return: the coroutine's result.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result(timeout)
+
+    @asynccontextmanager
+    async def scenario_page(self, storage_state: Union[str, Path, dict] = None, browser_name: str = None):
+        """
+        Opens a page in a fresh context for one scenario, counted against the concurrency, and closes the context
+        when the scenario is done.
+
+        :param storage_state: optional storage state (path or dictionary) the context starts with.
+        :param browser_name: the engine of the context, the default one when None.
+        """
+        async with self._semaphore:
+            browser = await self.get_browser(browser_name)
+            context = await browser.new_context(storage_state=load_storage_state(storage_state),
+                                                **self.context_options)
+            try:
+                yield await context.new_page()
+            finally:
+                await context.close()
+
+    async def _run_scenario(self, scenario: AsyncScenario, storage_state, browser_name: str = None):
+        browser_name = browser_name or self.browser_names[0]
+        try:
+            async with self.scenario_page(storage_state, browser_name) as page:
+                return await scenario(page)
+        except Exception as error:
+            error.add_note(f"Scenario {getattr(scenario, '__name__', scenario)} failed on {browser_name}")
+            raise
+
+    def _run_all(self, runs: list[Awaitable], timeout: float) -> list:
+        async def run_all():
+            return await asyncio.gather(*runs, return_exceptions=True)
+
+        results = self.run(run_all(), timeout)
+
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            raise BaseExceptionGroup(f"{len(failures)} of {len(runs)} concurrent scenario(s) failed", failures)
+
+        return results
+
+    def run_scenarios(self, scenarios: list[AsyncScenario], storage_state: Union[str, Path, dict] = None,
+                      timeout: float = None, browser_name: str = None) -> list:
+        """
+        Runs the scenarios concurrently, each in its own context, and waits for all of them.
+
+        :param scenarios: coroutine functions taking the scenario's page.
+        :param storage_state: optional storage state (path or dictionary) every context starts with.
+        :param timeout: maximum time to wait for all scenarios, in seconds; no limit when None.
+        :param browser_name: the engine the scenarios run on, the default one when None.
+        :return: the scenarios' results, in the order of the scenarios.
+        :raises ExceptionGroup: holding the exception of every failed scenario, once all of them are done.
+        """
+        return self._run_all([self._run_scenario(scenario, storage_state, browser_name) for scenario in scenarios],
+                             timeout)
+
+    def run_matrix(self, scenario: AsyncScenario, storage_state: Union[str, Path, dict] = None,
+                   timeout: float = None, sessions: int = 1) -> dict[str, list]:
+        """
+        Runs a scenario on every engine of the runner at the same time, each session in its own context.
+
+        :param scenario: coroutine function taking the scenario's page.
+        :param storage_state: optional storage state (path or dictionary) every context starts with.
+        :param timeout: maximum time to wait for all engines, in seconds; no limit when None.
+        :param sessions: number of sessions the scenario runs in on each engine.
+        :return: browser name to the scenario's results on that engine, one per session.
+        :raises ExceptionGroup: holding the exception of every session the scenario failed in.
+        """
+        results = self._run_all([self._run_scenario(scenario, storage_state, browser_name)
+                                 for browser_name in self.browser_names for _ in range(sessions)], timeout)
+        return {browser_name: results[index * sessions:(index + 1) * sessions]
+                for index, browser_name in enumerate(self.browser_names)}
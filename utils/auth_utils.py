@@ -0,0 +1,239 @@
+import base64
+import json
+import logging
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+from requests import PreparedRequest, Response
+from requests.auth import AuthBase
+
+from utils.helpers import file_lock
+
+LOGIN_ENDPOINT = "/auth/login"
+ACCESS_TOKEN_STORAGE_KEY = "access_token"
+DEFAULT_TOKEN_TTL = 15 * 60
+TOKEN_REFRESH_MARGIN = 60
+
+
+def login_via_api(base_url: str, email: str, password: str) -> Response:
+    """
+    Logs in the user through the Stocktake API.
+
+    :param base_url: the base URL of the Stocktake app.
+    :param email: the user email.
+    :param password: the user password.
+    :return: the successful login response.
+    """
+    logging.info(f"Login user {email} via API call.")
+
+    response = requests.post(f"{base_url}{LOGIN_ENDPOINT}", json={"email": email, "password": password})
+    assert response.status_code == 200, f"Login failed: {response.text}"
+
+    return response
+
+
+def get_access_token(response: Response) -> str:
+    """
+    Extracts the access token from a login response.
+
+    :param response: the login response.
+    :return: the access token.
+    """
+    token = response.json().get("access_token")
+    assert token, "No access token returned"
+
+    return token
+
+
+def build_login_storage_state(base_url: str, response: Response) -> dict:
+    """
+    Builds a Playwright storage state for a logged-in user out of an API login response.
+    The access token is placed in the localStorage of the app origin and the response cookies are kept as they are,
+    so that a browser context created with the storage state starts already signed in.
+
+    :param base_url: the base URL of the Stocktake app.
+    :param response: the login response.
+    :return: the storage state dictionary.
+    """
+    host = urlparse(base_url).hostname
+
+    cookies = [
+        {
+            "name": cookie.name,
+            "value": cookie.value,
+            "domain": cookie.domain or host,
+            "path": cookie.path or "/",
+            "expires": float(cookie.expires) if cookie.expires else -1,
+            "httpOnly": cookie.has_nonstandard_attr("HttpOnly"),
+            "secure": cookie.secure,
+            "sameSite": "Lax",
+        }
+        for cookie in response.cookies
+    ]
+
+    return {
+        "cookies": cookies,
+        "origins": [
+            {
+                "origin": base_url,
+                "localStorage": [{"name": ACCESS_TOKEN_STORAGE_KEY, "value": get_access_token(response)}],
+            }
+        ],
+    }
+
+
+def get_token_expiry(response: Response, default_ttl: float = DEFAULT_TOKEN_TTL) -> float:
+    """
+    Resolves the expiry time of the access token from a login response. The 'expires_in' field is used when returned,
+    otherwise the 'exp' claim of the JWT payload, falling back to the default TTL for opaque tokens.
+
+    :param response: the login response.
+    :param default_ttl: lifetime in seconds assumed when the expiry cannot be resolved.
+    :return: the expiry as a UNIX timestamp.
+    """
+    data = response.json()
+    if data.get("expires_in"):
+        return time.time() + float(data["expires_in"])
+
+    try:
+        payload = get_access_token(response).split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, ValueError, KeyError, TypeError):
+        return time.time() + default_ttl
+
+
+class AuthTokenCache(AuthBase):
+    """
+    Expiry-aware cache of the API access token, shared between pytest-xdist workers through a lock-protected file.
+
+    Only one worker logs in; the rest read the token from the cache file. The file holds one entry per base URL and
+    user, so that caches of different backends (e.g. the stub API of every worker) can share it. The token is
+    refreshed proactively once it is within the refresh margin of its expiry. Used as the 'auth' of a request, a token
+    the API rejects with 401 (e.g. revoked by a backend restart) is invalidated and the request is sent once more with
+    a new token.
+    """
+
+    def __init__(self, base_url: str, email: str, password: str, cache_file: Path,
+                 refresh_margin: float = TOKEN_REFRESH_MARGIN, default_ttl: float = DEFAULT_TOKEN_TTL):
+        """
+        :param base_url: the base URL of the Stocktake app.
+        :param email: the user email.
+        :param password: the user password.
+        :param cache_file: JSON file, visible to all workers, where the token is shared.
+        :param refresh_margin: seconds before expiry at which the token is refreshed.
+        :param default_ttl: token lifetime assumed when the login response does not reveal it.
+        """
+        self.base_url = base_url
+        self.email = email
+        self.password = password
+        self.cache_file = Path(cache_file)
+        self.lock_file = self.cache_file.with_suffix(".lock")
+        self.refresh_margin = refresh_margin
+        self.default_ttl = default_ttl
+
+        self._token = None
+        self._expires_at = 0.0
+
+    def get_token(self) -> str:
+        """
+        Returns a valid access token, logging in only when neither this worker nor the cache file holds a fresh one.
+
+        :return: the access token.
+        """
+        if self._is_fresh(self._expires_at):
+            return self._token
+
+        with file_lock(self.lock_file):
+            cached = self._read_cache_file().get(self._cache_key())
+
+            if cached and self._is_fresh(cached["expires_at"]):
+                self._token, self._expires_at = cached["token"], cached["expires_at"]
+            else:
+                response = login_via_api(self.base_url, self.email, self.password)
+                self._token = get_access_token(response)
+                self._expires_at = get_token_expiry(response, self.default_ttl)
+                self._write_cache_entry({"token": self._token, "expires_at": self._expires_at})
+
+        return self._token
+
+    def headers(self) -> dict:
+        """
+        :return: the authorization headers carrying a valid access token.
+        """
+        return {"Authorization": f"Bearer {self.get_token()}"}
+
+    def __call__(self, request: PreparedRequest) -> PreparedRequest:
+        request.headers["Authorization"] = f"Bearer {self.get_token()}"
+        request.register_hook("response", self._retry_unauthorized)
+        return request
+
+    def _retry_unauthorized(self, response: Response, **kwargs) -> Response:
+        if response.status_code != 401:
+            return response
+
+        rejected_token = response.request.headers["Authorization"].removeprefix("Bearer ")
+        logging.info(f"Cached access token rejected by {response.url}, logging in again.")
+        self.invalidate(rejected_token)
+
+        # Release the connection of the rejected response before sending the request again on it
+        response.content
+        response.close()
+
+        retry = response.request.copy()
+        retry.deregister_hook("response", self._retry_unauthorized)
+        retry.headers["Authorization"] = f"Bearer {self.get_token()}"
+
+        retried_response = response.connection.send(retry, **kwargs)
+        retried_response.history.append(response)
+        retried_response.request = retry
+
+        return retried_response
+
+    def invalidate(self, token: str = None):
+        """
+        Drops the cached token, so that the next get_token() call logs in again.
+
+        :param token: the rejected token; the cache entry is only cleared while it still holds this token, so that a
+        token another worker has already renewed is kept. The cache entry is always cleared when None.
+        """
+        if token is None or token == self._token:
+            self._token, self._expires_at = None, 0.0
+
+        with file_lock(self.lock_file):
+            cached = self._read_cache_file().get(self._cache_key())
+            if cached and (token is None or cached["token"] == token):
+                self._write_cache_entry(None)
+
+    def _cache_key(self) -> str:
+        return f"{self.base_url}|{self.email}"
+
+    def _is_fresh(self, expires_at: float) -> bool:
+        return expires_at - time.time() > self.refresh_margin
+
+    def _read_cache_file(self) -> dict:
+        """
+        :return: cache key to the cached token and its expiry, empty when the file is missing or unreadable.
+        """
+        try:
+            entries = json.loads(self.cache_file.read_text())
+        except (FileNotFoundError, ValueError):
+            return {}
+
+        return entries if isinstance(entries, dict) else {}
+
+    def _write_cache_entry(self, entry: dict = None):
+        """
+        Replaces the entry of this cache in the file, keeping the entries of the others. Called with the lock held.
+
+        :param entry: the token and its expiry, or None to drop the entry.
+        """
+        entries = self._read_cache_file()
+        if entry is None:
+            entries.pop(self._cache_key(), None)
+        else:
+            entries[self._cache_key()] = entry
+
+        self.cache_file.write_text(json.dumps(entries))
@@ -0,0 +1,261 @@
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Union
+
+from playwright.sync_api import Browser, BrowserContext, Page
+from playwright.sync_api import Error as PlaywrightError
+
+BROWSER_NAMES = ("chromium", "firefox", "webkit")
+STORAGE_SEED_PATH = "/__context_pool_seed__"
+WEB_STORAGE_SEED_SCRIPT = """
+entries => {
+    window.localStorage.clear();
+    window.sessionStorage.clear();
+    for (const {name, value} of entries) {
+        window.localStorage.setItem(name, value);
+    }
+}
+"""
+FAST_UI_STYLESHEET = """
+*, *::before, *::after {
+    transition-duration: 0s !important;
+    transition-delay: 0s !important;
+    animation-duration: 0s !important;
+    animation-delay: 0s !important;
+    animation-iteration-count: 1 !important;
+    scroll-behavior: auto !important;
+    caret-color: transparent !important;
+}
+"""
+FAST_UI_INIT_SCRIPT = """
+(stylesheet => {
+    const install = () => {
+        if (document.getElementById('__fast_ui__')) return;
+        const style = document.createElement('style');
+        style.id = '__fast_ui__';
+        style.textContent = stylesheet;
+        (document.head || document.documentElement).appendChild(style);
+    };
+    if (document.documentElement) install();
+    document.addEventListener('DOMContentLoaded', () => {
+        install();
+        if (window.jQuery) window.jQuery.fx.off = true;
+    });
+})(%s);
+""" % json.dumps(FAST_UI_STYLESHEET)
+
+
+def get_worker_id() -> str:
+    """
+    Returns the id of the current pytest-xdist worker ('gw0', 'gw1', ...) or 'master' when running without xdist.
+    """
+    return os.getenv("PYTEST_XDIST_WORKER", "master")
+
+
+def parse_browser_names(value: str) -> list[str]:
+    """
+    Parses a comma-separated list of browser engines, e.g. 'chromium,firefox'.
+
+    :param value: the browser names, separated by commas.
+    :return: the distinct browser names, in the given order.
+    """
+    browser_names = list(dict.fromkeys(name.strip().lower() for name in value.split(",") if name.strip()))
+    unknown = [name for name in browser_names if name not in BROWSER_NAMES]
+    if not browser_names or unknown:
+        raise ValueError(f"Expected browsers among {', '.join(BROWSER_NAMES)}, got: {value!r}")
+
+    return browser_names
+
+
+def get_launch_options(browser_name: str, headless: bool, **launch_options) -> dict:
+    """
+    :param browser_name: the browser engine.
+    :param headless: whether to run the browser headless.
+    :param launch_options: further keyword arguments of the launch.
+    :return: the launch keyword arguments for the engine; the window is only maximized on Chromium, the other
+    engines do not accept the switch.
+    """
+    if browser_name == "chromium":
+        launch_options.setdefault("args", ["--start-maximized"])
+
+    return {"headless": headless, **launch_options}
+
+
+def load_storage_state(storage_state: Union[str, Path, dict, None]) -> dict:
+    """
+    Loads a Playwright storage state from a file path or returns the provided dictionary as is.
+
+    :param storage_state: path to a storage state JSON file, a storage state dictionary or None.
+    :return: the storage state dictionary (empty cookies and origins when None is provided).
+    """
+    if storage_state is None:
+        return {"cookies": [], "origins": []}
+
+    if isinstance(storage_state, dict):
+        return storage_state
+
+    return json.loads(Path(storage_state).read_text())
+
+
+def enable_fast_ui(page: Page):
+    """
+    Switches off CSS transitions and animations (and jQuery effects) in every document the page loads, and emulates
+    'prefers-reduced-motion', so that elements are stable as soon as they are shown and actionability checks pass
+    without waiting for them to animate in. The page must not have navigated yet.
+
+    Applied to the page rather than to its context, because pooled contexts outlive the scenario and their init
+    scripts cannot be removed.
+
+    :param page: the newly created page.
+    """
+    page.emulate_media(reduced_motion="reduce")
+    page.add_init_script(FAST_UI_INIT_SCRIPT)
+
+
+class BrowserContextPool:
+    """
+    Pool of pre-warmed browser contexts owned by a single pytest-xdist worker.
+
+    Contexts are handed out as leases with acquire() and returned with release(). Instead of being closed, a released
+    context is reset - its pages are closed and its cookies, permissions and routes are cleared - and the web storage
+    of the known origins is scrubbed the next time the context is leased.
+
+    A worker runs one scenario at a time, so a single context covers the usual case; a larger pool only pays off when
+    a scenario leases several contexts at once (e.g. two users). Contexts created beyond the size are closed on
+    release rather than kept idle.
+    """
+
+    def __init__(self, browser: Browser, size: int = 1, origins: list[str] = None, **context_options):
+        """
+        :param browser: the browser the contexts are created in.
+        :param size: number of contexts created upfront.
+        :param origins: origins whose localStorage and sessionStorage are cleared between leases.
+        :param context_options: keyword arguments passed to browser.new_context() for every pooled context.
+        """
+        self.browser = browser
+        self.size = size
+        self.origins = list(origins or [])
+        self.context_options = context_options
+        self.worker_id = get_worker_id()
+
+        self._idle: list[BrowserContext] = []
+        self._leased: list[BrowserContext] = []
+        self._dirty: list[BrowserContext] = []
+
+        for _ in range(size):
+            self._idle.append(self._new_context())
+
+        logging.info(f"[{self.worker_id}] Browser context pool pre-warmed with {size} context(s).")
+
+    def acquire(self, storage_state: Union[str, Path, dict] = None) -> BrowserContext:
+        """
+        Leases a context from the pool, creating a new one when all pooled contexts are in use.
+
+        :param storage_state: optional storage state (path or dictionary) applied to the leased context.
+        :return: the leased browser context.
+        """
+        context = self._idle.pop() if self._idle else self._new_context()
+        self._leased.append(context)
+
+        state = load_storage_state(storage_state)
+
+        if state["cookies"]:
+            context.add_cookies(state["cookies"])
+
+        origins_to_seed = {origin: [] for origin in self.origins} if context in self._dirty else {}
+        for origin_state in state["origins"]:
+            origins_to_seed[origin_state["origin"]] = origin_state.get("localStorage", [])
+
+        if origins_to_seed:
+            self._seed_web_storage(context, origins_to_seed)
+
+        return context
+
+    def release(self, context: BrowserContext):
+        """
+        Returns a leased context to the pool. Contexts which cannot be reset are closed and replaced by new ones, and
+        contexts beyond the pool size are closed.
+
+        :param context: the previously leased browser context.
+        """
+        self._leased.remove(context)
+
+        if len(self._idle) >= self.size:
+            self._discard(context)
+            return
+
+        try:
+            self.reset(context)
+        except PlaywrightError as e:
+            logging.warning(f"[{self.worker_id}] Discarding browser context which could not be reset: {e}")
+            self._discard(context)
+            context = self._new_context()
+        else:
+            if context not in self._dirty:
+                self._dirty.append(context)
+
+        self._idle.append(context)
+
+    @staticmethod
+    def reset(context: BrowserContext):
+        """
+        Closes all pages of the context and clears its cookies, permissions and routes.
+
+        :param context: the browser context to reset.
+        """
+        for page in context.pages:
+            page.close()
+
+        context.clear_cookies()
+        context.clear_permissions()
+        context.unroute_all(behavior="ignoreErrors")
+
+    def close(self):
+        """
+        Closes every context owned by the pool.
+        """
+        for context in self._idle + self._leased:
+            self._close_context(context)
+
+        self._idle.clear()
+        self._leased.clear()
+        self._dirty.clear()
+
+    def _new_context(self) -> BrowserContext:
+        return self.browser.new_context(**self.context_options)
+
+    def _discard(self, context: BrowserContext):
+        if context in self._dirty:
+            self._dirty.remove(context)
+        self._close_context(context)
+
+    @staticmethod
+    def _close_context(context: BrowserContext):
+        try:
+            context.close()
+        except PlaywrightError as e:
+            logging.debug(f"Browser context already closed: {e}")
+
+    @staticmethod
+    def _seed_web_storage(context: BrowserContext, origins: dict[str, list[dict]]):
+        """
+        Clears localStorage and sessionStorage for each origin and populates localStorage with the provided entries.
+        The origins are opened through a fulfilled route, so no request reaches the application under test.
+
+        :param context: the browser context whose web storage is seeded.
+        :param origins: mapping of origin to a list of {'name': ..., 'value': ...} localStorage entries.
+        """
+        page: Page = context.new_page()
+        page.route(f"**{STORAGE_SEED_PATH}",
+                   lambda route: route.fulfill(status=200, content_type="text/html", body="<html></html>"))
+
+        try:
+            for origin, entries in origins.items():
+                page.goto(f"{origin.rstrip('/')}{STORAGE_SEED_PATH}")
+                page.evaluate(WEB_STORAGE_SEED_SCRIPT, entries)
+        finally:
+            page.close()
+            if page.video:
+                page.video.delete()
@@ -0,0 +1,270 @@
+import base64
+import json
+import logging
+import re
+import shutil
+import uuid
+from pathlib import Path
+from typing import Union
+
+import pytest
+from playwright.sync_api import BrowserContext, Route
+
+from utils.browser_utils import BrowserContextPool, load_storage_state
+from utils.network_utils import normalize_endpoint
+
+HAR_MODES = ("off", "record", "replay")
+HAR_SEED_FILE = "seed.txt"
+HAR_LOGIN_STATE_FILE = "login_state.json"
+# Replayed bodies are served decoded, so the recorded encoding headers no longer apply
+SKIPPED_REPLAY_HEADERS = {"content-length", "content-encoding", "transfer-encoding"}
+FEATURE_NAME_KEY = pytest.StashKey[str]()
+# Credentials are redacted from the recorded HARs, the replay does not need them
+REDACTED_HEADERS = {"authorization", "cookie", "set-cookie"}
+REDACTED_FIELDS = {"access_token", "refresh_token", "token", "password"}
+REDACTED = "REDACTED"
+
+
+def get_feature_name(item) -> str:
+    """
+    :param item: the scenario's test item.
+    :return: the file name, without extension, of the feature the scenario belongs to.
+    """
+    if FEATURE_NAME_KEY in item.stash:
+        return item.stash[FEATURE_NAME_KEY]
+
+    return item.module.__name__.rsplit(".", 1)[-1]
+
+
+def get_scenario_name(item) -> str:
+    """
+    :param item: the scenario's test item.
+    :return: the test name without its engine parameter, so that every engine of the --browsers matrix
+    records and replays the same HAR with the same seed.
+    """
+    callspec = getattr(item, "callspec", None)
+    engine = callspec.params.get("engine") if callspec else None
+    if engine is None:
+        return item.name
+
+    # The ids of the engine param are the engine names themselves
+    ids = callspec.id.split("-")
+    ids.remove(engine)
+    return f"{item.originalname}[{'-'.join(ids)}]" if ids else item.originalname
+
+
+def redact_json(value):
+    """
+    :param value: a decoded JSON value.
+    :return: the value with the credentials of REDACTED_FIELDS replaced, at any depth.
+    """
+    if isinstance(value, dict):
+        return {key: REDACTED if key in REDACTED_FIELDS else redact_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [redact_json(item) for item in value]
+    return value
+
+
+def redact_har_entry(entry: dict) -> dict:
+    """
+    Strips the credentials from a recorded HAR entry: the auth and cookie headers, the cookies, and the tokens and
+    passwords of its JSON bodies, e.g. those of the login request and response.
+
+    :param entry: the HAR entry, modified in place.
+    :return: the entry.
+    """
+    for message in (entry["request"], entry["response"]):
+        for header in message.get("headers", []):
+            if header["name"].lower() in REDACTED_HEADERS:
+                header["value"] = REDACTED
+        message["cookies"] = []
+
+    bodies = [entry["request"].get("postData"), entry["response"].get("content")]
+    for body in (body for body in bodies if body and body.get("text") and body.get("encoding") != "base64"):
+        try:
+            body["text"] = json.dumps(redact_json(json.loads(body["text"])))
+        except ValueError:
+            continue
+
+    return entry
+
+
+class HarReplayPolicy:
+    """
+    Serves the requests which route_from_har could not match exactly, typically because their URL or body carries a
+    generated name or timestamp. Requests are matched by method and endpoint (see normalize_endpoint), and repeated
+    requests get the recorded responses in the order they were recorded, entries recorded by the same scenario first.
+    """
+
+    def __init__(self, entries: list[dict], scenario: str):
+        """
+        :param entries: the HAR entries of the feature, each tagged with the '_scenario' it was recorded by.
+        :param scenario: the name of the scenario being replayed.
+        """
+        self._candidates: dict[tuple, list[dict]] = {}
+        for entry in sorted(entries, key=lambda har_entry: har_entry.get("_scenario") != scenario):
+            self._candidates.setdefault(self._key(entry["request"]["method"], entry["request"]["url"]), []).append(entry)
+
+        self._served: dict[tuple, int] = {}
+
+    @staticmethod
+    def _key(method: str, url: str) -> tuple:
+        return method, normalize_endpoint(url)
+
+    def handle(self, route: Route):
+        key = self._key(route.request.method, route.request.url)
+        candidates = self._candidates.get(key)
+        if not candidates:
+            route.fallback()
+            return
+
+        index = self._served.get(key, 0)
+        self._served[key] = index + 1
+        response = candidates[min(index, len(candidates) - 1)]["response"]
+
+        content = response.get("content", {})
+        body = content.get("text", "")
+        body = base64.b64decode(body) if content.get("encoding") == "base64" else body.encode()
+
+        route.fulfill(
+            status=response["status"],
+            headers={header["name"]: header["value"] for header in response.get("headers", [])
+                     if header["name"].lower() not in SKIPPED_REPLAY_HEADERS},
+            body=body
+        )
+
+
+class HarBackend:
+    """
+    Pytest plugin standing in for the Stocktake backend with HAR files, one per feature.
+
+    In 'record' mode every scenario runs in a fresh, unpooled context whose traffic to the app is recorded with
+    route_from_har(update=True); the HAR is written when the context is closed and, at session end, the controller
+    merges the HARs of each feature. In 'replay' mode the pooled contexts are routed to the feature HAR, and the
+    requests it cannot match exactly are served by HarReplayPolicy.
+
+    Generated names are made repeatable by a per-scenario random generator seeded from a seed stored next to the
+    HARs, and the login state is kept with the recording, so a replay needs no backend to sign in. Only the browser
+    traffic is recorded: the test data seeded through the API is not, which is why replays seed through the stub API.
+
+    The HARs are stripped of credentials, but the login state holds a live session: keep the HAR directory out of
+    version control.
+    """
+
+    def __init__(self, mode: str, har_dir: Path, base_url: str):
+        """
+        :param mode: 'record' or 'replay'.
+        :param har_dir: directory holding the feature HARs.
+        :param base_url: the base URL of the Stocktake app, whose traffic is recorded and replayed.
+        """
+        assert mode in HAR_MODES[1:], f"Unknown HAR mode: {mode}"
+
+        self.mode = mode
+        self.har_dir = Path(har_dir)
+        self.url_pattern = re.compile(rf"^{re.escape(base_url.rstrip('/'))}([/?#]|$)")
+        self.seed = None
+        self._feature_entries: dict[str, list[dict]] = {}
+
+    @property
+    def login_state_file(self) -> Path:
+        return self.har_dir / HAR_LOGIN_STATE_FILE
+
+    def feature_har(self, feature: str) -> Path:
+        return self.har_dir / f"{feature}.har"
+
+    def scenario_seed(self, item) -> str:
+        """
+        :param item: the scenario's test item.
+        :return: the seed of the scenario's random generator, identical in record and replay.
+        """
+        return f"{self.seed}:{item.parent.nodeid}::{get_scenario_name(item)}"
+
+    def new_recording_context(self, context_pool: BrowserContextPool, item,
+                              storage_state: Union[str, Path, dict] = None) -> BrowserContext:
+        """
+        Creates an unpooled context recording the scenario's traffic to the app. The HAR is only written once the
+        context is closed.
+
+        :param context_pool: the pool whose browser and context options are used.
+        :param item: the scenario's test item.
+        :param storage_state: optional storage state (path or dictionary) the context starts with.
+        :return: the recording context.
+        """
+        scenario_har = self.har_dir / get_feature_name(item) / f"{get_scenario_name(item)}.har"
+        scenario_har.parent.mkdir(parents=True, exist_ok=True)
+
+        context = context_pool.browser.new_context(storage_state=load_storage_state(storage_state),
+                                                   **context_pool.context_options)
+        context.route_from_har(scenario_har, url=self.url_pattern, update=True, update_content="embed",
+                               update_mode="minimal")
+        return context
+
+    def replay(self, context: BrowserContext, item):
+        """
+        Routes the context's traffic to the app to the HAR recorded for the scenario's feature.
+
+        :param context: the leased browser context.
+        :param item: the scenario's test item.
+        """
+        feature = get_feature_name(item)
+        har_path = self.feature_har(feature)
+        assert har_path.exists(), f"No HAR recorded for feature '{feature}': {har_path}"
+
+        if feature not in self._feature_entries:
+            self._feature_entries[feature] = json.loads(har_path.read_text())["log"]["entries"]
+
+        # Routes are matched last-registered first, so the policy only sees what the HAR router falls back on
+        context.route(self.url_pattern, HarReplayPolicy(self._feature_entries[feature], get_scenario_name(item)).handle)
+        context.route_from_har(har_path, url=self.url_pattern, not_found="fallback")
+
+    def pytest_bdd_before_scenario(self, request, feature, scenario):
+        # Runs before the steps request the scenario's context
+        request.node.stash[FEATURE_NAME_KEY] = Path(feature.filename).stem
+
+    @staticmethod
+    def _is_worker(config) -> bool:
+        return hasattr(config, "workerinput")
+
+    def pytest_configure(self, config):
+        seed_file = self.har_dir / HAR_SEED_FILE
+
+        # The controller configures before starting the workers, so they all read the seed it wrote
+        if self.mode == "record" and not self._is_worker(config):
+            self.har_dir.mkdir(parents=True, exist_ok=True)
+            seed_file.write_text(uuid.uuid4().hex)
+
+        self.seed = seed_file.read_text().strip() if seed_file.exists() else "stocktake"
+
+    def pytest_sessionstart(self, session):
+        if self.mode == "record" and not self._is_worker(session.config):
+            for stale_dir in (path for path in self.har_dir.iterdir() if path.is_dir()):
+                shutil.rmtree(stale_dir)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session, exitstatus):
+        if self.mode == "record" and not self._is_worker(session.config):
+            self.merge_feature_hars()
+
+    def merge_feature_hars(self):
+        """
+        Merges the scenario HARs of each recorded feature into the feature HAR, tagging every entry with the
+        scenario that recorded it and stripping its credentials (see redact_har_entry). The scenario HARs, which
+        still hold them, are deleted.
+        """
+        for feature_dir in sorted(path for path in self.har_dir.iterdir() if path.is_dir()):
+            merged = None
+            for scenario_har in sorted(feature_dir.glob("*.har")):
+                log = json.loads(scenario_har.read_text())["log"]
+                for entry in log["entries"]:
+                    redact_har_entry(entry)
+                    entry["_scenario"] = scenario_har.stem
+
+                if merged is None:
+                    merged = {**log, "pages": [], "entries": []}
+                merged["entries"].extend(log["entries"])
+
+            if merged is not None:
+                self.feature_har(feature_dir.name).write_text(json.dumps({"log": merged}, indent=2))
+                logging.info(f"[HAR] {len(merged['entries'])} entries recorded to: {self.feature_har(feature_dir.name)}")
+
+            shutil.rmtree(feature_dir)
@@ -1,3 +1,7 @@
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
 from typing import Union
 
 
@@ -21,3 +25,45 @@ def format_to_two_decimal_string(value: Union[str, float]) -> str:
         raise ValueError(f"Invalid input for formatting: {value!r}")
 
     return f"{numeric_value:.2f}"
+
+
+@contextmanager
+def file_lock(lock_path: Union[str, Path], timeout: float = 30.0, stale_after: float = 120.0, poll: float = 0.05):
+    """
+    Cross-process lock built on an exclusively created lock file, used to serialize work shared between
+    pytest-xdist workers.
+
+    Args:
+        lock_path (Union[str, Path]): Path of the lock file.
+        timeout (float): Seconds to wait for the lock before giving up.
+        stale_after (float): Age in seconds after which an existing lock file is considered abandoned and removed.
+        poll (float): Seconds to sleep between attempts.
+
+    Raises:
+        TimeoutError: If the lock cannot be acquired within the timeout.
+    """
+    lock_path = Path(lock_path)
+    deadline = time.monotonic() + timeout
+
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - lock_path.stat().st_mtime > stale_after:
+                    lock_path.unlink(missing_ok=True)
+                    continue
+            except FileNotFoundError:
+                continue
+
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Could not acquire lock {lock_path} within {timeout} seconds")
+            time.sleep(poll)
+
+    try:
+        os.write(fd, str(os.getpid()).encode())
+        yield
+    finally:
+        os.close(fd)
+        lock_path.unlink(missing_ok=True)
@@ -0,0 +1,46 @@
+import inspect
+
+
+class Selector(str):
+    """
+    A selector declared as a page-object constant. It is used as a plain selector string, and carries what the
+    selector audit (benchmarks/locators.py) checks it against: whether it must match a single element, and the
+    selector of the rows it is resolved within, for row-relative selectors.
+    """
+
+    def __new__(cls, selector: str, unique: bool = True, within: "Selector" = None):
+        """
+        :param selector: the Playwright selector.
+        :param unique: whether the selector is expected to match exactly one element (within one row, when scoped).
+        :param within: the selector of the rows this one is resolved within, None for a page-level selector.
+        """
+        instance = super().__new__(cls, selector)
+        instance.unique = unique
+        instance.within = within
+        return instance
+
+    @property
+    def is_xpath(self) -> bool:
+        return self.startswith(("//", "xpath=", "(//"))
+
+
+def get_page_selectors(page_class: type) -> dict[str, Selector]:
+    """
+    :param page_class: a page-object class.
+    :return: 'Class.CONSTANT' to Selector, for every selector the class declares itself (inherited ones excluded).
+    """
+    return {f"{page_class.__name__}.{name}": value for name, value in vars(page_class).items()
+            if isinstance(value, Selector)}
+
+
+def get_locator_registry(page_classes) -> dict[str, Selector]:
+    """
+    :param page_classes: the page-object classes, their base classes are included.
+    :return: 'Class.CONSTANT' to Selector, for every selector declared by the classes.
+    """
+    registry = {}
+    for page_class in page_classes:
+        for cls in inspect.getmro(page_class):
+            registry.update(get_page_selectors(cls))
+
+    return registry
@@ -0,0 +1,275 @@
+import csv
+import json
+import logging
+import re
+import sys
+from pathlib import Path
+from urllib.parse import urlparse
+
+import greenlet
+import pytest
+from playwright.sync_api import BrowserContext, Request, Response
+
+from utils.browser_utils import get_worker_id
+from utils.timing_utils import percentile
+
+PAGE_OBJECT_PACKAGE = "pages"
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+SLOWEST_REQUESTS_COUNT = 20
+ID_SEGMENT_PATTERN = re.compile(r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F-]{27})$")
+
+
+def normalize_endpoint(url: str) -> str:
+    """
+    Reduces a request URL to its endpoint: the path without the query string, with numeric and UUID path segments
+    replaced by '{id}' so that requests for different records are grouped together.
+
+    :param url: the request URL.
+    :return: the endpoint path.
+    """
+    segments = urlparse(url).path.split("/")
+    return "/".join("{id}" if ID_SEGMENT_PATTERN.match(segment) else segment for segment in segments) or "/"
+
+
+def timing_phases(timing: dict) -> dict:
+    """
+    Converts a Playwright resource timing into phase durations in milliseconds. Phases the browser did not go
+    through (e.g. DNS lookup and connect on a reused connection) are reported as 0.
+
+    :param timing: the value of request.timing, with offsets relative to 'startTime' and -1 for missing marks.
+    :return: dns, connect, tls, wait (time to first byte), receive and total durations.
+    """
+    def span(start_mark: str, end_mark: str) -> float:
+        start, end = timing.get(start_mark, -1), timing.get(end_mark, -1)
+        return round(end - start, 3) if start >= 0 and end >= start else 0.0
+
+    return {
+        "dns": span("domainLookupStart", "domainLookupEnd"),
+        "connect": span("connectStart", "connectEnd"),
+        "tls": span("secureConnectionStart", "connectEnd"),
+        "wait": span("requestStart", "responseStart"),
+        "receive": span("responseStart", "responseEnd"),
+        "total": round(max(timing.get("responseEnd", -1), 0.0), 3),
+    }
+
+
+def latency_histogram(durations: list[float], buckets: tuple = LATENCY_BUCKETS_MS) -> dict:
+    """
+    Counts the durations per latency bucket.
+
+    :param durations: durations in milliseconds.
+    :param buckets: upper bounds of the buckets in milliseconds; slower durations land in the overflow bucket.
+    :return: bucket label ('<=100ms', '>5000ms') to count, in ascending order.
+    """
+    histogram = {f"<={bound}ms": 0 for bound in buckets}
+    histogram[f">{buckets[-1]}ms"] = 0
+
+    for duration in durations:
+        bound = next((bound for bound in buckets if duration <= bound), None)
+        histogram[f"<={bound}ms" if bound is not None else f">{buckets[-1]}ms"] += 1
+
+    return histogram
+
+
+def summarize_latencies(records: list[dict]) -> list[dict]:
+    """
+    Aggregates request records per endpoint.
+
+    :param records: request records with 'method', 'endpoint', 'failed' and 'timing' keys.
+    :return: one summary row per method and endpoint, with request and failure counts, p50/p95/max total latency,
+    mean time to first byte and the latency histogram, all in milliseconds.
+    """
+    grouped = {}
+    for record in records:
+        grouped.setdefault((record["method"], record["endpoint"]), []).append(record)
+
+    summary = []
+    for (method, endpoint), endpoint_records in sorted(grouped.items()):
+        finished = [record for record in endpoint_records if not record["failed"]]
+        totals = [record["timing"]["total"] for record in finished]
+        waits = [record["timing"]["wait"] for record in finished]
+
+        summary.append({
+            "method": method,
+            "endpoint": endpoint,
+            "count": len(endpoint_records),
+            "failed": len(endpoint_records) - len(finished),
+            "p50": round(percentile(totals, 50), 3),
+            "p95": round(percentile(totals, 95), 3),
+            "max": round(max(totals, default=0.0), 3),
+            "mean_wait": round(sum(waits) / len(waits), 3) if waits else 0.0,
+            "histogram": latency_histogram(totals),
+        })
+
+    return summary
+
+
+def find_page_object_action(frame) -> str:
+    """
+    Walks up the call stack looking for the innermost page-object method.
+
+    :param frame: the frame to start from.
+    :return: 'PageClass.method', or None when the stack does not go through a page object.
+    """
+    while frame is not None:
+        owner = frame.f_locals.get("self")
+        if owner is not None and type(owner).__module__.split(".")[0] == PAGE_OBJECT_PACKAGE:
+            return f"{type(owner).__name__}.{frame.f_code.co_name}"
+        frame = frame.f_back
+
+    return None
+
+
+def get_test_code_frame():
+    """
+    Returns the frame the test code is currently executing. With the sync API, Playwright event handlers run in
+    their own greenlet while the test code is suspended inside a Playwright call, so the frame is taken from the
+    suspended root greenlet rather than from the handler's own stack.
+    """
+    root = greenlet.getcurrent()
+    while root.parent is not None:
+        root = root.parent
+
+    return root.gr_frame or sys._getframe(1)
+
+
+class NetworkObserver:
+    """
+    Pytest plugin recording every request the browser sends to the Stocktake app, with its timing phases, the
+    Gherkin step and the page-object method that triggered it. Each xdist worker dumps its records at session end
+    and the controller merges them into latency_report.json and latency_report.csv with a per-endpoint latency
+    histogram.
+
+    Browser contexts are pooled, so the observer is attached to a context when a scenario acquires it and detached
+    when the scenario releases it.
+    """
+
+    def __init__(self, base_url: str, report_dir: Path):
+        self.base_url = base_url.rstrip("/")
+        self.report_dir = Path(report_dir)
+        self.worker_id = get_worker_id()
+        self.records: list[dict] = []
+        self.current_nodeid = None
+        self.current_step = None
+        self._pending = {}
+        self._listeners = {
+            "request": self._on_request,
+            "response": self._on_response,
+            "requestfinished": self._on_request_finished,
+            "requestfailed": self._on_request_failed,
+        }
+
+    def attach(self, context: BrowserContext):
+        """
+        Starts observing the requests of a browser context.
+        """
+        for event, listener in self._listeners.items():
+            context.on(event, listener)
+
+    def detach(self, context: BrowserContext):
+        """
+        Stops observing the requests of a browser context. Requests still in flight are dropped.
+        """
+        for event, listener in self._listeners.items():
+            context.remove_listener(event, listener)
+        self._pending.clear()
+
+    def _on_request(self, request: Request):
+        if not request.url.startswith(self.base_url):
+            return
+
+        self._pending[request] = {
+            "method": request.method,
+            "endpoint": normalize_endpoint(request.url),
+            "url": request.url,
+            "resource_type": request.resource_type,
+            "nodeid": self.current_nodeid,
+            "step": self.current_step,
+            "action": find_page_object_action(get_test_code_frame()),
+            "worker": self.worker_id,
+            "status": None,
+        }
+
+    def _on_response(self, response: Response):
+        record = self._pending.get(response.request)
+        if record is not None:
+            record["status"] = response.status
+
+    def _on_request_finished(self, request: Request):
+        self._finish(request, failed=False)
+
+    def _on_request_failed(self, request: Request):
+        self._finish(request, failed=True)
+
+    def _finish(self, request: Request, failed: bool):
+        record = self._pending.pop(request, None)
+        if record is None:
+            return
+
+        record["failed"] = failed
+        record["failure"] = request.failure if failed else None
+        record["timing"] = timing_phases(request.timing)
+        self.records.append(record)
+
+    @staticmethod
+    def _is_worker(config) -> bool:
+        return hasattr(config, "workerinput")
+
+    def pytest_sessionstart(self, session):
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+
+        if not self._is_worker(session.config):
+            for stale_file in self.report_dir.glob("latency-*.json"):
+                stale_file.unlink()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        self.current_nodeid = item.nodeid
+        yield
+        self.current_nodeid = None
+
+    def pytest_bdd_before_step(self, request, feature, scenario, step, step_func):
+        self.current_step = f"{step.keyword} {step.name}"
+
+    def pytest_bdd_after_step(self, request, feature, scenario, step, step_func, step_func_args):
+        self.current_step = None
+
+    def pytest_bdd_step_error(self, request, feature, scenario, step, step_func, step_func_args, exception):
+        self.current_step = None
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session, exitstatus):
+        if self.records:
+            worker_file = self.report_dir / f"latency-{self.worker_id}.json"
+            worker_file.write_text(json.dumps(self.records))
+
+        if not self._is_worker(session.config):
+            self.write_report()
+
+    def write_report(self):
+        """
+        Merges the records dumped by all workers and writes the JSON and CSV reports.
+        """
+        records = []
+        for worker_file in sorted(self.report_dir.glob("latency-*.json")):
+            records.extend(json.loads(worker_file.read_text()))
+
+        if not records:
+            return
+
+        summary = summarize_latencies(records)
+        slowest = sorted((record for record in records if not record["failed"]),
+                         key=lambda record: record["timing"]["total"], reverse=True)[:SLOWEST_REQUESTS_COUNT]
+
+        (self.report_dir / "latency_report.json").write_text(
+            json.dumps({"summary": summary, "slowest": slowest, "records": records}, indent=2))
+
+        buckets = list(summary[0]["histogram"].keys())
+        with open(self.report_dir / "latency_report.csv", "w", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(["method", "endpoint", "count", "failed", "p50", "p95", "max", "mean_wait"] + buckets)
+            for row in summary:
+                writer.writerow([row["method"], row["endpoint"], row["count"], row["failed"], row["p50"], row["p95"],
+                                 row["max"], row["mean_wait"]] + [row["histogram"][bucket] for bucket in buckets])
+
+        logging.info(f"[LATENCY] Report with {len(records)} requests saved to: {self.report_dir}")
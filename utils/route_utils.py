@@ -0,0 +1,208 @@
+import base64
+import json
+import logging
+import re
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import BrowserContext, Response, Route
+
+from utils.browser_utils import get_worker_id
+
+RESOURCE_PROFILE_TAG_PREFIX = "resources_"
+RESOURCE_SIZES_CACHE_KEY = "stocktake/resource_sizes"
+TRANSPARENT_GIF = base64.b64decode("R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7")
+
+# Extension patterns only apply to the resource types they are meant for, so that e.g. an SVG fetched by a script
+# is still served
+IMAGE_URL_PATTERN = (r"\.(png|jpe?g|gif|webp|avif|svg|ico|bmp)(\?.*)?$", ("image",))
+FONT_URL_PATTERN = (r"\.(woff2?|ttf|otf|eot)(\?.*)?$", ("font",))
+MEDIA_URL_PATTERN = (r"\.(mp4|webm|ogg|mp3|wav)(\?.*)?$", ("media",))
+
+# Stubs keep the page from seeing network errors for the blocked resource types; the rest are aborted
+STUB_RESPONSES = {
+    "image": ("image/gif", TRANSPARENT_GIF),
+    "script": ("application/javascript", b""),
+    "stylesheet": ("text/css", b""),
+}
+
+
+@dataclass(frozen=True)
+class ResourceProfile:
+    """
+    A set of URL patterns whose requests are stubbed or aborted, each with the resource types it applies to (all
+    types when None). Patterns are regular expressions matched by the Playwright driver, so requests which match none
+    of them are not routed through Python.
+    """
+    name: str
+    url_patterns: tuple[tuple[str, tuple], ...] = ()
+
+
+def third_party_url_pattern(base_url: str) -> str:
+    """
+    :param base_url: the base URL of the Stocktake app.
+    :return: a pattern matching the URLs of every other origin.
+    """
+    return rf"^(?!{re.escape(base_url.rstrip('/'))}[/?#]|{re.escape(base_url.rstrip('/'))}$)https?://"
+
+
+def get_resource_profiles(base_url: str) -> dict[str, ResourceProfile]:
+    """
+    :param base_url: the base URL of the Stocktake app.
+    :return: the available profiles by name. 'full' loads everything, 'lean' drops images, fonts and media, and
+    'strict' also stubs every third-party request (CDN scripts and stylesheets included).
+    """
+    lean = (IMAGE_URL_PATTERN, FONT_URL_PATTERN, MEDIA_URL_PATTERN)
+
+    return {
+        "full": ResourceProfile("full"),
+        "lean": ResourceProfile("lean", lean),
+        "strict": ResourceProfile("strict", lean + ((third_party_url_pattern(base_url), None),)),
+    }
+
+
+class ResourceBlocker:
+    """
+    Pytest plugin routing the requests of every scenario's browser context through a resource profile. The profile
+    is chosen with --resource-profile and can be overridden per feature or scenario with a '@resources_<profile>'
+    tag, e.g. '@resources_full' for visual checks.
+
+    The plugin counts the stubbed and aborted requests per resource type. Blocked requests are never downloaded, so
+    the bytes saved are estimated from the sizes the same URLs had when they were last loaded by a scenario on the
+    'full' profile, the only one listening to responses in Python; the sizes are kept in the pytest cache between
+    runs. Each xdist worker dumps its counters at session end and the controller merges them.
+    """
+
+    def __init__(self, base_url: str, profile_name: str, report_dir: Path):
+        """
+        :param base_url: the base URL of the Stocktake app.
+        :param profile_name: the default profile.
+        :param report_dir: directory the counters are written to.
+        """
+        self.profiles = get_resource_profiles(base_url)
+        assert profile_name in self.profiles, f"Unknown resource profile: {profile_name}"
+
+        self.default_profile = self.profiles[profile_name]
+        self.report_dir = Path(report_dir)
+        self.worker_id = get_worker_id()
+        self.counters: dict[str, dict] = {}
+        self.known_sizes: dict[str, int] = {}
+
+        self._blockable_patterns = [re.compile(pattern) for pattern, _ in self.profiles["strict"].url_patterns]
+        self._attached = {}
+
+    def get_profile(self, node) -> ResourceProfile:
+        """
+        :param node: the scenario's test item.
+        :return: the profile selected by the closest '@resources_<profile>' tag, or the default one.
+        """
+        for marker in node.iter_markers():
+            if marker.name.startswith(RESOURCE_PROFILE_TAG_PREFIX):
+                profile_name = marker.name[len(RESOURCE_PROFILE_TAG_PREFIX):]
+                assert profile_name in self.profiles, f"Unknown resource profile tag: @{marker.name}"
+                return self.profiles[profile_name]
+
+        return self.default_profile
+
+    def attach(self, context: BrowserContext, profile: ResourceProfile):
+        """
+        Routes the requests of a browser context through the profile. Contexts loading everything are only listened
+        to, to learn the sizes of the resources the other profiles block.
+        """
+        routes = [(re.compile(pattern), partial(self._handle_route, resource_types=resource_types))
+                  for pattern, resource_types in profile.url_patterns]
+        for url, handler in routes:
+            context.route(url, handler)
+
+        if not profile.url_patterns:
+            context.on("response", self._on_response)
+        self._attached[context] = routes
+
+    def detach(self, context: BrowserContext):
+        """
+        Removes the routes and listeners added by attach().
+        """
+        routes = self._attached.pop(context, [])
+        for url, handler in routes:
+            context.unroute(url, handler)
+
+        if not routes:
+            context.remove_listener("response", self._on_response)
+
+    def _handle_route(self, route: Route, resource_types: tuple = None):
+        request = route.request
+        if resource_types is not None and request.resource_type not in resource_types:
+            route.fallback()
+            return
+
+        stub = STUB_RESPONSES.get(request.resource_type)
+
+        counter = self.counters.setdefault(request.resource_type, {"requests": 0, "bytes": 0, "unknown_size": 0})
+        counter["requests"] += 1
+        if request.url in self.known_sizes:
+            counter["bytes"] += self.known_sizes[request.url]
+        else:
+            counter["unknown_size"] += 1
+
+        if stub:
+            content_type, body = stub
+            route.fulfill(status=200, content_type=content_type, body=body)
+        else:
+            route.abort("blockedbyclient")
+
+    def _on_response(self, response: Response):
+        content_length = response.headers.get("content-length")
+        if content_length and any(pattern.search(response.url) for pattern in self._blockable_patterns):
+            self.known_sizes[response.url] = int(content_length)
+
+    @staticmethod
+    def _is_worker(config) -> bool:
+        return hasattr(config, "workerinput")
+
+    def pytest_configure(self, config):
+        if getattr(config, "cache", None) is not None:
+            self.known_sizes.update(config.cache.get(RESOURCE_SIZES_CACHE_KEY, {}))
+
+    def pytest_sessionstart(self, session):
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+
+        if not self._is_worker(session.config):
+            for stale_file in self.report_dir.glob("resource_blocking-*.json"):
+                stale_file.unlink()
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session, exitstatus):
+        if self.counters or self.known_sizes:
+            worker_file = self.report_dir / f"resource_blocking-{self.worker_id}.json"
+            worker_file.write_text(json.dumps({"counters": self.counters, "known_sizes": self.known_sizes}))
+
+        if not self._is_worker(session.config):
+            self.write_report(session.config)
+
+    def write_report(self, config):
+        """
+        Merges the counters and resource sizes dumped by all workers, logs the savings and caches the sizes.
+        """
+        counters, known_sizes = {}, {}
+        for worker_file in sorted(self.report_dir.glob("resource_blocking-*.json")):
+            data = json.loads(worker_file.read_text())
+            known_sizes.update(data["known_sizes"])
+            for resource_type, counter in data["counters"].items():
+                merged = counters.setdefault(resource_type, {"requests": 0, "bytes": 0, "unknown_size": 0})
+                for key, value in counter.items():
+                    merged[key] += value
+
+        if getattr(config, "cache", None) is not None and known_sizes:
+            config.cache.set(RESOURCE_SIZES_CACHE_KEY, known_sizes)
+
+        if not counters:
+            return
+
+        (self.report_dir / "resource_blocking.json").write_text(json.dumps(counters, indent=2))
+
+        total_requests = sum(counter["requests"] for counter in counters.values())
+        total_kb = sum(counter["bytes"] for counter in counters.values()) / 1024
+        per_profile = ", ".join(f"{name}={counter['requests']}" for name, counter in sorted(counters.items()))
+        logging.info(f"[ROUTES] Blocked {total_requests} request(s), saving at least {total_kb:.1f} KB: {per_profile}")
@@ -0,0 +1,252 @@
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+STUB_TOKEN_TTL = 15 * 60
+REFERENCE_ENDPOINTS = {
+    "/items/product-types": "type",
+    "/items/product-units": "unit",
+    "/items/product-groups": "group",
+    "/items/suppliers": "supplier",
+}
+PRODUCTS_ENDPOINT = "/items/products"
+PURCHASES_ENDPOINT = "/items/purchases"
+LOGIN_ENDPOINT = "/auth/login"
+
+
+class StocktakeStubServer:
+    """
+    In-memory stand-in for the Stocktake API, serving the login and create endpoints the test suite seeds its data
+    through. Every request can be delayed by a fixed latency plus random jitter and can fail with an injected 503,
+    so that the API client, its retries and the seeding layer can be benchmarked deterministically.
+
+    The server runs on a background thread of the current process; use run_stub_server() or
+    'python -m utils.stub_server' to run it as a separate process.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, users: dict = None, latency: float = 0.0,
+                 jitter: float = 0.0, error_rate: float = 0.0, error_endpoints: tuple = None, seed: int = None):
+        """
+        :param host: the interface to listen on.
+        :param port: the port to listen on, a free one when 0.
+        :param users: email to password of the users allowed to log in; any credentials are accepted when None.
+        :param latency: seconds every response is delayed by.
+        :param jitter: maximum random seconds added to the latency.
+        :param error_rate: probability, between 0 and 1, that a request fails with 503.
+        :param error_endpoints: endpoints errors are injected into, all but the login endpoint when None.
+        :param seed: seed of the jitter and error injection.
+        """
+        self.users = users
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_endpoints = set(error_endpoints) if error_endpoints else None
+
+        self.collections: dict[str, dict[int, dict]] = {}
+        self.tokens: dict[str, float] = {}
+        self.request_log: list[tuple[str, str, int]] = []
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self):
+        """
+        Serves requests on the calling thread until stop() is called from another thread or the process is
+        interrupted, then closes the listening socket.
+        """
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def start(self) -> "StocktakeStubServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="stocktake-stub", daemon=True)
+        self._thread.start()
+        logging.info(f"Stocktake stub API listening on {self.base_url}")
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def reset(self):
+        """
+        Drops every stored record, issued token and logged request.
+        """
+        with self._lock:
+            self.collections.clear()
+            self.tokens.clear()
+            self.request_log.clear()
+            self._next_id = 1
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def handle(self, method: str, path: str, headers, body: dict) -> tuple[int, object]:
+        """
+        Serves a request.
+
+        :param method: the HTTP method.
+        :param path: the request path, without the query string.
+        :param headers: the request headers.
+        :param body: the decoded JSON body, empty when there is none.
+        :return: the status code and the JSON-serializable response body.
+        """
+        if not isinstance(body, dict):
+            return 400, {"detail": "The JSON body must be an object"}
+
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+
+        if self.error_rate and (path in self.error_endpoints if self.error_endpoints else path != LOGIN_ENDPOINT):
+            with self._lock:
+                inject_error = self._random.random() < self.error_rate
+            if inject_error:
+                return 503, {"detail": "Injected error"}
+
+        if method == "POST" and path == LOGIN_ENDPOINT:
+            return self._login(body)
+
+        if not self._is_authorized(headers):
+            return 401, {"detail": "Not authenticated"}
+
+        if path not in (*REFERENCE_ENDPOINTS, PRODUCTS_ENDPOINT, PURCHASES_ENDPOINT):
+            return 404, {"detail": "Not Found"}
+
+        if method == "GET":
+            return 200, list(self.collections.get(path, {}).values())
+
+        if method != "POST":
+            return 405, {"detail": "Method Not Allowed"}
+
+        if path == PRODUCTS_ENDPOINT:
+            return self._create_product(body)
+
+        if path == PURCHASES_ENDPOINT:
+            if not body.get("reference"):
+                return 422, {"detail": "Field required: reference"}
+            return 201, {"new_id": self._store(path, body)["id"]}
+
+        if not body.get("name"):
+            return 422, {"detail": "Field required: name"}
+        return 201, {"new_id": self._store(path, body)["id"]}
+
+    def _login(self, body: dict) -> tuple[int, dict]:
+        email, password = body.get("email"), body.get("password")
+        if not email or not password or (self.users is not None and self.users.get(email) != password):
+            return 401, {"detail": "Invalid credentials"}
+
+        token = f"stub-{uuid.uuid4().hex}"
+        with self._lock:
+            self.tokens[token] = time.time() + STUB_TOKEN_TTL
+
+        return 200, {"access_token": token, "token_type": "bearer", "expires_in": STUB_TOKEN_TTL}
+
+    def _is_authorized(self, headers) -> bool:
+        scheme, _, token = (headers.get("Authorization") or "").partition(" ")
+        return scheme.lower() == "bearer" and self.tokens.get(token, 0) > time.time()
+
+    def _create_product(self, body: dict) -> tuple[int, dict]:
+        if not body.get("name"):
+            return 422, {"detail": "Field required: name"}
+
+        product = {"name": body["name"]}
+        for endpoint, field in REFERENCE_ENDPOINTS.items():
+            reference = self.collections.get(endpoint, {}).get(body.get(f"{field}_id"))
+            if reference is None:
+                return 422, {"detail": f"Unknown {field}_id: {body.get(f'{field}_id')}"}
+            product[f"{field}_id"] = reference["id"]
+            # The API nests the referenced record, e.g. product['unit']['name']
+            product[field] = dict(reference)
+
+        return 201, self._store(PRODUCTS_ENDPOINT, product)
+
+    def _store(self, endpoint: str, record: dict) -> dict:
+        with self._lock:
+            record = {"id": self._next_id, **record}
+            self._next_id += 1
+            self.collections.setdefault(endpoint, {})[record["id"]] = record
+
+        return record
+
+    def _handler_class(self):
+        server = self
+
+        class StubRequestHandler(BaseHTTPRequestHandler):
+            # Keep-alive, so that the pooled connections of the API client are reused as with the real backend
+            protocol_version = "HTTP/1.1"
+
+            def _serve(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    body = json.loads(self.rfile.read(length)) if length else {}
+                except ValueError:
+                    status, payload = 400, {"detail": "Invalid JSON body"}
+                else:
+                    status, payload = server.handle(self.command, urlparse(self.path).path, self.headers, body)
+
+                with server._lock:
+                    server.request_log.append((self.command, self.path, status))
+
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _serve
+
+            def log_message(self, format, *args):
+                logging.debug(f"[STUB API] {format % args}")
+
+        return StubRequestHandler
+
+
+def run_stub_server(argv: list[str] = None):
+    """
+    Runs the stub API in the foreground, e.g. 'python -m utils.stub_server --port 8001 --latency 0.05'.
+    """
+    parser = argparse.ArgumentParser(description="In-memory stand-in for the Stocktake API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds every response is delayed by")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Maximum random seconds added to the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability that a request fails with 503")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    server = StocktakeStubServer(args.host, args.port, latency=args.latency, jitter=args.jitter,
+                                 error_rate=args.error_rate, seed=args.seed)
+    logging.info(f"Stocktake stub API listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    run_stub_server()
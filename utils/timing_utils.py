@@ -0,0 +1,151 @@
+import csv
+import json
+import logging
+import math
+import time
+from pathlib import Path
+
+import pytest
+
+from utils.browser_utils import get_worker_id
+
+TIMED_FIXTURES = (
+    "browser", "context_pool", "context", "page", "auth_token_cache", "auth_headers", "shared_reference_data",
+    "reference_data",
+)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """
+    Returns the nearest-rank percentile of the values.
+
+    :param values: the measured values.
+    :param pct: the percentile, between 0 and 100.
+    :return: the percentile value, or 0.0 for no values.
+    """
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize_timings(records: list[dict]) -> list[dict]:
+    """
+    Aggregates timing records per kind and name.
+
+    :param records: timing records with 'kind', 'name' and 'duration' keys.
+    :return: one summary row per kind and name, with count, total, mean, p50, p95 and max durations in seconds.
+    """
+    grouped = {}
+    for record in records:
+        grouped.setdefault((record["kind"], record["name"]), []).append(record["duration"])
+
+    return [
+        {
+            "kind": kind,
+            "name": name,
+            "count": len(durations),
+            "total": round(sum(durations), 6),
+            "mean": round(sum(durations) / len(durations), 6),
+            "p50": round(percentile(durations, 50), 6),
+            "p95": round(percentile(durations, 95), 6),
+            "max": round(max(durations), 6),
+        }
+        for (kind, name), durations in sorted(grouped.items())
+    ]
+
+
+class TimingPlugin:
+    """
+    Pytest plugin measuring the wall time of every Gherkin step, of the fixtures listed in TIMED_FIXTURES and of
+    every scenario. Each xdist worker dumps its records at session end and the controller merges them into
+    timing_report.json and timing_report.csv with per-step p50/p95.
+    """
+
+    def __init__(self, report_dir: Path, fixture_names: tuple = TIMED_FIXTURES):
+        self.report_dir = Path(report_dir)
+        self.fixture_names = set(fixture_names)
+        self.worker_id = get_worker_id()
+        self.records: list[dict] = []
+        self._step_starts = {}
+
+    def record(self, kind: str, name: str, duration: float, nodeid: str = None):
+        self.records.append({
+            "kind": kind,
+            "name": name,
+            "nodeid": nodeid,
+            "worker": self.worker_id,
+            "duration": duration,
+        })
+
+    @staticmethod
+    def _is_worker(config) -> bool:
+        return hasattr(config, "workerinput")
+
+    def pytest_sessionstart(self, session):
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+
+        if not self._is_worker(session.config):
+            for stale_file in self.report_dir.glob("timings-*.json"):
+                stale_file.unlink()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        start = time.perf_counter()
+        yield
+        self.record("scenario", item.name, time.perf_counter() - start, item.nodeid)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        start = time.perf_counter()
+        yield
+        if fixturedef.argname in self.fixture_names:
+            self.record("fixture", fixturedef.argname, time.perf_counter() - start, request.node.nodeid)
+
+    def pytest_bdd_before_step(self, request, feature, scenario, step, step_func):
+        self._step_starts[request.node.nodeid] = time.perf_counter()
+
+    def pytest_bdd_after_step(self, request, feature, scenario, step, step_func, step_func_args):
+        self._record_step(request, step)
+
+    def pytest_bdd_step_error(self, request, feature, scenario, step, step_func, step_func_args, exception):
+        self._record_step(request, step)
+
+    def _record_step(self, request, step):
+        start = self._step_starts.pop(request.node.nodeid, None)
+        if start is not None:
+            self.record("step", f"{step.keyword} {step.name}", time.perf_counter() - start, request.node.nodeid)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session, exitstatus):
+        if self.records:
+            worker_file = self.report_dir / f"timings-{self.worker_id}.json"
+            worker_file.write_text(json.dumps(self.records))
+
+        if not self._is_worker(session.config):
+            self.write_report()
+
+    def write_report(self):
+        """
+        Merges the records dumped by all workers and writes the JSON and CSV reports.
+        """
+        records = []
+        for worker_file in sorted(self.report_dir.glob("timings-*.json")):
+            records.extend(json.loads(worker_file.read_text()))
+
+        if not records:
+            return
+
+        summary = summarize_timings(records)
+
+        (self.report_dir / "timing_report.json").write_text(
+            json.dumps({"summary": summary, "records": records}, indent=2))
+
+        with open(self.report_dir / "timing_report.csv", "w", newline="") as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=list(summary[0].keys()))
+            writer.writeheader()
+            writer.writerows(summary)
+
+        logging.info(f"[TIMING] Report with {len(records)} records saved to: {self.report_dir}")
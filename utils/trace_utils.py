@@ -0,0 +1,227 @@
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import Locator, LocatorAssertions, Page
+
+from utils.browser_utils import get_worker_id
+
+TRACED_PLAYWRIGHT_METHODS = {
+    Page: ("goto", "reload", "click", "fill", "evaluate", "wait_for_timeout", "screenshot"),
+    Locator: (
+        "click", "fill", "type", "press", "check", "hover", "select_option", "inner_text", "input_value",
+        "is_checked", "count", "all", "evaluate", "evaluate_all", "wait_for",
+    ),
+    LocatorAssertions: (
+        "to_be_visible", "to_be_enabled", "to_have_text", "to_contain_text", "to_have_value", "to_be_empty",
+        "to_be_checked",
+    ),
+}
+
+_recorder = None
+
+
+def get_trace_recorder():
+    """
+    Returns the active TraceRecorder, or None when the timeline is not being recorded.
+    """
+    return _recorder
+
+
+@contextmanager
+def trace_span(name: str, category: str, **args):
+    """
+    Records a span on the session timeline around the wrapped block. Does nothing when no recorder is active.
+
+    :param name: the span name.
+    :param category: the span category, e.g. 'step', 'fixture', 'api' or 'playwright'.
+    :param args: extra values shown with the span.
+    """
+    if _recorder is None:
+        yield
+        return
+
+    with _recorder.span(name, category, **args):
+        yield
+
+
+def worker_number(worker_id: str) -> int:
+    """
+    Maps a pytest-xdist worker id ('gw3') to a track number, with the controller ('master') on track 0.
+    """
+    return int(worker_id[2:]) + 1 if worker_id.startswith("gw") else 0
+
+
+class TraceRecorder:
+    """
+    Collects Chrome trace-event complete ('X') events for the current worker. The worker is the trace process and
+    every thread of the worker gets its own thread track, so spans nest by time on each track.
+    """
+
+    def __init__(self, worker_id: str = None):
+        self.worker_id = worker_id or get_worker_id()
+        self.pid = worker_number(self.worker_id)
+        self.events: list[dict] = []
+        self._thread_ids = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, category: str, **args):
+        start = time.time_ns() // 1000
+        try:
+            yield
+        finally:
+            self.add_span(name, category, start, time.time_ns() // 1000 - start, **args)
+
+    def add_span(self, name: str, category: str, start_us: int, duration_us: int, **args):
+        with self._lock:
+            self.events.append({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start_us,
+                "dur": duration_us,
+                "pid": self.pid,
+                "tid": self._thread_id(),
+                "args": args,
+            })
+
+    def metadata_events(self) -> list[dict]:
+        events = [{"name": "process_name", "ph": "M", "pid": self.pid, "tid": 0,
+                   "args": {"name": f"worker {self.worker_id} (pid {os.getpid()})"}}]
+        events.extend({"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid,
+                       "args": {"name": "main" if tid == 0 else f"thread {tid}"}}
+                      for tid in self._thread_ids.values())
+        return events
+
+    def _thread_id(self) -> int:
+        ident = threading.get_ident()
+        if ident not in self._thread_ids:
+            self._thread_ids[ident] = 0 if threading.current_thread() is threading.main_thread() \
+                else len(self._thread_ids) + 1
+        return self._thread_ids[ident]
+
+
+class TracePlugin:
+    """
+    Pytest plugin recording a Chrome trace-event (chrome://tracing, Perfetto) timeline of the whole session, with
+    one track per xdist worker and nested spans for scenarios, test phases, fixtures, Gherkin steps, API requests
+    and Playwright actions. Each worker dumps its events at session end and the controller merges them.
+    """
+
+    def __init__(self, timeline_path: Path):
+        self.timeline_path = Path(timeline_path)
+        self.recorder = TraceRecorder()
+        self._originals = []
+        self._session_start = None
+        self._step_starts = {}
+
+    def _worker_file(self, worker_id: str) -> Path:
+        return self.timeline_path.with_name(f"{self.timeline_path.stem}-{worker_id}.part.json")
+
+    def pytest_configure(self, config):
+        global _recorder
+        _recorder = self.recorder
+        self._instrument_playwright()
+
+    def pytest_unconfigure(self, config):
+        global _recorder
+        _recorder = None
+        for cls, method_name, original in self._originals:
+            setattr(cls, method_name, original)
+        self._originals.clear()
+
+    def pytest_sessionstart(self, session):
+        self.timeline_path.parent.mkdir(parents=True, exist_ok=True)
+        self._session_start = time.time_ns() // 1000
+
+        if not hasattr(session.config, "workerinput"):
+            for stale_file in self.timeline_path.parent.glob(f"{self.timeline_path.stem}-*.part.json"):
+                stale_file.unlink()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        with self.recorder.span(item.name, "scenario", nodeid=item.nodeid):
+            yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        with self.recorder.span("setup", "phase"):
+            yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        with self.recorder.span("call", "phase"):
+            yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        with self.recorder.span("teardown", "phase"):
+            yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        with self.recorder.span(fixturedef.argname, "fixture", scope=fixturedef.scope):
+            yield
+
+    def pytest_bdd_before_step(self, request, feature, scenario, step, step_func):
+        self._step_starts[request.node.nodeid] = time.time_ns() // 1000
+
+    def pytest_bdd_after_step(self, request, feature, scenario, step, step_func, step_func_args):
+        self._record_step(request, step, failed=False)
+
+    def pytest_bdd_step_error(self, request, feature, scenario, step, step_func, step_func_args, exception):
+        self._record_step(request, step, failed=True)
+
+    def _record_step(self, request, step, failed: bool):
+        start = self._step_starts.pop(request.node.nodeid, None)
+        if start is not None:
+            self.recorder.add_span(f"{step.keyword} {step.name}", "step", start, time.time_ns() // 1000 - start,
+                                   failed=failed)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session, exitstatus):
+        if self.recorder.events:
+            self.recorder.add_span("session", "session", self._session_start,
+                                   time.time_ns() // 1000 - self._session_start)
+            self._worker_file(self.recorder.worker_id).write_text(
+                json.dumps(self.recorder.metadata_events() + self.recorder.events))
+
+        if not hasattr(session.config, "workerinput"):
+            self.write_timeline()
+
+    def write_timeline(self):
+        """
+        Merges the events dumped by all workers into a single trace-event file.
+        """
+        events = []
+        for worker_file in sorted(self.timeline_path.parent.glob(f"{self.timeline_path.stem}-*.part.json")):
+            events.extend(json.loads(worker_file.read_text()))
+
+        if not events:
+            return
+
+        self.timeline_path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
+        logging.info(f"[TRACE] Timeline with {len(events)} events saved to: {self.timeline_path}")
+
+    def _instrument_playwright(self):
+        for cls, method_names in TRACED_PLAYWRIGHT_METHODS.items():
+            for method_name in method_names:
+                original = getattr(cls, method_name)
+                setattr(cls, method_name, self._traced(cls.__name__, method_name, original))
+                self._originals.append((cls, method_name, original))
+
+    @staticmethod
+    def _traced(class_name: str, method_name: str, original):
+        @functools.wraps(original)
+        def traced(*args, **kwargs):
+            with trace_span(f"{class_name}.{method_name}", "playwright"):
+                return original(*args, **kwargs)
+
+        return traced